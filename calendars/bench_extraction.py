@@ -0,0 +1,173 @@
+"""
+Offline benchmark for the extraction pipeline.
+
+Times every stage separately (open, find_tables, extract, day resolution,
+dedupe, parse, write) through the pipeline's profile_stage hooks over either a synthetic corpus from
+synthetic_calendars.py or an existing calendars directory:
+
+    python bench_extraction.py                       # 120 synthetic months
+    python bench_extraction.py --synthetic-months 600
+    python bench_extraction.py --pdf-root .          # the real 2024+ PDFs
+    python bench_extraction.py --entry-memory        # also bytes held per entry
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import extract_readings as er
+from memory_usage import format_bytes
+from pipeline_profiler import disable_profiling, enable_profiling
+from reading_entry import ReadingEntry
+from synthetic_calendars import generate_calendar_corpus
+
+STAGES = ["open", "find_tables", "extract", "day_resolution", "dedupe", "parse", "write"]
+
+def run_layout(pdf_jobs):
+    """Layout stage through extract_readings. Returns (source_name, year, month_num, entries) per PDF."""
+    layout_files = []
+    for pdf_job in pdf_jobs:
+        pdf_file, year, month_num, _ = pdf_job
+        file_results, _ = er.extract_pdf_entries(*pdf_job)
+        layout_files.append((pdf_file.name, year, month_num, file_results))
+    return layout_files
+
+def run_parse(layout_files):
+    er.clear_parse_caches()
+    return list(er.iter_parsed_entries(layout_files))
+
+def _retained_bytes(build):
+    """(result, bytes still allocated once build() returns) as traced by tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+def measure_entry_memory(row_lines):
+    """
+    Memory held by the parsed rows of a run (one JSON line per row) as
+    per-entry dicts, the shape the pipeline passed around before
+    ReadingEntry, and as ReadingEntry objects. Both start from freshly
+    decoded JSON, as after reading raw cells or the extraction cache, so
+    every dict value is its own object; the interned strings are allocated
+    while tracing and count towards the slotted side.
+    """
+    dict_rows, dict_bytes = _retained_bytes(lambda: [json.loads(line) for line in row_lines])
+    del dict_rows
+    entries, entry_bytes = _retained_bytes(lambda: [ReadingEntry.from_dict(json.loads(line)) for line in row_lines])
+    count = len(entries)
+    return {
+        "entries": count,
+        "dict_bytes": dict_bytes,
+        "entry_bytes": entry_bytes,
+        "dict_bytes_per_entry": dict_bytes / count if count else 0.0,
+        "entry_bytes_per_entry": entry_bytes / count if count else 0.0
+    }
+
+def run_benchmark(pdf_root, repeat=1, entry_memory=False):
+    with contextlib.redirect_stdout(io.StringIO()):
+        pdf_jobs = er.collect_pdf_jobs(pdf_root)
+
+    runs = []
+    for _ in range(repeat):
+        # The stage timings come from the pipeline's own profile_stage hooks
+        profiler = enable_profiling()
+        try:
+            layout_files = run_layout(pdf_jobs)
+            parsed = run_parse(layout_files)
+            with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(io.StringIO()):
+                er.write_output_files(Path(out_dir), parsed)
+        finally:
+            disable_profiling()
+        report = profiler.report()
+        stage_stats = report["stages"]
+        run = {
+            "wall_seconds": report["wall_seconds"],
+            "files": len(pdf_jobs),
+            "entries": len(parsed),
+            "stages": {
+                stage: {"seconds": stage_stats[stage]["seconds"], "calls": stage_stats[stage]["calls"]}
+                if stage in stage_stats else {"seconds": 0.0, "calls": 0}
+                for stage in STAGES
+            }
+        }
+        if entry_memory and not runs:
+            row_lines = [json.dumps(entry.to_dict(), ensure_ascii=False) for entry in parsed]
+            # Nothing else may keep the interned values alive, or they would not be traced
+            del parsed, layout_files
+            er.clear_parse_caches()
+            run["entry_memory"] = measure_entry_memory(row_lines)
+        runs.append(run)
+    return runs
+
+def print_report(run):
+    wall = run["wall_seconds"]
+    print(f"{run['files']} PDFs, {run['entries']} entries in {wall:.2f}s "
+          f"({run['files'] / wall:.1f} PDFs/s, {run['entries'] / wall:.0f} entries/s)")
+    print(f"  {'stage':<16}{'seconds':>10}{'share':>8}{'calls':>8}{'ms/call':>10}")
+    for stage in STAGES:
+        seconds = run["stages"][stage]["seconds"]
+        calls = run["stages"][stage]["calls"]
+        per_call = (seconds / calls * 1000) if calls else 0.0
+        print(f"  {stage:<16}{seconds:>10.3f}{seconds / wall * 100:>7.1f}%{calls:>8}{per_call:>10.2f}")
+    memory = run.get("entry_memory")
+    if memory:
+        dict_per_entry = memory["dict_bytes_per_entry"]
+        entry_per_entry = memory["entry_bytes_per_entry"]
+        reduction = (1 - entry_per_entry / dict_per_entry) * 100 if dict_per_entry else 0.0
+        print(f"  Entry memory ({memory['entries']} entries): dicts {format_bytes(memory['dict_bytes'])} "
+              f"({dict_per_entry:.0f} B/entry), ReadingEntry {format_bytes(memory['entry_bytes'])} "
+              f"({entry_per_entry:.0f} B/entry), {reduction:.1f}% less")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the calendar extraction pipeline stage by stage.")
+    parser.add_argument("--pdf-root", type=Path,
+                        help="Benchmark an existing directory of YYYY/NN Calendar YYYY Month.pdf files instead of a synthetic corpus.")
+    parser.add_argument("--synthetic-months", type=int, default=120,
+                        help="Number of synthetic months to generate when --pdf-root is not given (default: 120).")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic corpus (default: 7).")
+    parser.add_argument("--keep-corpus", type=Path,
+                        help="Generate the synthetic corpus into this directory and keep it (reused if it already has PDFs).")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of timed runs (default: 1).")
+    parser.add_argument("--json", type=Path, help="Also write the timings of every run to this JSON file.")
+    parser.add_argument("--entry-memory", action="store_true",
+                        help="Also measure the memory held per parsed entry as dicts vs ReadingEntry (first run only).")
+    args = parser.parse_args(argv)
+
+    with contextlib.ExitStack() as stack:
+        if args.pdf_root:
+            pdf_root = args.pdf_root
+        else:
+            if args.keep_corpus:
+                pdf_root = args.keep_corpus
+            else:
+                pdf_root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="synthetic_calendars_")))
+
+            if not any(pdf_root.glob("20*/*.pdf")):
+                start = time.perf_counter()
+                generate_calendar_corpus(pdf_root, months=args.synthetic_months, seed=args.seed)
+                print(f"Generated {args.synthetic_months} synthetic months in {time.perf_counter() - start:.2f}s")
+
+        runs = run_benchmark(pdf_root, args.repeat, args.entry_memory)
+
+    for run_idx, run in enumerate(runs, start=1):
+        if len(runs) > 1:
+            print(f"Run {run_idx}/{len(runs)}")
+        print_report(run)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"pdf_root": str(pdf_root), "runs": runs}, f, indent=2)
+        print(f"Saved timings to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Downloads the monthly calendar PDFs of a year.
+
+Every month (and the special announcements) is fetched on a small thread
+pool. The first URL pattern that exists wins, as in the original
+get_calendars.sh. A file that is already on disk is only downloaded again
+when the server reports a change: its ETag and Last-Modified are kept in
+YYYY/.download_state.json and sent back as If-None-Match /
+If-Modified-Since. Transient failures (connection errors, 429 and 5xx) are
+retried with backoff, and every PDF is written to a temp file that
+replaces YYYY/NN Calendar YYYY Month.pdf only once complete:
+
+    python download_calendars.py 2026
+    python download_calendars.py 2026 --base-url http://localhost:8000/docs --workers 4
+"""
+import argparse
+import calendar
+import json
+import os
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from rename_pdfs import MONTH_MAP
+
+BASE_URL_TEMPLATE = "https://files.ecatholic.com/25848/documents/{upload_year}/12"
+DOWNLOAD_STATE_FILENAME = ".download_state.json"
+ANNOUNCEMENTS_FILENAME = "Special Calendar Announcements.pdf"
+ANNOUNCEMENT_PATTERNS = ("Special Calendar Announcements.pdf", "Special Calendar Anouncements.pdf")
+
+DEFAULT_WORKERS = 6
+DEFAULT_RETRIES = 3
+DEFAULT_TIMEOUT = 30
+RETRY_BACKOFF_SECONDS = 1.0
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+CHUNK_SIZE = 64 * 1024
+PDF_MAGIC = b"%PDF"
+
+# label: shown in the log; filename: target in the year directory; patterns: source names, in order
+DownloadJob = namedtuple("DownloadJob", ["label", "filename", "patterns"])
+# status: "downloaded", "unchanged" or "missing"
+DownloadResult = namedtuple("DownloadResult", ["job", "status", "pattern", "validators", "error"])
+
+def calendar_pdf_filename(year, month):
+    month_name = calendar.month_name[month]
+    return f"{MONTH_MAP[month_name.lower()]} Calendar {year} {month_name}.pdf"
+
+def default_base_url(year):
+    # The calendars of a year are uploaded in December of the year before
+    return BASE_URL_TEMPLATE.format(upload_year=year - 1)
+
+def download_jobs(year):
+    jobs = []
+    for month in range(1, 13):
+        month_name = calendar.month_name[month]
+        jobs.append(DownloadJob(month_name, calendar_pdf_filename(year, month),
+                                (f"Calendar {year} {month_name}.pdf", f"{month_name}.pdf")))
+    jobs.append(DownloadJob("Special Announcements", ANNOUNCEMENTS_FILENAME, ANNOUNCEMENT_PATTERNS))
+    return jobs
+
+def load_download_state(year_dir):
+    try:
+        with open(Path(year_dir) / DOWNLOAD_STATE_FILENAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_download_state(year_dir, state):
+    path = Path(year_dir) / DOWNLOAD_STATE_FILENAME
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+def _write_response(response, target):
+    """
+    Streams a response into target atomically. Rejects bodies that are not
+    PDFs, and raises ConnectionError (retried by fetch) when the connection
+    closes before Content-Length bytes arrived.
+    """
+    expected_length = response.headers.get("Content-Length")
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            first_chunk = response.read(CHUNK_SIZE)
+            if not first_chunk.startswith(PDF_MAGIC):
+                raise ValueError("response is not a PDF")
+            f.write(first_chunk)
+            written = len(first_chunk)
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                written += len(chunk)
+        # urllib returns a short body without an error when the connection drops
+        if expected_length is not None and written != int(expected_length):
+            raise ConnectionError(f"incomplete response: {written} of {expected_length} bytes")
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+def fetch(url, target, validators=None, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT):
+    """
+    Conditionally downloads url into target. Returns ("downloaded", new
+    validators), ("unchanged", validators) on 304 or ("missing", None) on
+    404/410. Other failures raise once the retries are used up.
+    """
+    headers = {"User-Agent": "calendar-downloader"}
+    if validators and target.exists():
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    attempt = 0
+    while True:
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+                _write_response(response, target)
+                return "downloaded", {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return "unchanged", validators
+            if e.code in (404, 410):
+                return "missing", None
+            if e.code not in RETRYABLE_STATUSES or attempt >= retries:
+                raise
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            if attempt >= retries:
+                raise
+        time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        attempt += 1
+
+def download_job(job, base_url, year_dir, state, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT):
+    """Tries the patterns of one job in order. Never raises; failures end up in the result's error."""
+    target = Path(year_dir) / job.filename
+    previous = state.get(job.filename)
+    patterns = job.patterns
+    if previous and target.exists():
+        # Ask the URL that worked last time first, so an unchanged file costs one request
+        known = [pattern for pattern in patterns if f"{base_url}/{urllib.parse.quote(pattern)}" == previous.get("url")]
+        patterns = tuple(known) + tuple(pattern for pattern in patterns if pattern not in known)
+
+    error = None
+    for pattern in patterns:
+        url = f"{base_url}/{urllib.parse.quote(pattern)}"
+        validators = previous if previous and previous.get("url") == url else None
+        try:
+            status, new_validators = fetch(url, target, validators, retries, timeout)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            error = f"{url}: {e}"
+            continue
+        if status != "missing":
+            return DownloadResult(job, status, pattern, new_validators, None)
+    return DownloadResult(job, "missing", None, None, error)
+
+def download_year(year, output_root, base_url=None, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES,
+                  timeout=DEFAULT_TIMEOUT):
+    """Downloads every PDF of a year into output_root/YYYY. Returns the DownloadResults in month order."""
+    base_url = (base_url or default_base_url(year)).rstrip("/")
+    year_dir = Path(output_root) / str(year)
+    year_dir.mkdir(parents=True, exist_ok=True)
+    state = load_download_state(year_dir)
+
+    jobs = download_jobs(year)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(lambda job: download_job(job, base_url, year_dir, state, retries, timeout), jobs))
+
+    new_state = dict(state)
+    for result in results:
+        if result.status in ("downloaded", "unchanged") and result.validators:
+            new_state[result.job.filename] = result.validators
+    if new_state != state:
+        save_download_state(year_dir, new_state)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Download the monthly calendar PDFs of a year.")
+    parser.add_argument("year", type=int, nargs="?", default=date.today().year,
+                        help="Calendar year (default: the current year).")
+    parser.add_argument("--base-url", help="Directory URL holding the PDFs (default: the parish upload folder "
+                                           "of December of the previous year).")
+    parser.add_argument("--output-root", type=Path, default=Path(__file__).parent,
+                        help="PDFs are saved to OUTPUT_ROOT/YEAR (default: calendars/).")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent downloads (default: {DEFAULT_WORKERS}).")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"Retries of a transient failure (default: {DEFAULT_RETRIES}).")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Per-request timeout in seconds (default: {DEFAULT_TIMEOUT}).")
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url or default_base_url(args.year)
+    print(f"Targeting Year: {args.year}")
+    print(f"Source Base URL: {base_url}")
+
+    start = time.perf_counter()
+    results = download_year(args.year, args.output_root, base_url, args.workers, args.retries, args.timeout)
+    for result in results:
+        if result.status == "downloaded":
+            print(f"\033[32mSuccess: {result.job.label} (Found as '{result.pattern}')\033[0m")
+        elif result.status == "unchanged":
+            print(f"Unchanged: {result.job.label}")
+        elif result.job.filename != ANNOUNCEMENTS_FILENAME:
+            detail = f" ({result.error})" if result.error else ""
+            print(f"\033[33mWarning: Could not find file for {result.job.label} at {base_url}{detail}\033[0m")
+
+    print(f"Done in {time.perf_counter() - start:.1f}s! Files saved to {args.output_root / str(args.year)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,73 @@
 import pdfplumber
 import re
+import os
 import json
 import csv
 import calendar
-from collections import Counter
+import argparse
+import cProfile
+import contextlib
+import gc
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque, namedtuple
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date
 
+from pipeline_profiler import disable_profiling, enable_profiling, profile_stage, profile_unit
+from memory_usage import format_bytes, peak_rss_bytes, reset_peak_rss
+from scripture_refs import matins_gospel_ranges, parse_reference
+from reading_entry import ReadingEntry
+from output_diff import ChangeAwareOutput, RecordDigests, empty_diff, format_diff_summary
+from readings_db import READINGS_DB_FILENAME, ReadingsDbWriter
+from readings_binary import READINGS_BINARY_FILENAME, ReadingsBinaryWriter
+from passage_index import PASSAGE_INDEX_FILENAME, PassageIndexWriter
+from text_index import TEXT_INDEX_FILENAME, TextIndexWriter
+from ics_export import ICS_DIRNAME, UPCOMING_FILENAME, IcsExportWriter
+from readings_shards import MANIFEST_FILENAME, SHARD_BY_CHOICES, SHARDS_DIRNAME, ShardedOutputWriter
+from validate_readings import VALIDATION_BASELINE_FILENAME, ReadingValidator, format_validation_report, load_baseline
+from raw_cells import RAW_CELLS_FILENAME, RawCellsWriter, iter_raw_cells, read_raw_cells_parser_version
+from extraction_cache import (
+    DEFAULT_CACHE_DIRNAME,
+    cache_entry_path,
+    clear_cache,
+    file_content_hash,
+    load_cached_entries,
+    prune_stale_versions,
+    source_fingerprint,
+    store_cached_entries
+)
+
+# Bump whenever the regexes or the table/day-resolution logic change; it is
+# recorded in the raw cell file and is part of the extraction cache version,
+# which also follows the layout-stage source (see layout_cache_version).
+PARSER_VERSION = 2
+# Source files of the layout stage, hashed into the extraction cache version
+LAYOUT_SOURCE_FILES = ("extract_readings.py", "reading_entry.py")
+
+# Upper bound on memoized results per pure text function (see report_parse_cache_stats)
+PARSE_CACHE_SIZE = 8192
+ParseCacheInfo = namedtuple("ParseCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
 # Regex patterns matching the logic in ReadingCard.vue
 TAGS_RE = re.compile(r'<[^>]*>')
 WHITESPACE_RE = re.compile(r'\s+')
 TONE_RE = re.compile(r'Tone\s+(\d+)', re.IGNORECASE)
-MATINS_RES_RE = re.compile(r'Res\.?\s*Gospel\s+(\d+)', re.IGNORECASE)
-MATINS_TEXT_RE = re.compile(r'Matins\s+Gospel:?\s*(.+?)(?=\s*(?:Divine Liturgy|Epistle|Gospel|Following)|$)', re.IGNORECASE)
-IMPLICIT_LITURGY_RE = re.compile(r'Divine Liturgy:?\s*([^;]+);\s*([^;]+?)(?=\s*(?:Following|\.\s*[A-Z]|$))', re.IGNORECASE)
-EPISTLE_RE = re.compile(r'(?:^|[\s,;.])(?:Epistle\b|Ep\b\.?)\s*:?\s*(.+?)(?=\s*(?:Gospel|G\s*:|Following)|$)', re.IGNORECASE)
-APOSTLE_EPISTLE_RE = re.compile(r'(?:^|[\s,;.])(?:Apostle\b|Apost\.)\s+((?:[1-3]\s*)?(?:Acts|Rom|Cor|Gal|Eph|Phil|Col|Thess|Tim|Tit|Phlm|Philem|Heb|Jas|James|Pet|Jude|Rev)\.?\s*[^;]*?\d\s*:\s*\d[^;]*?)(?=\s*(?:;\s*)?(?:Gospel|G\s*:|Following)|$)', re.IGNORECASE)
-EPISTLE_BEFORE_GOSPEL_RE = re.compile(r'(?:^|[\s,;.])((?:[1-3]\s*)?(?:Acts|Rom|Cor|Gal|Eph|Phil|Col|Thess|Tim|Tit|Phlm|Philem|Heb|Jas|James|Pet|Jude|Rev)\.?\s*[^;]*?\d\s*:\s*\d[^;]*?)(?=\s*;\s*(?:Gospel|G\s*:))', re.IGNORECASE)
-GOSPEL_RE = re.compile(r'(?:^|[\s,;.])(?:Gospel|G\s*:)\s*(.+?)(?=\s*(?:Following|(?:Divine\s+)?Liturgy|Great\s+blessing\s+of\s+water|Holy\s+Day\s+of\s+Obligation|\.\s+[A-Z])|$)', re.IGNORECASE)
+# "Res, Gospel 2" (comma typo) occurs in the calendars as well as "Res. Gospel 2"
+MATINS_RES_RE = re.compile(r'Res[.,]?\s*Gospel\s+(\d+)', re.IGNORECASE)
+# An epistle reference: a book of the Apostle and a chapter:verse
+SCRIPTURE_REFERENCE_PATTERN = r'(?:[1-3]\s*)?(?:Acts|Rom|Cor|Gal|Eph|Phil|Col|Thess|Tim|Tit|Phlm|Philem|Heb|Jas|James|Pet|Jude|Rev)\.?\s*[^;]*?\d\s*:\s*\d[^;]*?'
+APOSTLE_VALUE_RE = re.compile(r'\s+(' + SCRIPTURE_REFERENCE_PATTERN + r')(?=\s*(?:;\s*)?(?:Gospel|G\s*:|Following)|$)', re.IGNORECASE)
+EPISTLE_BEFORE_GOSPEL_RE = re.compile(r'(?:^|[\s,;.])(' + SCRIPTURE_REFERENCE_PATTERN + r')(?=\s*;\s*(?:Gospel|G\s*:))', re.IGNORECASE)
 FOLLOWING_NOTES_START_RE = re.compile(
     r'\b(?:the\s+readings?\s+for\s+the\s+following\s+week|following\s+week\s+readings?|following\s+week)\b',
     re.IGNORECASE
 )
-DIVINE_LITURGY_HEADER_RE = re.compile(r'Divine Liturgy:?', re.IGNORECASE)
 FASTING_RE = re.compile(
     r'(Strict Fast and abstinence|Strict Abstinence|Common Abstinence|Strict Fast|Dispensation\s*\([^)]+\)|Dispensation|Abstinence(?:\s+from\s+[^\n.;]+(?:\s+this\s+week)?)?)',
     re.IGNORECASE
 )
-CANADA_HOLIDAY_RE = re.compile(r'\bCANADA\s*:\s*(.+?)(?=(?:\s+USA\s*:)|$)', re.IGNORECASE)
-USA_HOLIDAY_RE = re.compile(r'\bUSA\s*:\s*(.+?)(?=(?:\s+CANADA\s*:)|$)', re.IGNORECASE)
 TRAILING_REFERENCE_NOISE_RE = re.compile(
     r'(?:\s*[;,.]\s*|\s+)'
     r'(?:also\b|may\s+also\s+read\b|forefeast\b|resurrection\s+service\b|matins\s+and\b)'
@@ -39,6 +78,13 @@ TRAILING_OVERLAY_DAY_RE = re.compile(r'\s*/\s*\d{1,2}\b.*$')
 
 # Regex for detecting double feasts splittable by "Nth Sunday" pattern
 DOUBLE_FEAST_SPLIT_RE = re.compile(r'(?<=\.)\s+(?=\d+(?:st|nd|rd|th)\s+Sunday)', re.IGNORECASE)
+READING_KEYWORD_RE = re.compile(r'Epistle|Gospel|Ep\.|G\s*:', re.IGNORECASE)
+
+# Stacked cells holding two Sundays a week apart under one "23/30" header. The
+# second Sunday starts after a line holding only "/" or at its own heading line.
+STACKED_CELL_HEADER_RE = re.compile(r'\s*(\d{1,2})\s*/\s*(\d{1,2})(?=\s|$)')
+STACKED_CELL_SEPARATOR_RE = re.compile(r'^[ \t]*/[ \t]*$', re.MULTILINE)
+SUNDAY_HEADING_RE = re.compile(r'^[ \t]*\d{1,2}(?:st|nd|rd|th)\s+SUNDAY\b', re.IGNORECASE | re.MULTILINE)
 
 # Day Extraction Regexes
 ORDINAL_DAY_RE = re.compile(r'^\d{1,2}(?:st|nd|rd|th)\b', re.IGNORECASE)
@@ -59,6 +105,51 @@ Clean_PUNCT_SPACE_RE = re.compile(r'\s+([,.;:])')
 CLEAN_DOUBLE_PUNCT_RE = re.compile(r'([,.;:]){2,}')
 CLEAN_TRIM_PUNCT_RE = re.compile(r'^[\s,.;:]+|[\s,.;:]+$')
 
+# Notes cleanup regexes (mirroring the Vue logic)
+NOTES_TRIM_RE = re.compile(r'^[\s,;.]+|[\s,;.]+$')
+NOTES_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([,;.])')
+NOTES_COMMA_BEFORE_PERIOD_RE = re.compile(r'[,;]+\s*\.')
+NOTES_COMMA_AFTER_PERIOD_RE = re.compile(r'\.\s*[,;]+')
+NOTES_REPEATED_COMMA_RE = re.compile(r',,+')
+NOTES_REPEATED_PERIOD_RE = re.compile(r'\.\.+')
+
+# (kind, pattern, anchors) of the segment tokens (see scan_segment_tokens): the
+# keywords the segments of a cell text start or end at, in the order they are
+# tried at one position, with the case-folded substrings a token starts with.
+SEGMENT_TOKEN_KINDS = tuple(
+    (kind, re.compile(pattern, re.IGNORECASE), anchors) for kind, pattern, anchors in (
+        ("canada", r'\bCANADA\s*:', ("canada",)),
+        ("usa", r'\bUSA\s*:', ("usa",)),
+        ("fasting", r'Strict Fast and abstinence|Strict Abstinence|Common Abstinence|Strict Fast|Dispensation|Abstinence',
+         ("strict", "common", "dispensation", "abstinence")),
+        ("tone", r'Tone(?:\s+(\d+))?', ("tone",)),
+        ("res", r'Res[.,]?\s*Gospel(?:\s+(\d+))?', ("res",)),
+        ("matins", r'Matins\s+Gospel:?', ("matins",)),
+        ("liturgy", r'Divine Liturgy:?', ("divine liturgy",)),
+        ("apostle", r'Apostle\b|Apost\.', ("apost",)),
+        ("epistle", r'Epistle\b|Ep\b\.?', ("ep",)),
+        ("epistle_word", r'Epistle', ("epistle",)),
+        ("gospel", r'Gospel|G\s*:', ("gospel", "g:")),
+        ("following", r'Following', ("following",)),
+        ("liturgy_name", r'Liturgy', ("liturgy",)),
+        ("feast_note", r'Great\s+blessing\s+of\s+water|Holy\s+Day\s+of\s+Obligation', ("great", "holy")),
+    )
+)
+# "G :" is found from its colon
+G_COLON_RE = re.compile(r'g\s*:')
+# Joins the texts of a batch into the one text scanned for tokens
+SEGMENT_SEPARATOR = "\x00"
+EPISTLE_MARKER_KINDS = frozenset({"epistle"})
+GOSPEL_MARKER_KINDS = frozenset({"gospel", "res", "matins", "following"})
+# Characters a marker may follow (besides whitespace and the start of the text)
+MARKER_DELIMITERS = frozenset(" ,;.")
+SENTENCE_LETTER_RE = re.compile(r'[A-Z]', re.IGNORECASE)
+INNER_GOSPEL_RE = re.compile(r'Gospel', re.IGNORECASE)
+LITURGY_PREFIX_RE = re.compile(r':?\s*')
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() does not fold to them (U+212A KELVIN SIGN already lowers to "k").
+SEGMENT_CASEFOLD_PAIRS = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
+
 MOJIBAKE_REPLACEMENTS = {
     "â€“": "–",
     "â€”": "—",
@@ -91,10 +182,14 @@ def normalize_mojibake(text):
         return text
 
     normalized = str(text)
+    # Every broken sequence starts with one of these two characters
+    if "â" not in normalized and "Â" not in normalized:
+        return normalized
     for broken, fixed in MOJIBAKE_REPLACEMENTS.items():
         normalized = normalized.replace(broken, fixed)
     return normalized
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE, typed=True)
 def normalize_scripture_reference(value):
     text = clean_string(value)
     if not text:
@@ -116,128 +211,658 @@ def normalize_scripture_reference(value):
     text = WHITESPACE_RE.sub(' ', text).strip()
     return clean_string(text)
 
-def extract_country_holidays(text):
-    canada_holiday = None
-    usa_holiday = None
-    work_text = text
-
-    canada_match = CANADA_HOLIDAY_RE.search(work_text)
-    if canada_match:
-        canada_holiday = clean_string(canada_match.group(1))
-        work_text = work_text.replace(canada_match.group(0), ' ')
+class SegmentToken:
+    """One keyword of a cell text found by scan_segment_tokens (see SEGMENT_TOKEN_KINDS)."""
+    __slots__ = ("kind", "start", "end", "text", "number", "gospel_at")
+
+    def __init__(self, kind, start, end, text, number):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.text = text
+        # The number of "Tone 4" and "Res. Gospel 5"
+        self.number = number
+        # "Res. Gospel" and "Matins Gospel" left in the text still read as a Gospel marker
+        self.gospel_at = start + INNER_GOSPEL_RE.search(text).start() if kind in ("res", "matins") else None
+
+    def shift(self, offset):
+        """Moves the token from the joined batch text (see parse_reading_texts) to its own text."""
+        self.start -= offset
+        self.end -= offset
+        if self.gospel_at is not None:
+            self.gospel_at -= offset
+
+def fold_segment_text(text):
+    """Lowercases text, first folding the letters of SEGMENT_CASEFOLD_PAIRS to ASCII."""
+    if not text.isascii():
+        for special, ascii_letter in SEGMENT_CASEFOLD_PAIRS:
+            if special in text:
+                text = text.replace(special, ascii_letter)
+    return text.lower()
+
+def scan_segment_tokens(text):
+    """
+    Tokens of text, left to right. Every anchor of SEGMENT_TOKEN_KINDS is
+    found with str.find in the folded text and the pattern of its kind
+    matched there; as in one big alternation, the first kind matching at a
+    position wins and a token hides the ones starting inside it.
+    """
+    folded = fold_segment_text(text)
+    candidates = []
+    for priority, (kind, pattern, anchors) in enumerate(SEGMENT_TOKEN_KINDS):
+        for anchor in anchors:
+            if anchor == "g:":
+                positions = [match.start() for match in G_COLON_RE.finditer(folded)]
+            else:
+                positions = []
+                pos = folded.find(anchor)
+                while pos != -1:
+                    positions.append(pos)
+                    pos = folded.find(anchor, pos + 1)
+            for pos in positions:
+                match = pattern.match(text, pos)
+                if match:
+                    candidates.append((pos, priority, match))
+    candidates.sort(key=lambda candidate: candidate[:2])
+
+    tokens = []
+    end = 0
+    for pos, priority, match in candidates:
+        if pos >= end:
+            end = match.end()
+            number = match.group(1) if match.re.groups else None
+            tokens.append(SegmentToken(SEGMENT_TOKEN_KINDS[priority][0], pos, end, match.group(), number))
+    return tokens
+
+# Where a token ends the value of a segment: positions in it where the
+# lookahead of the segment's old regex matched.
+def matins_stop(segments, token):
+    if token.kind in ("liturgy", "following", "epistle_word"):
+        return (token.start,)
+    # "Epistle" and "Gospel", not the "Ep." and "G:" shorthands
+    if token.kind == "epistle" and len(token.text) > 3:
+        return (token.start,)
+    if token.kind == "gospel" and not token.text.endswith(":"):
+        return (token.start,)
+    return (token.gospel_at,) if token.gospel_at is not None else ()
+
+def epistle_stop(segments, token):
+    if token.kind == "gospel":
+        return (token.start,)
+    if token.kind == "following":
+        if segments.g_colon(token) is not None:
+            return token.start, token.end - 1
+        return (token.start,)
+    return (token.gospel_at,) if token.gospel_at is not None else ()
+
+def gospel_stop(segments, token):
+    if token.kind in ("following", "liturgy", "liturgy_name", "feast_note"):
+        return (token.start,)
+    return ()
+
+def following_stop(segments, token):
+    return (token.start,) if token.kind == "following" else ()
+
+# (start, end) of the marker in a token that an epistle or gospel value follows
+def epistle_marker(segments, token):
+    return token.start, token.end
+
+def gospel_marker(segments, token):
+    if token.kind == "gospel":
+        return token.start, token.end
+    if token.kind == "following":
+        colon = segments.g_colon(token)
+        return (token.end - 1, colon + 1) if colon is not None else None
+    return token.gospel_at, token.gospel_at + len("Gospel")
+
+class ReadingSegments:
+    """
+    Labels the segments of one normalized cell text from its tokens.
+
+    The segments are taken in the order the sequential parser used to cut
+    them out of the text (holidays, fasting, tone, matins, the implicit
+    Divine Liturgy pair, epistle, gospel). Instead of copying the text
+    after every match, a labelled span is added to the removed spans and
+    each later segment reads the text around them. A removal also takes
+    out the other verbatim copies of the span, as str.replace did. What
+    remains is the notes.
+    """
 
-    usa_match = USA_HOLIDAY_RE.search(work_text)
-    if usa_match:
-        usa_holiday = clean_string(usa_match.group(1))
-        work_text = work_text.replace(usa_match.group(0), ' ')
+    def __init__(self, text, tokens):
+        self.text = text
+        self.tokens = tokens
+        self.end = len(text)
+        # Sorted, disjoint (start, end) spans already labelled
+        self.removed = []
+        self.kinds = {token.kind for token in tokens}
+        self.fields = dict.fromkeys(("tone", "matinsGospel", "epistle", "gospel", "fasting",
+                                     "canadaHoliday", "usaHoliday"))
+        self._label()
+
+    def remove(self, start, end):
+        merged = [start, end]
+        kept_spans = []
+        for span in self.removed:
+            if span[1] < merged[0] or span[0] > merged[1]:
+                kept_spans.append(span)
+            else:
+                merged = [min(span[0], merged[0]), max(span[1], merged[1])]
+        kept_spans.append(merged)
+        kept_spans.sort()
+        self.removed = kept_spans
+
+    def kept(self, pos):
+        for start, end in self.removed:
+            if start <= pos < end:
+                return False
+            if start > pos:
+                break
+        return True
+
+    def kept_after(self, pos):
+        """First kept position at or after pos (self.end when none)."""
+        for start, end in self.removed:
+            if start <= pos < end:
+                pos = end
+            elif start > pos:
+                break
+        return min(pos, self.end)
+
+    def kept_before(self, pos):
+        """Last kept position before pos (-1 when none)."""
+        pos -= 1
+        for start, end in reversed(self.removed):
+            if start <= pos < end:
+                pos = start - 1
+            elif end <= pos:
+                break
+        return pos
 
-    work_text = WHITESPACE_RE.sub(' ', work_text).strip()
-    return work_text, canada_holiday, usa_holiday
+    def kept_pieces(self, start, end):
+        pieces = []
+        for span_start, span_end in self.removed:
+            if span_end <= start:
+                continue
+            if span_start >= end:
+                break
+            if span_start > start:
+                pieces.append((start, span_start))
+            start = max(start, span_end)
+        if start < end:
+            pieces.append((start, end))
+        return pieces
+
+    def kept_text(self, start, end):
+        if not self.removed:
+            return self.text[start:end]
+        return "".join(self.text[piece_start:piece_end] for piece_start, piece_end in self.kept_pieces(start, end))
+
+    def original_position(self, start, offset):
+        """Position in text of the character offset characters into kept_text(start, ...)."""
+        for piece_start, piece_end in self.kept_pieces(start, self.end):
+            if offset < piece_end - piece_start:
+                return piece_start + offset
+            offset -= piece_end - piece_start
+        return self.end
+
+    def skip_space(self, pos):
+        pos = self.kept_after(pos)
+        while pos < self.end and self.text[pos].isspace():
+            pos = self.kept_after(pos + 1)
+        return pos
+
+    def value_start(self, pos, colon=False):
+        """First character of the value after a marker ending at pos (\\s*:?\\s*(.+?)), None when empty."""
+        first = self.skip_space(pos)
+        if colon and first < self.end and self.text[first] == ":":
+            first = self.skip_space(first + 1)
+        if first < self.end:
+            return first
+        # The value needs a character, so the last whitespace or colon is given back
+        last = self.kept_before(self.end)
+        return last if last >= 0 and last >= self.kept_after(pos) else None
+
+    def value_end(self, first, stop, trim_at_end=False):
+        """
+        End of a lazy value from first up to stop, without the whitespace
+        before the stop. A value running to the end of the text keeps its
+        trailing whitespace unless trim_at_end, as only some of the old
+        lookaheads allowed whitespace before the end.
+        """
+        if stop == self.end and not trim_at_end:
+            return stop
+        end = stop
+        while True:
+            prev = self.kept_before(end)
+            if prev <= first or not self.text[prev].isspace():
+                return end
+            end = prev
+
+    def g_colon(self, token):
+        """Position of the colon when the "g" ending a "Following" reads as the "G:" shorthand."""
+        after = self.skip_space(token.end)
+        return after if after < self.end and self.text[after] == ":" else None
+
+    def next_stop(self, index, first, stop_at):
+        """First position after first where stop_at ends a value in a later token (self.end when none)."""
+        for token in self.tokens[index + 1:]:
+            if token.end > self.end:
+                break
+            for stop in stop_at(self, token):
+                if stop > first and self.kept(stop):
+                    return stop
+        return self.end
+
+    def next_char(self, char, first, stop):
+        """Position of the first kept char from first up to stop, None when there is none."""
+        pos = self.text.find(char, first, stop)
+        while pos != -1 and not self.kept(pos):
+            pos = self.text.find(char, pos + 1, stop)
+        return None if pos == -1 else pos
+
+    def sentence_break(self, first, stop, spaced):
+        """First "." after first and before stop that whitespace (optional unless spaced) and a letter follow."""
+        pos = self.next_char(".", first + 1, stop)
+        while pos is not None:
+            after = self.kept_after(pos + 1)
+            gap = False
+            while after < self.end and self.text[after].isspace():
+                gap = True
+                after = self.kept_after(after + 1)
+            if (gap or not spaced) and after < self.end and SENTENCE_LETTER_RE.match(self.text, after):
+                return pos
+            pos = self.next_char(".", pos + 1, stop)
+        return stop
+
+    def marker_start(self, pos):
+        """Start of a marker at pos with the delimiter before it, None when a letter precedes it."""
+        prev = self.kept_before(pos)
+        if prev < 0:
+            return pos
+        return prev if self.text[prev] in MARKER_DELIMITERS or self.text[prev].isspace() else None
+
+    def _remove_match(self, start, end):
+        """
+        Removes the span and, as str.replace did, every other copy of its
+        text in the kept text, including copies only joined up by earlier
+        removals.
+        """
+        needle = self.kept_text(start, end)
+        if not needle:
+            return
+        if (self.text.count(needle) == 1 and self.kept_pieces(start, end) == [(start, end)]
+                and not self._joined_copy(needle)):
+            self.remove(start, end)
+            return
+        pieces = self.kept_pieces(0, self.end)
+        kept = "".join(self.text[piece_start:piece_end] for piece_start, piece_end in pieces)
+        spans = []
+        pos = kept.find(needle)
+        while pos != -1:
+            spans.append((pos, pos + len(needle)))
+            pos = kept.find(needle, pos + len(needle))
+        # Kept offsets back to positions in text, piece by piece
+        removals = []
+        offset = 0
+        span_idx = 0
+        for piece_start, piece_end in pieces:
+            piece_offset_end = offset + piece_end - piece_start
+            while span_idx < len(spans) and spans[span_idx][0] < piece_offset_end:
+                span_start, span_end = spans[span_idx]
+                removals.append((piece_start + max(span_start - offset, 0),
+                                 piece_start + min(span_end, piece_offset_end) - offset))
+                if span_end > piece_offset_end:
+                    break
+                span_idx += 1
+            offset = piece_offset_end
+        for removal_start, removal_end in removals:
+            self.remove(removal_start, removal_end)
+
+    def _joined_copy(self, needle):
+        """
+        Whether the kept text may hold a copy of needle across a removed
+        span: a copy there holds the two characters the span joins.
+        """
+        for start, end in self.removed:
+            if 0 < start and end < self.end and self.text[start - 1] + self.text[end] in needle:
+                return True
+        return False
 
-def parse_reading_text(text):
-    if not text:
+    def _first(self, kind):
+        for token in self.tokens:
+            if token.kind == kind and token.end <= self.end and self.kept(token.start):
+                return token
         return None
 
-    # Start with a clean working copy
-    work_text = TAGS_RE.sub(' ', text)
-    work_text = WHITESPACE_RE.sub(' ', work_text).strip()
-    work_text = normalize_mojibake(work_text)
-
-    # Extract country-specific holidays early so they don't remain in title/notes
-    work_text, canada_holiday, usa_holiday = extract_country_holidays(work_text)
-
-    # 0. Extract Fasting/Abstinence (Look for it early to remove it from Title/notes)
-    fasting = None
-    fasting_match = FASTING_RE.search(work_text)
-    if fasting_match:
-        fasting = WHITESPACE_RE.sub(' ', fasting_match.group(1)).strip()
+    def _label(self):
+        kinds = self.kinds
+        if "canada" in kinds or "usa" in kinds:
+            self._label_holidays()
+        if "fasting" in kinds:
+            self._label_fasting()
+
+        numbered = self._numbered("tone", TONE_RE) if "tone" in kinds else None
+        if numbered:
+            self.fields["tone"] = numbered[2]
+            self._remove_match(numbered[0], numbered[1])
+
+        numbered = self._numbered("res", MATINS_RES_RE) if "res" in kinds else None
+        if numbered:
+            self.fields["matinsGospel"] = numbered[2]
+            self._remove_match(numbered[0], numbered[1])
+        elif "matins" in kinds:
+            self._label_matins_text()
+
+        if "liturgy" in kinds:
+            if self._label_implicit_liturgy():
+                return
+            # Otherwise the "Divine Liturgy" headers are dropped
+            for token in self.tokens:
+                if token.kind == "liturgy" and token.end <= self.end and self.kept(token.start):
+                    self.remove(token.start, token.end)
+
+        gospel_marked = not kinds.isdisjoint(GOSPEL_MARKER_KINDS)
+        if not ("epistle" in kinds and self._label_epistle()):
+            if not ("apostle" in kinds and self._label_apostle()) and gospel_marked:
+                self._label_epistle_before_gospel()
+        if gospel_marked:
+            self._label_gospel()
+
+    def _holiday_stop(self, token, other_kind, skip=None):
+        """End of a holiday value: the whitespace before the other country's marker, or the end."""
+        first = self.skip_space(token.end)
+        for later in self.tokens:
+            if later.kind != other_kind or later.start <= token.end or later is skip:
+                continue
+            pos = later.start
+            while pos > 0 and self.text[pos - 1].isspace():
+                pos -= 1
+            if first < pos < later.start:
+                return pos
+        return self.end
+
+    def _label_holidays(self):
+        # The CANADA span is taken out before the USA marker is looked for
+        canada = next((token for token in self.tokens if token.kind == "canada" and token.end < self.end), None)
+        if canada:
+            canada_end = self._holiday_stop(canada, "usa")
+            self.fields["canadaHoliday"] = clean_string(self.text[canada.end:canada_end])
+            self.remove(canada.start, canada_end)
+        usa = next((token for token in self.tokens
+                    if token.kind == "usa" and token.end < self.end and self.kept(token.start)), None)
+        if usa:
+            usa_end = self._holiday_stop(usa, "canada", canada)
+            if canada and usa.start < canada.start < usa_end:
+                value = self.text[usa.end:canada.start] + " " + self.text[canada_end:usa_end]
+            else:
+                value = self.text[usa.end:usa_end]
+            self.fields["usaHoliday"] = clean_string(value)
+            self.remove(usa.start, usa_end)
+        if canada or usa:
+            end = self.end
+            while end > 0 and (self.text[end - 1].isspace() or not self.kept(end - 1)):
+                end -= 1
+            self.end = end
+
+    def _label_fasting(self):
+        token = self._first("fasting")
+        if token is None:
+            return
+        # "Dispensation (...)" and "Abstinence from ..." run on past their keyword
+        end = FASTING_RE.match(self.text, token.start, self.end).end()
+        fasting = WHITESPACE_RE.sub(' ', self.text[token.start:end]).strip()
         if re.match(r'^Abstinence\b', fasting, re.IGNORECASE) and ' from ' not in fasting.lower():
             fasting = 'Abstinence'
-        work_text = work_text.replace(fasting_match.group(0), '')
-
-    # 1. Extract Tone
-    tone = None
-    tone_match = TONE_RE.search(work_text)
-    if tone_match:
-        tone = tone_match.group(1)
-        # Remove matched tone to avoid confusion and clean up for notes
-        work_text = work_text.replace(tone_match.group(0), '')
-
-    # 2. Extract Matins
-    matins_gospel = None
-    matins_res_match = MATINS_RES_RE.search(work_text)
-    
-    if matins_res_match:
-        matins_gospel = matins_res_match.group(1)
-        # Remove matched Res. Gospel to avoid it being picked up by generic Gospel regex
-        work_text = work_text.replace(matins_res_match.group(0), '')
-    else:
-        matins_text_match = MATINS_TEXT_RE.search(work_text)
-        if matins_text_match:
-            matins_gospel = clean_string(matins_text_match.group(1))
-            work_text = work_text.replace(matins_text_match.group(0), '')
+        self.fields["fasting"] = fasting
+        self._remove_match(token.start, end)
 
-    # 3. Prepare for Liturgy Parsing
-    epistle = None
-    gospel = None
+    def _numbered(self, kind, pattern):
+        """(start, end, number) of the first "Tone N" or "Res. Gospel N", None when there is none."""
+        for token in self.tokens:
+            if token.kind != kind or token.end > self.end or not self.kept(token.start):
+                continue
+            if token.number:
+                return token.start, token.end, token.number
+            # A number can also follow once the text between them is removed
+            match = pattern.match(self.kept_text(token.start, self.end))
+            if match:
+                return token.start, self.original_position(token.start, match.end() - 1) + 1, match.group(1)
+        return None
 
-    implicit_match = IMPLICIT_LITURGY_RE.search(work_text)
-    
-    if implicit_match:
-        epistle = normalize_scripture_reference(implicit_match.group(1))
-        gospel = normalize_scripture_reference(implicit_match.group(2))
-        work_text = work_text.replace(implicit_match.group(0), '')
-    else:
-        # Clear Liturgy Header if present
-        work_text = DIVINE_LITURGY_HEADER_RE.sub('', work_text)
-
-        # 4. Extract Epistle
-        epistle_match = EPISTLE_RE.search(work_text)
-        if epistle_match:
-            epistle = normalize_scripture_reference(epistle_match.group(1))
-            work_text = work_text.replace(epistle_match.group(0), '')
-        else:
-            apostle_match = APOSTLE_EPISTLE_RE.search(work_text)
-            if apostle_match:
-                epistle = normalize_scripture_reference(apostle_match.group(1))
-                work_text = work_text.replace(apostle_match.group(0), '')
+    def _label_matins_text(self):
+        for index, token in enumerate(self.tokens):
+            if token.kind != "matins" or token.end > self.end or not self.kept(token.start):
+                continue
+            # The colon of "Matins Gospel:" is optional, so an empty value takes it back
+            if token.text.endswith(":"):
+                first = self.value_start(token.end - 1, colon=True)
             else:
-                epistle_fallback_match = EPISTLE_BEFORE_GOSPEL_RE.search(work_text)
-                if epistle_fallback_match:
-                    epistle = normalize_scripture_reference(epistle_fallback_match.group(1))
-                    work_text = work_text.replace(epistle_fallback_match.group(0), '')
-
-        # 5. Extract Gospel
-        gospel_match = GOSPEL_RE.search(work_text)
-        if gospel_match:
-            gospel = normalize_scripture_reference(gospel_match.group(1))
-            work_text = work_text.replace(gospel_match.group(0), '')
-
-    # 6. Extract Notes (Whatever is left is roughly the title/notes)
-    # The work_text has been stripped of identified parts sequentially
-    notes = work_text
-    
-    # Cleaning based on Vue logic
-    notes = re.sub(r'^[\s,;.]+|[\s,;.]+$', '', notes)
-    notes = re.sub(r'\s+([,;.])', r'\1', notes)
-    notes = re.sub(r'[,;]+\s*\.', '.', notes)
-    notes = re.sub(r'\.\s*[,;]+', '.', notes)
-    notes = re.sub(r',,+', ',', notes)
-    notes = re.sub(r'\.\.+', '.', notes)
-    
-    notes = notes.strip()
-    
+                first = self.value_start(token.end)
+            if first is None:
+                continue
+            end = self.value_end(first, self.next_stop(index, first, matins_stop))
+            self.fields["matinsGospel"] = clean_string(self.kept_text(first, end))
+            self._remove_match(token.start, end)
+            return
+
+    def _label_implicit_liturgy(self):
+        """"Divine Liturgy: <epistle>; <gospel>", the gospel ending at "Following", a sentence or the text."""
+        for index, token in enumerate(self.tokens):
+            if token.kind != "liturgy" or token.end > self.end or not self.kept(token.start):
+                continue
+            header_end = token.start + len("Divine Liturgy")
+            semicolon = self.next_char(";", header_end, self.end)
+            if semicolon is None:
+                continue
+            # With nothing else before the ";", the colon or a space is the epistle
+            before = self.kept_text(header_end, semicolon)
+            prefix = LITURGY_PREFIX_RE.match(before).end()
+            epistle = before[prefix:] or before[prefix - 1:prefix]
+            first = self.value_start(semicolon + 1)
+            if not epistle or first is None:
+                continue
+
+            stop = self.sentence_break(first, self.next_stop(index, first, following_stop), spaced=False)
+            if self.text[first] != ";" and self.next_char(";", first, stop) is None:
+                end = self.value_end(first, stop, trim_at_end=True)
+            else:
+                # The gospel never crosses a ";", but can be the one space before a stop
+                space = self.kept_before(first)
+                if space <= semicolon or not self.text[space].isspace() or not self._stops_at(first):
+                    continue
+                first, end = space, first
+            self.fields["epistle"] = normalize_scripture_reference(epistle)
+            self.fields["gospel"] = normalize_scripture_reference(self.kept_text(first, end))
+            self._remove_match(token.start, end)
+            return True
+        return False
+
+    def _stops_at(self, pos):
+        """Whether "Following" or a "." and a letter start at pos."""
+        if any(token.start == pos and token.kind == "following" for token in self.tokens):
+            return True
+        return self.text[pos] == "." and self.sentence_break(pos - 1, pos + 1, spaced=False) == pos
+
+    def _label_marked_value(self, marker_kinds, marker_at, stop_at, colon, field):
+        for index, token in enumerate(self.tokens):
+            if token.kind not in marker_kinds:
+                continue
+            if token.end > self.end:
+                break
+            marker = marker_at(self, token)
+            if marker is None or not self.kept(marker[0]):
+                continue
+            start = self.marker_start(marker[0])
+            if start is None:
+                continue
+            first = self.value_start(marker[1], colon)
+            if first is None:
+                continue
+            stop = self.next_stop(index, first, stop_at)
+            if field == "gospel":
+                stop = self.sentence_break(first, stop, spaced=True)
+            end = self.value_end(first, stop)
+            self.fields[field] = normalize_scripture_reference(self.kept_text(first, end))
+            self._remove_match(start, end)
+            return True
+        return False
+
+    def _label_epistle(self):
+        return self._label_marked_value(EPISTLE_MARKER_KINDS, epistle_marker, epistle_stop, True, "epistle")
+
+    def _label_gospel(self):
+        return self._label_marked_value(GOSPEL_MARKER_KINDS, gospel_marker, gospel_stop, False, "gospel")
+
+    def _label_apostle(self):
+        for token in self.tokens:
+            if token.kind != "apostle" or token.end > self.end or not self.kept(token.start):
+                continue
+            start = self.marker_start(token.start)
+            if start is None:
+                continue
+            match = APOSTLE_VALUE_RE.match(self.kept_text(token.end, self.end))
+            if match:
+                self.fields["epistle"] = normalize_scripture_reference(match.group(1))
+                self._remove_match(start, self.original_position(token.end, match.end() - 1) + 1)
+                return True
+        return False
+
+    def _label_epistle_before_gospel(self):
+        """An unmarked epistle reference followed by "; Gospel"."""
+        if self.next_char(";", 0, self.end) is None:
+            return False
+        match = EPISTLE_BEFORE_GOSPEL_RE.search(self.kept_text(0, self.end))
+        if not match:
+            return False
+        self.fields["epistle"] = normalize_scripture_reference(match.group(1))
+        self._remove_match(self.original_position(0, match.start()), self.original_position(0, match.end() - 1) + 1)
+        return True
+
+    def notes(self):
+        return self.kept_text(0, self.end)
+
+def clean_notes(notes):
+    # Cleaning based on Vue logic; punctuation rules only run when they can match
+    if notes[:1] in ',;.' or notes[-1:] in ',;.' or notes[:1].isspace() or notes[-1:].isspace():
+        notes = NOTES_TRIM_RE.sub('', notes)
+    if ',' in notes or ';' in notes or '.' in notes:
+        notes = NOTES_SPACE_BEFORE_PUNCT_RE.sub(r'\1', notes)
+        if '.' in notes and (',' in notes or ';' in notes):
+            notes = NOTES_COMMA_BEFORE_PERIOD_RE.sub('.', notes)
+            notes = NOTES_COMMA_AFTER_PERIOD_RE.sub('.', notes)
+        if ',,' in notes:
+            notes = NOTES_REPEATED_COMMA_RE.sub(',', notes)
+        if '..' in notes:
+            notes = NOTES_REPEATED_PERIOD_RE.sub('.', notes)
+    return notes.strip()
+
+def normalize_reading_text(text):
+    """Cell text without tags and mojibake, its whitespace collapsed to single spaces."""
+    work_text = TAGS_RE.sub(' ', text) if '<' in text else text
+    # str.split() splits on exactly the whitespace \s matches
+    work_text = " ".join(work_text.split())
+    normalized = normalize_mojibake(work_text)
+    return " ".join(normalized.split()) if normalized is not work_text else work_text
+
+def parse_segments(text, tokens):
+    segments = ReadingSegments(text, tokens)
+    fields = segments.fields
+    notes = clean_notes(segments.notes())
     return {
-        "tone": tone,
-        "matinsGospel": matins_gospel,
-        "epistle": epistle,
-        "gospel": gospel,
-        "fasting": fasting,
+        "tone": fields["tone"],
+        "matinsGospel": fields["matinsGospel"],
+        "epistle": fields["epistle"],
+        "gospel": fields["gospel"],
+        "fasting": fields["fasting"],
         "notes": notes if notes else None,
-        "canadaHoliday": canada_holiday,
-        "usaHoliday": usa_holiday
+        "canadaHoliday": fields["canadaHoliday"],
+        "usaHoliday": fields["usaHoliday"]
     }
 
+class ParsedTextCache:
+    """
+    LRU cache of parse_reading_texts results by raw text, with the
+    cache_info() and cache_clear() of the lru_cache wrappers it is reported
+    with (see MEMOIZED_TEXT_FUNCTIONS).
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, texts):
+        """(found, missing): the cached results by text, and the distinct texts without one."""
+        found = {}
+        missing = {}
+        for text in texts:
+            if text in found or text in missing:
+                self._hits += 1
+                continue
+            parsed = self._results.get(text)
+            if parsed is None:
+                missing[text] = None
+                self._misses += 1
+            else:
+                self._results.move_to_end(text)
+                found[text] = parsed
+                self._hits += 1
+        return found, list(missing)
+
+    def store(self, text, parsed):
+        self._results[text] = parsed
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def cache_info(self):
+        return ParseCacheInfo(self._hits, self._misses, self.maxsize, len(self._results))
+
+    def cache_clear(self):
+        self._results.clear()
+        self._hits = 0
+        self._misses = 0
+
+PARSED_TEXT_CACHE = ParsedTextCache(PARSE_CACHE_SIZE)
+
+def parse_reading_texts(texts):
+    """
+    Parses a batch of raw cell texts; every position gets its own result
+    dict (None for an empty text). The distinct texts not in the parse
+    cache are normalized and joined, tokenized by one scan of the joined
+    text, and then labelled one by one.
+    """
+    found, missing = PARSED_TEXT_CACHE.lookup(text for text in texts if text)
+    normalized = [normalize_reading_text(text) for text in missing]
+
+    # Texts holding the separator itself are scanned on their own
+    joined_idxs = [idx for idx, text in enumerate(normalized) if SEGMENT_SEPARATOR not in text]
+    tokens = scan_segment_tokens(SEGMENT_SEPARATOR.join(normalized[idx] for idx in joined_idxs))
+    token_idx = 0
+    offset = 0
+    parsed_texts = [None] * len(missing)
+    for idx in joined_idxs:
+        end = offset + len(normalized[idx])
+        own_tokens = []
+        while token_idx < len(tokens) and tokens[token_idx].start < end:
+            tokens[token_idx].shift(offset)
+            own_tokens.append(tokens[token_idx])
+            token_idx += 1
+        parsed_texts[idx] = parse_segments(normalized[idx], own_tokens)
+        offset = end + len(SEGMENT_SEPARATOR)
+    for idx, text in enumerate(normalized):
+        if parsed_texts[idx] is None:
+            parsed_texts[idx] = parse_segments(text, scan_segment_tokens(text))
+
+    for text, parsed in zip(missing, parsed_texts):
+        found[text] = parsed
+        PARSED_TEXT_CACHE.store(text, parsed)
+    # The cached dicts are shared between calls, so callers always get their own copy
+    return [dict(found[text]) if text else None for text in texts]
+
+def parse_reading_text(text):
+    return parse_reading_texts([text])[0]
+
 def extract_day_number_at_start(text):
     if not text:
         return None
@@ -406,7 +1031,61 @@ def collapse_row_to_7_columns(row):
 
     return row[:7], 1
 
-def extract_day_from_cell_style(page, bbox):
+class PageCharIndex:
+    """
+    Per-page lookup structure for digit glyphs.
+
+    page.chars is scanned once (lazily, on the first query) and every digit
+    glyph is kept with its coordinates already converted to floats, sorted by
+    horizontal centre. A cell query then bisects to the glyphs whose centre
+    falls inside the cell's x-range instead of re-walking every glyph on the
+    page. Matches are returned in original page.chars order so callers see
+    exactly what a full scan would have produced.
+    """
+    __slots__ = ("_page", "_centers_x", "_records")
+
+    def __init__(self, page):
+        self._page = page
+        self._centers_x = None
+        self._records = None
+
+    def _build(self):
+        records = []
+        for order, ch in enumerate(self._page.chars):
+            try:
+                text = str(ch.get("text", ""))
+                if not text.isdigit():
+                    continue
+                cx = (float(ch["x0"]) + float(ch["x1"])) / 2.0
+                cy = (float(ch["top"]) + float(ch["bottom"])) / 2.0
+                char_top = float(ch["top"])
+                size = float(ch.get("size", 0))
+                char_x0 = float(ch.get("x0", 0))
+            except Exception:
+                continue
+            # NaN coordinates can never satisfy the bbox comparisons
+            if cx != cx or cy != cy:
+                continue
+            records.append((cx, order, cy, char_top, size, char_x0, text))
+
+        records.sort(key=lambda r: (r[0], r[1]))
+        self._centers_x = [r[0] for r in records]
+        self._records = records
+        # The page itself is no longer needed once the glyphs are indexed
+        self._page = None
+
+    def digits_in_bbox(self, x0, top, x1, bottom):
+        """Returns (top, size, x0, text) for digit glyphs centred in the bbox, in page order."""
+        if self._records is None:
+            self._build()
+
+        lo = bisect_left(self._centers_x, x0)
+        hi = bisect_right(self._centers_x, x1)
+        hits = [r for r in self._records[lo:hi] if top <= r[2] <= bottom]
+        hits.sort(key=lambda r: r[1])
+        return [(r[3], r[4], r[5], r[6]) for r in hits]
+
+def extract_day_from_cell_style(char_index, bbox):
     if not bbox:
         return None
 
@@ -418,29 +1097,20 @@ def extract_day_from_cell_style(page, bbox):
 
     top_band = top + (height * 0.40)
 
-    digit_chars = []
-    for ch in page.chars:
-        try:
-            cx = (float(ch["x0"]) + float(ch["x1"])) / 2.0
-            cy = (float(ch["top"]) + float(ch["bottom"])) / 2.0
-            if x0 <= cx <= x1 and top <= cy <= bottom and str(ch.get("text", "")).isdigit():
-                digit_chars.append(ch)
-        except Exception:
-            continue
-
+    digit_chars = char_index.digits_in_bbox(x0, top, x1, bottom)
     if not digit_chars:
         return None
 
-    top_digits = [c for c in digit_chars if float(c.get("top", top)) <= top_band]
+    top_digits = [c for c in digit_chars if c[0] <= top_band]
     candidates = top_digits if top_digits else digit_chars
 
-    max_size = max(float(c.get("size", 0)) for c in candidates)
-    prominent = [c for c in candidates if float(c.get("size", 0)) >= (max_size - 0.25)]
+    max_size = max(c[1] for c in candidates)
+    prominent = [c for c in candidates if c[1] >= (max_size - 0.25)]
     if not prominent:
         return None
 
-    prominent = sorted(prominent, key=lambda c: float(c.get("x0", 0)))
-    digit_text = "".join(str(c.get("text", "")) for c in prominent)
+    prominent = sorted(prominent, key=lambda c: c[2])
+    digit_text = "".join(c[3] for c in prominent)
 
     match = re.search(r'(\d{1,2})', digit_text)
     if not match:
@@ -449,6 +1119,8 @@ def extract_day_from_cell_style(page, bbox):
     day_num = int(match.group(1))
     return day_num if 1 <= day_num <= 31 else None
 
+# Keyed by (notes, day): the day number changes which prefix gets stripped
+@lru_cache(maxsize=PARSE_CACHE_SIZE, typed=True)
 def clean_title(notes, day):
     if not notes:
         return ""
@@ -466,6 +1138,7 @@ def clean_title(notes, day):
     cleaned = CLEAN_TRIM_PUNCT_RE.sub('', cleaned)
     return cleaned.strip()
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE, typed=True)
 def split_following_notes(notes):
     if not notes:
         return (None, None)
@@ -563,25 +1236,63 @@ def extract_overlay_day_numbers(text, base_day=None):
 def dedupe_entries_by_date(entries):
     deduped_by_date = {}
     for entry in entries:
-        key = (entry.get("Year"), entry.get("Date"))
+        key = (entry.year, entry.date)
         current = deduped_by_date.get(key)
         if current is None:
             deduped_by_date[key] = entry
             continue
 
-        current_score = raw_text_quality_score(current.get("Raw Text"))
-        incoming_score = raw_text_quality_score(entry.get("Raw Text"))
+        current_score = raw_text_quality_score(current.raw_text)
+        incoming_score = raw_text_quality_score(entry.raw_text)
         if incoming_score > current_score:
             deduped_by_date[key] = entry
 
     return list(deduped_by_date.values())
 
+def split_stacked_cell_text(text, day):
+    """
+    Raw text of one day of a stacked "d1/d2" cell (d2 = d1 + 7) whose two
+    Sundays the layout stage could not separate, headed by that day's
+    number. None when text is not such a cell or has no clear boundary
+    between two sets of readings.
+    """
+    header = STACKED_CELL_HEADER_RE.match(text)
+    if not header:
+        return None
+    first_day, second_day = int(header.group(1)), int(header.group(2))
+    if second_day != first_day + 7 or day not in (first_day, second_day):
+        return None
+
+    body = text[header.end():]
+    separator = STACKED_CELL_SEPARATOR_RE.search(body)
+    if separator:
+        first_text, second_text = body[:separator.start()], body[separator.end():]
+    else:
+        headings = list(SUNDAY_HEADING_RE.finditer(body))
+        if len(headings) < 2:
+            return None
+        first_text, second_text = body[:headings[1].start()], body[headings[1].start():]
+
+    first_text, second_text = first_text.strip(), second_text.strip()
+    if not READING_KEYWORD_RE.search(first_text) or not READING_KEYWORD_RE.search(second_text):
+        return None
+    return f"{day}\n{first_text if day == first_day else second_text}"
+
+def resolve_stacked_cell(entry):
+    """The entry with only its own day's part of a stacked "d1/d2" cell."""
+    day_text = split_stacked_cell_text(entry.raw_text or "", entry.day)
+    if day_text is None:
+        return entry
+    resolved = entry.copy()
+    resolved.raw_text = day_text
+    return resolved
+
 def detect_and_split_double_entry(entry):
     """
     Detects if an entry contains two distinct feasts (e.g., Encounter + Sunday)
     and splits them into two separate entries.
     """
-    raw_text = entry.get("Raw Text", "")
+    raw_text = entry.raw_text or ""
     
     # Check for split pattern: ". <Number>th Sunday"
     match = DOUBLE_FEAST_SPLIT_RE.search(raw_text)
@@ -592,83 +1303,203 @@ def detect_and_split_double_entry(entry):
     part2_text = raw_text[match.end():].strip()
     
     # Heuristic check: Both parts should contain at least one reading keyword
-    reading_kw_re = re.compile(r'Epistle|Gospel|Ep\.|G\s*:', re.IGNORECASE)
     
     # Check part 1
-    if not reading_kw_re.search(part1_text):
+    if not READING_KEYWORD_RE.search(part1_text):
         return [entry]
         
     # Check part 2
-    if not reading_kw_re.search(part2_text):
+    if not READING_KEYWORD_RE.search(part2_text):
          return [entry]
          
     # If valid, create two entries
     entry1 = entry.copy()
-    entry1["Raw Text"] = part1_text
+    entry1.raw_text = part1_text
     
     entry2 = entry.copy()
-    entry2["Raw Text"] = part2_text
+    entry2.raw_text = part2_text
     
     return [entry1, entry2]
 
 def is_holy_day_of_obligation(entry):
     try:
-        mm = int(entry["Date"][:2])
-        dd = int(entry["Day"])
-        yyyy = int(entry["Year"])
+        mm = int(entry.date[:2])
+        dd = int(entry.day)
+        yyyy = int(entry.year)
         dt = date(yyyy, mm, dd)
         if dt.weekday() == 6:  # Sunday
             return True
     except Exception:
         pass
 
-    return bool(re.search(r'Holy Day of Obligation', entry["Raw Text"], re.IGNORECASE))
+    return bool(re.search(r'Holy Day of Obligation', entry.raw_text, re.IGNORECASE))
 
-def enrich_entry(entry):
-    parsed = parse_reading_text(entry["Raw Text"])
+def enrich_entry(entry, parsed=None):
+    if parsed is None:
+        parsed = parse_reading_text(entry.raw_text)
     following_notes, main_notes = split_following_notes(parsed['notes'])
-    title = clean_title(main_notes, entry['Day'])
-
-    entry.update({
-        "Title": title,
-        "Tone": parsed['tone'],
-        "Matins Gospel": parsed['matinsGospel'],
-        "Epistle": parsed['epistle'],
-        "Gospel": parsed['gospel'],
-        "Fasting": parsed['fasting'],
-        "Notes": following_notes,
-        "Canada Holiday": parsed['canadaHoliday'],
-        "USA Holiday": parsed['usaHoliday'],
-        "Holy Day of Obligation": is_holy_day_of_obligation(entry)
-    })
+    title = clean_title(main_notes, entry.day)
+
+    entry.set_fields(
+        title=title,
+        tone=parsed['tone'],
+        matins_gospel=parsed['matinsGospel'],
+        matins_gospel_ranges=matins_gospel_ranges(parsed['matinsGospel']) or None,
+        epistle=parsed['epistle'],
+        epistle_ranges=parse_reference(parsed['epistle']) or None,
+        gospel=parsed['gospel'],
+        gospel_ranges=parse_reference(parsed['gospel']) or None,
+        fasting=parsed['fasting'],
+        notes=following_notes,
+        canada_holiday=parsed['canadaHoliday'],
+        usa_holiday=parsed['usaHoliday'],
+        holy_day_of_obligation=is_holy_day_of_obligation(entry)
+    )
     return entry
 
-def csv_sort_key(row):
+def enrich_entries(entries):
+    parsed_list = parse_reading_texts([entry.raw_text for entry in entries])
+    return [enrich_entry(entry, parsed) for entry, parsed in zip(entries, parsed_list)]
+
+MEMOIZED_TEXT_FUNCTIONS = (
+    ("parse_reading_text", PARSED_TEXT_CACHE),
+    ("split_following_notes", split_following_notes),
+    ("normalize_scripture_reference", normalize_scripture_reference),
+    ("clean_title", clean_title),
+    ("parse_reference", parse_reference),
+)
+
+def report_parse_cache_stats():
+    print("Parse cache statistics:")
+    for name, func in MEMOIZED_TEXT_FUNCTIONS:
+        info = func.cache_info()
+        calls = info.hits + info.misses
+        hit_rate = (info.hits / calls * 100) if calls else 0.0
+        print(f"  {name}: {info.hits} hits, {info.misses} misses ({hit_rate:.1f}% hit rate, {info.currsize}/{info.maxsize} cached)")
+
+def clear_parse_caches():
+    for _, func in MEMOIZED_TEXT_FUNCTIONS:
+        func.cache_clear()
+
+def csv_sort_key(entry):
     try:
-        year = int(row.get("Year"))
-        month = int(str(row.get("Date", ""))[:2])
-        day = int(row.get("Day"))
+        year = int(entry.year)
+        month = int(str(entry.date or "")[:2])
+        day = int(entry.day)
         return (year, month, day)
     except Exception:
         return (9999, 12, 31)
 
-def write_output_files(calendars_dir, sorted_data):
-    json_output = calendars_dir / "extracted_readings.json"
-    with open(json_output, "w", encoding="utf-8") as f:
-        json.dump(sorted_data, f, indent=2)
+def format_json_array_item(row):
+    """
+    One element of a JSON array exactly as json.dump(rows, f, indent=2)
+    lays it out, so the array can be written one row at a time.
+    """
+    return "\n".join("  " + line for line in json.dumps(row, indent=2).split("\n"))
 
+def iter_json_array_items(f):
+    """
+    Yields the text of each element of a JSON array written one
+    format_json_array_item() per element, reading one element at a time.
+    Raises ValueError for any other layout.
+    """
+    first_line = f.readline().rstrip("\n")
+    if first_line == "[]":
+        return
+    if first_line != "[":
+        raise ValueError("not a JSON array of indented elements")
+    lines = []
+    for line in f:
+        line = line.rstrip("\n")
+        # Elements are indented by two spaces, so only their own closing brace sits at that depth
+        if line in ("  }", "  },"):
+            lines.append("  }")
+            yield "\n".join(lines)
+            lines = []
+        elif line == "]" and not lines:
+            return
+        else:
+            lines.append(line)
+    raise ValueError("truncated JSON array")
+
+def load_record_digests(json_output):
+    """
+    RecordDigests of an existing extracted_readings.json (empty if it is
+    missing or unreadable). The file is streamed one row at a time; only a
+    file in another layout is loaded whole and re-serialized.
+    """
+    digests = RecordDigests()
+    try:
+        with open(json_output, "r", encoding="utf-8") as f:
+            for json_item in iter_json_array_items(f):
+                digests.add(json.loads(json_item), json_item)
+        return digests
+    except OSError:
+        return digests
+    except ValueError:
+        pass
+
+    digests = RecordDigests()
+    try:
+        with open(json_output, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        for row in rows:
+            digests.add(row, format_json_array_item(row))
+    except (OSError, ValueError, AttributeError):
+        return RecordDigests()
+    return digests
+
+def write_output_files(calendars_dir, sorted_data, row_writers=()):
+    """
+    Writes extracted_readings.json and readings.csv in a single pass over
+    sorted_data, an iterable of ReadingEntry (for example a generator).
+    Each entry becomes a row dict here, at the serialization boundary, and
+    the row is also handed to the write_row() of each extra writer (for
+    example a ReadingsDbWriter).
+
+    Both files are written to temp files first and only replace the
+    existing outputs when their content changed. Returns the added, removed
+    and modified (Year, Date) records plus which files were rewritten.
+    """
+    json_output = calendars_dir / "extracted_readings.json"
     csv_output = calendars_dir / "readings.csv"
     csv_columns = ["Date", "Title", "Tone", "Matins Gospel", "Epistle", "Gospel", "Fasting", "Notes", "Canada Holiday", "USA Holiday", "Holy Day of Obligation", "Raw Text"]
+    record_digests = RecordDigests()
 
-    with open(csv_output, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=csv_columns, extrasaction='ignore')
+    with ChangeAwareOutput(json_output) as json_file, \
+            ChangeAwareOutput(csv_output, newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=csv_columns, extrasaction='ignore')
         writer.writeheader()
-        for row in sorted_data:
-            writer.writerow(row)
 
-    print(f"Extraction complete. Saved to {csv_output}")
+        count = 0
+        for entry in sorted_data:
+            with profile_stage("write"):
+                row = entry.to_dict()
+                json_item = format_json_array_item(row)
+                json_file.write("[\n" if count == 0 else ",\n")
+                json_file.write(json_item)
+                writer.writerow(row)
+                record_digests.add(row, json_item)
+                for row_writer in row_writers:
+                    row_writer.write_row(row)
+            count += 1
+        json_file.write("[]" if count == 0 else "\n]")
+
+        # Only read the previous records back when there is something to report
+        diff = empty_diff() if json_file.is_unchanged() else record_digests.diff(load_record_digests(json_output))
+        json_changed = json_file.commit()
+        csv_changed = csv_file.commit()
+
+    if json_changed or csv_changed:
+        print(f"Extraction complete. Saved to {csv_output}")
+        print(format_diff_summary(diff))
+    else:
+        print(f"Extraction complete. {json_output.name} and {csv_output.name} are unchanged.")
+
+    diff.update({"json_changed": json_changed, "csv_changed": csv_changed})
+    return diff
 
-def resolve_block_days(table, page, block_rows, start_row_idx, group_width, expected_start_col, block_idx, cal_days_in_m):
+def resolve_block_days(table, char_index, block_rows, start_row_idx, group_width, expected_start_col, block_idx, cal_days_in_m):
     combined_cells = [None] * 7
     day_numbers = [None] * 7
     explicit_day_numbers = [None] * 7
@@ -688,7 +1519,8 @@ def resolve_block_days(table, page, block_rows, start_row_idx, group_width, expe
         
         if not day_num:
             bbox = get_logical_cell_bbox(table, start_row_idx, col_idx, group_width)
-            day_num = extract_day_from_cell_style(page, bbox)
+            with profile_stage("cell_style_days"):
+                day_num = extract_day_from_cell_style(char_index, bbox)
         
         day_numbers[col_idx] = day_num
 
@@ -754,7 +1586,27 @@ def resolve_block_days(table, page, block_rows, start_row_idx, group_width, expe
 
     return combined_cells, day_numbers
 
-def create_entries_for_cell(cleaned_cell, base_day, year, month_num, month_name_raw):
+def get_block_cell_bbox(table, row_idxs, logical_col_idx, group_width):
+    x0 = None
+    top = None
+    x1 = None
+    bottom = None
+
+    for row_idx in row_idxs:
+        bbox = get_logical_cell_bbox(table, row_idx, logical_col_idx, group_width)
+        if not bbox:
+            continue
+        bx0, btop, bx1, bbottom = bbox
+        x0 = bx0 if x0 is None else min(x0, bx0)
+        top = btop if top is None else min(top, btop)
+        x1 = bx1 if x1 is None else max(x1, bx1)
+        bottom = bbottom if bottom is None else max(bottom, bbottom)
+
+    if None in (x0, top, x1, bottom):
+        return None
+    return [round(x0, 2), round(top, 2), round(x1, 2), round(bottom, 2)]
+
+def create_entries_for_cell(cleaned_cell, base_day, year, month_num, month_name_raw, bbox=None):
     if not cleaned_cell:
         return []
 
@@ -801,23 +1653,23 @@ def create_entries_for_cell(cleaned_cell, base_day, year, month_num, month_name_
         dd = f"{day_num:02d}"
         date_id = f"{mm}{dd}{yy}"
         
-        entries.append({
-            "Date": date_id,
-            "Year": year,
-            "Month": month_name_raw,
-            "Day": day_num,
-            "Raw Text": day_raw_text
-        })
+        entries.append(ReadingEntry(date_id, year, month_name_raw, day_num, day_raw_text, bbox))
         
     return entries
 
-def process_table_month(table, page, year, month_num, month_name_raw):
+def process_table_month(table, page, year, month_num, month_name_raw, char_index=None, extracted_rows=None):
     """
     Extracts readings from a single table if it matches the month structure.
     Returns a list of result dictionaries.
+    Pass a shared PageCharIndex when several tables come from the same page,
+    and extracted_rows when table.extract() has already been run.
     """
+    if char_index is None:
+        char_index = PageCharIndex(page)
     results = []
-    extracted_rows = table.extract() or []
+    if extracted_rows is None:
+        extracted_rows = table.extract()
+    extracted_rows = extracted_rows or []
     if not extracted_rows:
         return []
 
@@ -865,9 +1717,11 @@ def process_table_month(table, page, year, month_num, month_name_raw):
                 week_blocks.append(current_block)
             current_block = {
                 "start_row_idx": row_idx,
+                "row_idxs": [row_idx],
                 "rows": [row]
             }
         elif current_block:
+            current_block["row_idxs"].append(row_idx)
             current_block["rows"].append(row)
 
     if current_block:
@@ -897,25 +1751,33 @@ def process_table_month(table, page, year, month_num, month_name_raw):
 
     for block_idx, block in enumerate(week_blocks):
         combined_cells, day_numbers = resolve_block_days(
-            table, page, 
+            table, char_index, 
             block["rows"], block["start_row_idx"], 
             group_width, expected_start_col, 
             block_idx, cal_days_in_m
         )
 
         for col_idx in range(7):
+            if not combined_cells[col_idx]:
+                continue
             cell_entries = create_entries_for_cell(
                 combined_cells[col_idx], 
                 day_numbers[col_idx], 
-                year, month_num, month_name_raw
+                year, month_num, month_name_raw,
+                get_block_cell_bbox(table, block["row_idxs"], col_idx, group_width)
             )
             results.extend(cell_entries)
     
     return results
 
-def process_pdfs(root_dir):
-    results = []
-    
+def month_from_pdf_name(pdf_file):
+    parts = pdf_file.stem.split()
+    month_name_raw = parts[-1] if len(parts) > 1 else pdf_file.stem
+    return month_name_raw, MONTH_MAP.get(month_name_raw.lower())
+
+def collect_pdf_jobs(root_dir):
+    pdf_jobs = []
+
     root_path = Path(root_dir)
     # Ensure deterministic processing order
     for year_dir in sorted(root_path.glob("20*")):
@@ -923,48 +1785,462 @@ def process_pdfs(root_dir):
             continue
             
         year = year_dir.name
-        print(f"Processing year {year}...")
-        
         pdf_files = sorted(year_dir.glob("*.pdf"))
         for pdf_file in pdf_files:
-            print(f"  Processing file: {pdf_file.name}")
-            
-            parts = pdf_file.stem.split()
-            month_name_raw = parts[-1] if len(parts) > 1 else pdf_file.stem
-            month_num = MONTH_MAP.get(month_name_raw.lower())
-            
+            month_name_raw, month_num = month_from_pdf_name(pdf_file)
             if not month_num:
-                print(f"    Warning: Could not identify month from '{month_name_raw}'. Skipping.")
+                print(f"Warning: Could not identify month from '{month_name_raw}' ({year}/{pdf_file.name}). Skipping.")
                 continue
 
-            try:
-                with pdfplumber.open(pdf_file) as pdf:
-                    for page in pdf.pages:
-                        tables = page.find_tables()
-                        if not tables:
-                            continue
+            pdf_jobs.append((pdf_file, year, month_num, month_name_raw))
 
-                        for table in tables:
-                            table_results = process_table_month(table, page, year, month_num, month_name_raw)
-                            results.extend(table_results)
-                    # Table cell text already contains full daily content; no cross-cell merging needed.
+    # Month order (not just file-name order) so every month's PDFs are adjacent
+    # in the stream; entries can only share a (Year, Date) key within a month.
+    pdf_jobs.sort(key=lambda pdf_job: (pdf_job[1], pdf_job[2], pdf_job[0].name))
+    return pdf_jobs
 
-            except Exception as e:
-                print(f"    Error processing {pdf_file.name}: {e}")
+def release_page(page):
+    """
+    Drops everything pdfplumber cached for a page (layout, objects, chars,
+    edges and the text map) once its tables have been turned into entries.
+    """
+    page.flush_cache()
+    page.get_textmap.cache_clear()
 
-    deduped_results = dedupe_entries_by_date(results)
-    
-    final_results = []
-    for entry in deduped_results:
-        final_results.extend(detect_and_split_double_entry(entry))
+def extract_pdf_entries(pdf_file, year, month_num, month_name_raw, low_memory=False):
+    """
+    Runs table extraction for a single calendar PDF.
+    Returns (entries, ok) where entries are the raw (unenriched) entries in
+    page/table order and ok is False if the PDF could not be fully read.
+    With low_memory each page is released as soon as its tables are
+    processed instead of staying cached until the PDF is closed; only the
+    entries survive the page.
+    """
+    results = []
+    try:
+        with profile_stage("open"):
+            pdf = pdfplumber.open(pdf_file)
+        with pdf:
+            for page in pdf.pages:
+                with profile_stage("find_tables"):
+                    tables = page.find_tables()
+                if tables:
+                    char_index = PageCharIndex(page)
+                    for table in tables:
+                        with profile_stage("extract"):
+                            extracted_rows = table.extract()
+                        with profile_stage("day_resolution"):
+                            table_results = process_table_month(
+                                table, page, year, month_num, month_name_raw, char_index, extracted_rows
+                            )
+                        results.extend(table_results)
+                    # Tables and the glyph index hold references into the page
+                    del tables, char_index, table
+
+                if low_memory:
+                    release_page(page)
+                    gc.collect()
+            # Table cell text already contains full daily content; no cross-cell merging needed.
+
+    except Exception as e:
+        print(f"    Error processing {pdf_file.name}: {e}")
+        return results, False
+
+    return results, True
+
+def _extract_pdf_job(pdf_job, low_memory=False):
+    with profile_unit("pdfs", f"{pdf_job[1]}/{pdf_job[0].name}"):
+        return _run_pdf_job(pdf_job, low_memory)
+
+def _run_pdf_job(pdf_job, low_memory):
+    if not low_memory:
+        return extract_pdf_entries(*pdf_job)
+
+    rss_resettable = reset_peak_rss()
+    file_results, ok = extract_pdf_entries(*pdf_job, low_memory=True)
+    # Without a resettable watermark the figure is the peak of the whole process so far
+    peak_label = "peak RSS" if rss_resettable else "process peak RSS"
+    print(f"    {pdf_job[0].name}: {len(file_results)} entries, {peak_label} {format_bytes(peak_rss_bytes())}")
+    return file_results, ok
+
+def iter_pdf_results(pdf_jobs, jobs=1, low_memory=False):
+    """
+    Yields (entries, ok) for each PDF job, always in job order.
+    With jobs > 1 the files are spread across a process pool. At most two
+    jobs per worker are in flight, and results are handed back in
+    submission order, so the stream is identical to a serial run.
+    """
+    pdf_jobs = iter(pdf_jobs)
+    if jobs <= 1:
+        for pdf_job in pdf_jobs:
+            yield _extract_pdf_job(pdf_job, low_memory)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        in_flight = deque()
+        for pdf_job in pdf_jobs:
+            in_flight.append(executor.submit(_extract_pdf_job, pdf_job, low_memory))
+            if len(in_flight) >= jobs * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+@lru_cache(maxsize=None)
+def layout_cache_version():
+    """
+    Version of the extraction cache entries: PARSER_VERSION plus a digest of
+    LAYOUT_SOURCE_FILES and the pdfplumber version, so editing the layout
+    code invalidates the cache even when nobody bumps PARSER_VERSION.
+    """
+    source_dir = Path(__file__).resolve().parent
+    fingerprint = source_fingerprint([source_dir / name for name in LAYOUT_SOURCE_FILES],
+                                     [getattr(pdfplumber, "__version__", "")])
+    return f"{PARSER_VERSION}-{fingerprint}"
 
-    return [enrich_entry(entry) for entry in final_results]
+def iter_extracted_pdfs(pdf_jobs, jobs=1, cache_dir=None, low_memory=False):
+    """
+    Yields one raw entry list per PDF job (in job order), reusing cached
+    extractions for PDFs whose content hash and layout_cache_version() are unchanged.
+    Cached entries are only loaded when their turn in the stream comes.
+    """
+    content_hashes = [None] * len(pdf_jobs)
+    is_cached = [False] * len(pdf_jobs)
+    cache_version = layout_cache_version() if cache_dir else None
+
+    if cache_dir:
+        for job_idx, pdf_job in enumerate(pdf_jobs):
+            with profile_stage("cache"):
+                content_hashes[job_idx] = file_content_hash(pdf_job[0])
+                is_cached[job_idx] = cache_entry_path(cache_dir, cache_version, content_hashes[job_idx]).is_file()
+        cached_count = sum(is_cached)
+        print(f"Extraction cache: {cached_count} cached, {len(pdf_jobs) - cached_count} to extract")
+
+    pending_results = iter_pdf_results(
+        (pdf_job for pdf_job, cached in zip(pdf_jobs, is_cached) if not cached),
+        jobs,
+        low_memory
+    )
+
+    for job_idx, pdf_job in enumerate(pdf_jobs):
+        if is_cached[job_idx]:
+            with profile_stage("cache"):
+                cached_entries = load_cached_entries(cache_dir, cache_version, content_hashes[job_idx])
+            if cached_entries is not None:
+                yield [ReadingEntry.from_dict(entry) for entry in cached_entries]
+                continue
+            # Unreadable cache entry: fall back to extracting this PDF in-process
+            file_results, ok = _extract_pdf_job(pdf_job, low_memory)
+        else:
+            file_results, ok = next(pending_results)
+
+        # Never cache a partial extraction from a PDF that failed to read
+        if cache_dir and ok:
+            store_cached_entries(cache_dir, cache_version, content_hashes[job_idx], pdf_job[0].name,
+                                 [entry.layout_dict() for entry in file_results])
+        yield file_results
+
+def parse_raw_entries(raw_entries):
+    """
+    Parse stage: turns layout-stage entries into the final enriched rows.
+    Works purely on text, so it can be re-run from the raw cell file without
+    touching the PDFs.
+    """
+    with profile_stage("dedupe"):
+        deduped_results = dedupe_entries_by_date(raw_entries)
+        
+        final_results = []
+        for entry in deduped_results:
+            final_results.extend(detect_and_split_double_entry(resolve_stacked_cell(entry)))
+
+    with profile_stage("parse"):
+        return enrich_entries(final_results)
+
+def iter_layout_stage(root_dir, jobs=1, cache_dir=None, low_memory=False):
+    """
+    Layout stage: runs pdfplumber over every calendar PDF.
+    Yields (source_name, year, month_num, raw_entries) per PDF in month order.
+    """
+    root_path = Path(root_dir)
+    pdf_jobs = collect_pdf_jobs(root_path)
+    current_year = None
+    for pdf_job, file_results in zip(pdf_jobs, iter_extracted_pdfs(pdf_jobs, jobs, cache_dir, low_memory)):
+        pdf_file, year, month_num, _ = pdf_job
+        # Reported as the results arrive (in job order), not while the jobs are listed
+        if year != current_year:
+            current_year = year
+            print(f"Processing year {year}...")
+        print(f"  Processed file: {pdf_file.name} ({len(file_results)} entries)")
+        yield pdf_file.relative_to(root_path).as_posix(), year, month_num, file_results
+
+def iter_month_groups(layout_files):
+    """
+    Merges consecutive layout items of the same (year, month) into one entry
+    list. Every entry sharing a (Year, Date) key lands in the same group as
+    long as the stream is in month order, as iter_layout_stage produces.
+    """
+    current_key = None
+    current_entries = []
+    for _, year, month_num, file_results in layout_files:
+        key = (year, month_num)
+        if key != current_key and current_entries:
+            yield current_entries
+            current_entries = []
+        current_key = key
+        current_entries.extend(file_results)
+
+    if current_entries:
+        yield current_entries
+
+def iter_parsed_entries(layout_files):
+    """
+    Parse stage over a stream: dedupes, splits and enriches one month at a
+    time and yields the rows in final (csv_sort_key) order, so memory is
+    bounded by a single month of data.
+    """
+    for month_entries in iter_month_groups(layout_files):
+        first_entry = month_entries[0]
+        with profile_unit("months", f"{first_entry.year}-{str(first_entry.date or '')[:2]}"):
+            month_results = sorted(parse_raw_entries(month_entries), key=csv_sort_key)
+        yield from month_results
+
+def process_pdfs(root_dir, jobs=1, cache_dir=None, low_memory=False):
+    return list(iter_parsed_entries(iter_layout_stage(root_dir, jobs, cache_dir, low_memory)))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract daily readings from the monthly calendar PDFs.")
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to extract PDFs (0 = one per CPU, default: 1)."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(__file__).parent / DEFAULT_CACHE_DIRNAME,
+        help=f"Directory for the per-PDF extraction cache (default: calendars/{DEFAULT_CACHE_DIRNAME})."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Extract every PDF from scratch without reading or writing the cache."
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete the extraction cache before running (entries of other parser versions or layout code are pruned anyway)."
+    )
+    parser.add_argument(
+        "--stage",
+        choices=("all", "layout", "parse"),
+        default="all",
+        help="'layout' reads the PDFs and writes the raw cell file, 'parse' rebuilds the outputs "
+             "from the raw cell file without opening any PDF, 'all' reads the PDFs and writes the "
+             "outputs (default)."
+    )
+    parser.add_argument(
+        "--raw-cells",
+        type=Path,
+        help=f"Path of the intermediate raw cell file (default: calendars/{RAW_CELLS_FILENAME}). "
+             "With --stage all the raw cells are only written when this is given."
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Release each PDF page as soon as its tables are processed and report the peak RSS of every extracted file."
+    )
+    parser.add_argument(
+        "--profile-report",
+        type=Path,
+        help="Write a JSON report with wall time, call counts (and allocated bytes with --tracemalloc) "
+             "per pipeline stage, per PDF and per month. Forces --jobs 1."
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="Track allocated bytes per stage in the --profile-report (slows the run down noticeably)."
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        help="Write cProfile statistics for the whole run to this file (readable with pstats). Forces --jobs 1."
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / READINGS_DB_FILENAME,
+        help=f"Also write an indexed SQLite copy of the outputs (default path: calendars/{READINGS_DB_FILENAME}); "
+             "query it with readings_db.py."
+    )
+    parser.add_argument(
+        "--binary",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / READINGS_BINARY_FILENAME,
+        help=f"Also write the date-indexed, memory-mappable binary copy of the outputs "
+             f"(default path: calendars/{READINGS_BINARY_FILENAME}); read it with readings_binary.py."
+    )
+    parser.add_argument(
+        "--shards",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / SHARDS_DIRNAME,
+        help=f"Also write minified per-year JSON shards plus a manifest.json with their hashes "
+             f"into this directory (default: calendars/{SHARDS_DIRNAME})."
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_BY_CHOICES,
+        default="year",
+        help="Write one shard per year (default) or per month."
+    )
+    parser.add_argument(
+        "--passage-index",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / PASSAGE_INDEX_FILENAME,
+        help=f"Also write the scripture passage -> dates index (default path: calendars/{PASSAGE_INDEX_FILENAME}); "
+             "query it with passage_index.py."
+    )
+    parser.add_argument(
+        "--text-index",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / TEXT_INDEX_FILENAME,
+        help=f"Also write the full-text index of the titles, notes and raw text "
+             f"(default path: calendars/{TEXT_INDEX_FILENAME}); query it with text_index.py."
+    )
+    parser.add_argument(
+        "--ics",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / ICS_DIRNAME,
+        help=f"Also write iCalendar files (one per year plus {UPCOMING_FILENAME}) into this directory "
+             f"(default: calendars/{ICS_DIRNAME})."
+    )
+    parser.add_argument(
+        "--validate",
+        type=Path,
+        nargs="?",
+        const=Path(__file__).parent / VALIDATION_BASELINE_FILENAME,
+        metavar="BASELINE",
+        help="Check every Sunday against the computed Tone and Matins Gospel cycles and exit with status 1 "
+             f"on anomalies missing from the baseline (default: calendars/{VALIDATION_BASELINE_FILENAME}). "
+             "The outputs are written either way."
+    )
+    parser.add_argument(
+        "--diff-report",
+        type=Path,
+        help="Write the added/removed/modified (Year, Date) records of this run to a JSON file."
+    )
+    args = parser.parse_args(argv)
+    if args.tracemalloc and not args.profile_report:
+        parser.error("--tracemalloc requires --profile-report")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    if args.clear_cache and clear_cache(args.cache_dir):
+        print(f"Cleared extraction cache at {args.cache_dir}")
+    if cache_dir:
+        prune_stale_versions(cache_dir, layout_cache_version())
+
+    if (args.profile_report or args.cprofile) and jobs > 1:
+        # Stage timings and cProfile only see the current process
+        print("Profiling enabled: running with --jobs 1.")
+        jobs = 1
+
+    profiler = enable_profiling(args.tracemalloc) if args.profile_report else None
+    cprofiler = cProfile.Profile() if args.cprofile else None
+    if cprofiler:
+        cprofiler.enable()
+
+    try:
+        return run_pipeline(args, Path(__file__).parent, jobs, cache_dir)
+    finally:
+        if cprofiler:
+            cprofiler.disable()
+            cprofiler.dump_stats(args.cprofile)
+            print(f"Saved cProfile statistics to {args.cprofile}")
+        if profiler:
+            disable_profiling()
+            with open(args.profile_report, "w", encoding="utf-8") as f:
+                json.dump(profiler.report(), f, indent=2)
+            print(f"Saved profiling report to {args.profile_report}")
+
+def write_outputs(args, calendars_dir, sorted_data):
+    """Writes every requested output. Returns the process exit status (1 when validation failed)."""
+    validator = None
+    with contextlib.ExitStack() as stack:
+        row_writers = []
+        if args.validate:
+            validator = ReadingValidator()
+            row_writers.append(validator)
+        if args.sqlite:
+            row_writers.append(stack.enter_context(ReadingsDbWriter(args.sqlite)))
+        if args.binary:
+            row_writers.append(stack.enter_context(ReadingsBinaryWriter(args.binary)))
+        if args.shards:
+            row_writers.append(stack.enter_context(ShardedOutputWriter(args.shards, args.shard_by)))
+        if args.passage_index:
+            row_writers.append(stack.enter_context(PassageIndexWriter(args.passage_index)))
+        if args.text_index:
+            row_writers.append(stack.enter_context(TextIndexWriter(args.text_index)))
+        if args.ics:
+            row_writers.append(stack.enter_context(IcsExportWriter(args.ics)))
+        diff = write_output_files(calendars_dir, sorted_data, row_writers)
+    if args.sqlite:
+        print(f"Saved SQLite readings database to {args.sqlite}")
+    if args.binary:
+        print(f"Saved binary readings file to {args.binary}")
+    if args.shards:
+        print(f"Saved {args.shard_by} shards and {MANIFEST_FILENAME} to {args.shards}")
+    if args.passage_index:
+        print(f"Saved passage index to {args.passage_index}")
+    if args.text_index:
+        print(f"Saved full-text index to {args.text_index}")
+    if args.ics:
+        print(f"Saved iCalendar files to {args.ics}")
+    if args.diff_report:
+        with open(args.diff_report, "w", encoding="utf-8") as f:
+            json.dump(diff, f, indent=2)
+        print(f"Saved output diff report to {args.diff_report}")
+    if validator:
+        baseline_keys = load_baseline(args.validate)
+        print(format_validation_report(validator, baseline_keys))
+        if validator.new_anomalies(baseline_keys):
+            return 1
+    return 0
+
+def run_pipeline(args, calendars_dir, jobs, cache_dir):
+    status = 0
+    raw_cells_path = args.raw_cells or Path(calendars_dir) / RAW_CELLS_FILENAME
+    if args.stage == "parse":
+        raw_parser_version = read_raw_cells_parser_version(raw_cells_path)
+        if raw_parser_version != PARSER_VERSION:
+            print(f"Warning: {raw_cells_path} was written by parser version {raw_parser_version} "
+                  f"(current is {PARSER_VERSION}); re-run the layout stage if table logic changed.")
+        status = write_outputs(args, calendars_dir, iter_parsed_entries(iter_raw_cells(raw_cells_path)))
+    elif args.stage == "layout" or args.raw_cells:
+        with RawCellsWriter(raw_cells_path, PARSER_VERSION) as raw_cells_writer:
+            layout_files = raw_cells_writer.tee(iter_layout_stage(calendars_dir, jobs=jobs, cache_dir=cache_dir, low_memory=args.low_memory))
+            if args.stage == "layout":
+                for _ in layout_files:
+                    pass
+            else:
+                status = write_outputs(args, calendars_dir, iter_parsed_entries(layout_files))
+        print(f"Layout stage complete. Saved raw cells to {raw_cells_path}")
+    else:
+        layout_files = iter_layout_stage(calendars_dir, jobs=jobs, cache_dir=cache_dir, low_memory=args.low_memory)
+        status = write_outputs(args, calendars_dir, iter_parsed_entries(layout_files))
 
-def main():
-    calendars_dir = Path(__file__).parent
-    data = process_pdfs(calendars_dir)
-    sorted_data = sorted(data, key=csv_sort_key)
-    write_output_files(calendars_dir, sorted_data)
+    if args.stage != "layout":
+        report_parse_cache_stats()
+    return status
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+DEFAULT_CACHE_DIRNAME = ".extraction_cache"
+
+def file_content_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def source_fingerprint(paths, extra=()):
+    """
+    Short digest of the given source files and extra strings (library
+    versions), for cache versions that follow the code producing the entries.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(file_content_hash(path).encode("ascii"))
+    for value in extra:
+        digest.update(str(value).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+def cache_entry_path(cache_dir, parser_version, content_hash):
+    # One sub-directory per parser version, so a new version never reads stale entries
+    return Path(cache_dir) / f"v{parser_version}" / f"{content_hash}.json"
+
+def load_cached_entries(cache_dir, parser_version, content_hash):
+    path = cache_entry_path(cache_dir, parser_version, content_hash)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if payload.get("parser_version") != parser_version or payload.get("content_hash") != content_hash:
+        return None
+    return payload.get("entries")
+
+def store_cached_entries(cache_dir, parser_version, content_hash, source_name, entries):
+    path = cache_entry_path(cache_dir, parser_version, content_hash)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {
+        "parser_version": parser_version,
+        "content_hash": content_hash,
+        "source": source_name,
+        "entries": entries
+    }
+
+    # Write to a temp file first so an interrupted run never leaves a truncated cache entry
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        # mkstemp creates the file owner-only; give it normal file permissions
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except Exception:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+def prune_stale_versions(cache_dir, parser_version):
+    cache_path = Path(cache_dir)
+    if not cache_path.is_dir():
+        return 0
+
+    removed = 0
+    for version_dir in cache_path.iterdir():
+        if version_dir.is_dir() and version_dir.name != f"v{parser_version}":
+            shutil.rmtree(version_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+def clear_cache(cache_dir):
+    cache_path = Path(cache_dir)
+    if cache_path.is_dir():
+        shutil.rmtree(cache_path)
+        return True
+    return False
@@ -1,52 +1,211 @@
+"""
+Coverage report of the extracted readings.
+
+The dates of every row are read once as day ordinals, the gaps between
+them are collapsed into ranges (split at month boundaries) and every range
+is reported under its year and month together with the calendar PDF that
+should have supplied it:
+
+    python find_missing_dates.py
+    python find_missing_dates.py --source sqlite
+    python find_missing_dates.py --source shards --years 2025 2026
+
+The indexed outputs are read without decoding the rows: readings.bin from
+its day index, readings.sqlite with a single DISTINCT query, and the
+shards one at a time.
+"""
+import argparse
+import calendar
 import json
-from datetime import datetime, timedelta
-import os
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+from reading_schema import entry_date
+from readings_binary import READINGS_BINARY_FILENAME, ReadingsBinary
+from readings_db import READINGS_DB_FILENAME
+from readings_shards import SHARDS_DIRNAME, iter_sharded_readings
+from rename_pdfs import MONTH_MAP
+
+COVERAGE_SOURCES = ("json", "binary", "sqlite", "shards")
+DEFAULT_SOURCE_PATHS = {
+    "json": "extracted_readings.json",
+    "binary": READINGS_BINARY_FILENAME,
+    "sqlite": READINGS_DB_FILENAME,
+    "shards": SHARDS_DIRNAME,
+}
+
+def iter_row_ordinals(rows):
+    for row in rows:
+        try:
+            yield entry_date(row).toordinal()
+        except (KeyError, TypeError, ValueError):
+            print(f"Warning: Could not parse date: {row.get('Date')}")
+
+def iter_json_ordinals(path):
+    with open(path, "r", encoding="utf-8") as f:
+        yield from iter_row_ordinals(json.load(f))
+
+def iter_binary_ordinals(path):
+    # A day slot with records is a covered day; the records are never decoded
+    with ReadingsBinary(path) as readings:
+        for slot_idx in range(readings.day_count):
+            ordinal = readings.first_ordinal + slot_idx
+            if readings.day_slot(date.fromordinal(ordinal))[1]:
+                yield ordinal
+
+def iter_sqlite_ordinals(path):
+    # A read-only connect to a missing file fails with OperationalError; report it like the other sources
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Readings database not found at {path}")
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        for (iso_date,) in conn.execute("SELECT DISTINCT iso_date FROM readings"):
+            yield date.fromisoformat(iso_date).toordinal()
+    finally:
+        conn.close()
+
+def iter_shard_ordinals(path, years=None):
+    return iter_row_ordinals(iter_sharded_readings(path, years))
 
-def check_missing_dates(json_path):
+def iter_source_ordinals(source, path, years=None):
+    if source == "json":
+        return iter_json_ordinals(path)
+    if source == "binary":
+        return iter_binary_ordinals(path)
+    if source == "sqlite":
+        return iter_sqlite_ordinals(path)
+    if source == "shards":
+        return iter_shard_ordinals(path, years)
+    raise ValueError(f"source must be one of {COVERAGE_SOURCES}")
+
+def expected_pdf_name(year, month):
+    """Calendar PDF of a month, as named by get_calendars.sh and rename_pdfs.py."""
+    month_name = calendar.month_name[month]
+    return f"{year}/{MONTH_MAP[month_name.lower()]} Calendar {year} {month_name}.pdf"
+
+def missing_ranges(ordinals, first_ordinal, last_ordinal):
+    """
+    (start, end) ordinals of the days between first_ordinal and
+    last_ordinal (inclusive) missing from ordinals, one range per
+    uninterrupted gap within a month.
+    """
+    ranges = []
+    expected = first_ordinal
+    for ordinal in sorted(set(ordinals)):
+        if ordinal > last_ordinal:
+            break
+        if ordinal > expected:
+            ranges.append((expected, ordinal - 1))
+        expected = max(expected, ordinal + 1)
+    if expected <= last_ordinal:
+        ranges.append((expected, last_ordinal))
+
+    split = []
+    for start, end in ranges:
+        while start <= end:
+            start_date = date.fromordinal(start)
+            month_end = date(start_date.year, start_date.month,
+                             calendar.monthrange(start_date.year, start_date.month)[1]).toordinal()
+            split.append((start, min(end, month_end)))
+            start = month_end + 1
+    return split
+
+def coverage_report(ordinals, first=None, last=None, calendars_dir=None, years=None):
+    """
+    Coverage of the given day ordinals from first to last (dates; by
+    default January 1st of the first and December 31st of the last year
+    present, or the given years). Every gap lists the PDF expected to
+    cover it and whether that file exists under calendars_dir.
+    """
+    present = sorted(set(ordinals))
+    if years:
+        first = first or date(min(years), 1, 1)
+        last = last or date(max(years), 12, 31)
+    if not present and (first is None or last is None):
+        return None
+    first = first or date(date.fromordinal(present[0]).year, 1, 1)
+    last = last or date(date.fromordinal(present[-1]).year, 12, 31)
+    first_ordinal, last_ordinal = first.toordinal(), last.toordinal()
+    calendars_dir = Path(calendars_dir) if calendars_dir else Path(__file__).parent
+
+    gaps = []
+    for start, end in missing_ranges(present, first_ordinal, last_ordinal):
+        start_date, end_date = date.fromordinal(start), date.fromordinal(end)
+        pdf_name = expected_pdf_name(start_date.year, start_date.month)
+        gaps.append({
+            "year": start_date.year,
+            "month": start_date.month,
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
+            "days": end - start + 1,
+            "pdf": pdf_name,
+            "pdf_exists": (calendars_dir / pdf_name).exists(),
+        })
+
+    total_days = last_ordinal - first_ordinal + 1
+    missing_days = sum(gap["days"] for gap in gaps)
+    return {
+        "first_date": first.isoformat(),
+        "last_date": last.isoformat(),
+        "days": total_days,
+        "covered_days": total_days - missing_days,
+        "missing_days": missing_days,
+        "gaps": gaps,
+    }
+
+def format_coverage_report(report):
+    if report is None:
+        return "No valid dates found."
+    lines = [
+        f"Coverage {report['first_date']} to {report['last_date']}: {report['covered_days']} of {report['days']} days"
+        f" ({report['covered_days'] / report['days'] * 100:.1f}%)"
+    ]
+    if not report["gaps"]:
+        lines.append("No missing dates found in the range.")
+        return "\n".join(lines)
+
+    lines[0] += f", {report['missing_days']} missing in {len(report['gaps'])} ranges"
+    year = month = None
+    for gap in report["gaps"]:
+        if gap["year"] != year:
+            year, month = gap["year"], None
+            lines.append(f"  {year}: {sum(g['days'] for g in report['gaps'] if g['year'] == year)} missing days")
+        if gap["month"] != month:
+            month = gap["month"]
+            status = "present, re-check its extraction" if gap["pdf_exists"] else "not downloaded"
+            lines.append(f"    {calendar.month_name[month]} ({gap['pdf']}: {status})")
+        span = gap["start"] if gap["days"] == 1 else f"{gap['start']} .. {gap['end']}"
+        lines.append(f"      {span} ({gap['days']} day{'s' if gap['days'] > 1 else ''})")
+    return "\n".join(lines)
+
+def check_missing_dates(json_path, source="json", years=None):
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        report = coverage_report(iter_source_ordinals(source, json_path, years), years=years,
+                                 calendars_dir=Path(__file__).parent)
     except FileNotFoundError:
         print(f"Error: File not found at {json_path}")
-        return
-
-    dates_present = set()
-    
-    for entry in data:
-        date_str = entry.get("Date")
-        if date_str:
-            try:
-                # The format seems to be MMDDYY based on "010124"
-                date_obj = datetime.strptime(date_str, "%m%d%y").date()
-                dates_present.add(date_obj)
-            except ValueError:
-                print(f"Warning: Could not parse date: {date_str}")
-                continue
-
-    if not dates_present:
-        print("No valid dates found in the file.")
-        return
-
-    min_date = min(dates_present)
-    max_date = max(dates_present)
-    
-    print(f"Checking range from {min_date} to {max_date}")
-    
-    current_date = min_date
-    missing_dates = []
-    
-    while current_date <= max_date:
-        if current_date not in dates_present:
-            missing_dates.append(current_date)
-        current_date += timedelta(days=1)
-        
-    if missing_dates:
-        print(f"Found {len(missing_dates)} missing dates:")
-        for d in missing_dates:
-            print(d.strftime('%Y-%m-%d'))
-    else:
-        print("No missing dates found in the range.")
+        return None
+    print(format_coverage_report(report))
+    return report
+
+def main(argv=None):
+    calendars_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Report the dates missing from the extracted readings.")
+    parser.add_argument("--source", choices=COVERAGE_SOURCES, default="json",
+                        help="Output to read the dates from (default: json).")
+    parser.add_argument("--path", type=Path,
+                        help="Path of that output (default: its usual location in calendars/).")
+    parser.add_argument("--years", type=int, nargs="+", help="Only check these years (the whole years are checked).")
+    parser.add_argument("--json-report", type=Path, help="Also write the report as JSON to this file.")
+    args = parser.parse_args(argv)
+
+    path = args.path or calendars_dir / DEFAULT_SOURCE_PATHS[args.source]
+    report = check_missing_dates(path, args.source, args.years)
+    if report is not None and args.json_report:
+        with open(args.json_report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
 
 if __name__ == "__main__":
-    json_file = os.path.join(os.path.dirname(__file__), 'extracted_readings.json')
-    check_missing_dates(json_file)
+    main()
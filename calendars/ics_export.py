@@ -0,0 +1,243 @@
+"""
+iCalendar (RFC 5545) export of the readings.
+
+Rows are turned into one all-day VEVENT per date as they are written and
+each event goes straight to disk, so only the rows of the current date
+are held in memory. IcsExportWriter writes one readings-YYYY.ics per year
+plus readings-upcoming.ics, a rolling window around today meant for
+calendar subscriptions:
+
+    python ics_export.py
+    python ics_export.py --years 2025 2026 --window 7 90
+    python ics_export.py --shards shards --output-dir ics
+
+Several rows on one date (double entries) become one event whose
+description lists each of them. An event's DTSTAMP is its own date at
+midnight UTC unless a build stamp is given, so unchanged rows give
+byte-identical year files; readings-upcoming.ics still changes as today
+moves its window.
+"""
+import argparse
+import contextlib
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from output_diff import ChangeAwareOutput
+from reading_schema import entry_date
+from readings_shards import iter_sharded_readings
+
+ICS_DIRNAME = "ics"
+UPCOMING_FILENAME = "readings-upcoming.ics"
+# Days before and after today covered by readings-upcoming.ics
+DEFAULT_WINDOW = (30, 365)
+PRODID = "-//Byzantine Liturgy Readings//Calendar Export//EN"
+CALENDAR_NAME = "Byzantine Liturgy Readings"
+UID_DOMAIN = "byzantine-liturgy-readings"
+MAX_LINE_OCTETS = 75
+CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+def year_filename(year):
+    return f"readings-{year}.ics"
+
+def escape_text(value):
+    """TEXT value escaping of RFC 5545 section 3.3.11."""
+    return (str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+def fold_line(line):
+    """Content line folded at 75 octets (section 3.1) without splitting a UTF-8 character, plus CRLF."""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    current = []
+    current_octets = 0
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        char_octets = len(char.encode("utf-8"))
+        if current_octets + char_octets > limit:
+            parts.append("".join(current))
+            current, current_octets = [], 0
+            # The leading space of a continuation line counts towards its 75 octets
+            limit = MAX_LINE_OCTETS - 1
+        current.append(char)
+        current_octets += char_octets
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+def calendar_header(name):
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+    return "".join(fold_line(line) for line in lines)
+
+def _summary(row):
+    title = " ".join((row.get("Title") or "").split())
+    if title:
+        return title
+    return f"Tone {row['Tone']}" if row.get("Tone") else "Daily readings"
+
+def _row_description(row):
+    lines = []
+    if row.get("Epistle"):
+        lines.append(f"Epistle: {row['Epistle']}")
+    if row.get("Gospel"):
+        lines.append(f"Gospel: {row['Gospel']}")
+    if row.get("Tone"):
+        tone = f"Tone {row['Tone']}"
+        if row.get("Matins Gospel"):
+            tone += f", Matins Gospel {row['Matins Gospel']}"
+        lines.append(tone)
+    if row.get("Fasting"):
+        lines.append(f"Fasting: {row['Fasting']}")
+    if row.get("Notes"):
+        lines.append(row["Notes"])
+    return "\n".join(lines)
+
+def event_description(rows):
+    if len(rows) == 1:
+        return _row_description(rows[0])
+    # Double entries: one block per row, headed by its title
+    return "\n\n".join(f"{_summary(row)}\n{_row_description(row)}".strip() for row in rows)
+
+def event_dtstamp(day):
+    """Default DTSTAMP of an event: midnight UTC of its date, fixed for a given row."""
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+def format_event(day, rows, dtstamp=None):
+    """VEVENT of the rows of one date; dtstamp is an aware UTC datetime (default: event_dtstamp(day))."""
+    dtstamp = dtstamp or event_dtstamp(day)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{day:%Y%m%d}@{UID_DOMAIN}",
+        f"DTSTAMP:{dtstamp:%Y%m%dT%H%M%SZ}",
+        f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+        f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+        f"SUMMARY:{escape_text(_summary(rows[0]))}",
+    ]
+    description = event_description(rows)
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if any(row.get("Holy Day of Obligation") for row in rows):
+        lines.append("CATEGORIES:Holy Day of Obligation")
+    lines.append("TRANSP:TRANSPARENT")
+    lines.append("END:VEVENT")
+    return "".join(fold_line(line) for line in lines)
+
+class IcsExportWriter:
+    """
+    Row writer (see write_output_files). Rows must arrive in date order.
+    A year's file is opened with its first row and committed as soon as the
+    next year starts; every file replaces its previous version atomically,
+    and only when its content changed.
+    """
+
+    def __init__(self, output_dir, years=None, window=DEFAULT_WINDOW, today=None, dtstamp=None):
+        self.output_dir = Path(output_dir)
+        self.years = None if years is None else {int(year) for year in years}
+        today = today or date.today()
+        self.window = None if window is None else (today - timedelta(days=window[0]), today + timedelta(days=window[1]))
+        self.dtstamp = dtstamp
+        self.files = []
+        self.event_count = 0
+        self._outputs = contextlib.ExitStack()
+        self._year = None
+        self._year_output = None
+        self._upcoming_output = None
+        self._day = None
+        self._day_rows = []
+
+    def __enter__(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.window:
+            self._upcoming_output = self._open(UPCOMING_FILENAME, f"{CALENDAR_NAME} (upcoming)")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Closing the stack discards whatever was not committed, so an error keeps the old files
+        with self._outputs:
+            if exc_type is None:
+                self._flush_day()
+                self._close_year()
+                if self._upcoming_output:
+                    self._commit(self._upcoming_output)
+        return False
+
+    def _open(self, filename, name):
+        output = self._outputs.enter_context(ChangeAwareOutput(self.output_dir / filename, newline=""))
+        output.write(calendar_header(name))
+        return output
+
+    def _commit(self, output):
+        output.write(CALENDAR_FOOTER)
+        output.commit()
+        self.files.append(output.path)
+
+    def _close_year(self):
+        if self._year_output:
+            self._commit(self._year_output)
+            self._year_output = None
+
+    def _flush_day(self):
+        if not self._day_rows:
+            return
+        day = self._day
+        in_years = self.years is None or day.year in self.years
+        in_window = self.window is not None and self.window[0] <= day <= self.window[1]
+        if in_years or in_window:
+            event = format_event(day, self._day_rows, self.dtstamp)
+            if in_years:
+                if day.year != self._year:
+                    self._close_year()
+                    self._year = day.year
+                    self._year_output = self._open(year_filename(day.year), f"{CALENDAR_NAME} {day.year}")
+                self._year_output.write(event)
+            if in_window:
+                self._upcoming_output.write(event)
+            self.event_count += 1
+        self._day_rows = []
+
+    def write_row(self, row):
+        day = entry_date(row)
+        if day != self._day:
+            self._flush_day()
+            self._day = day
+        self._day_rows.append(row)
+
+def export_ics(rows, output_dir, years=None, window=DEFAULT_WINDOW, today=None, dtstamp=None):
+    with IcsExportWriter(output_dir, years, window, today, dtstamp) as writer:
+        for row in rows:
+            writer.write_row(row)
+    return writer
+
+def main(argv=None):
+    calendars_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Export the readings as iCalendar (.ics) files.")
+    parser.add_argument("--readings", type=Path, default=calendars_dir / "extracted_readings.json",
+                        help="Readings to export (default: calendars/extracted_readings.json).")
+    parser.add_argument("--shards", type=Path,
+                        help="Read the rows from a shards directory instead, one shard at a time.")
+    parser.add_argument("--output-dir", type=Path, default=calendars_dir / ICS_DIRNAME,
+                        help=f"Directory of the .ics files (default: calendars/{ICS_DIRNAME}).")
+    parser.add_argument("--years", type=int, nargs="+", help="Only write the files of these years (default: all).")
+    parser.add_argument("--window", type=int, nargs=2, metavar=("DAYS_BACK", "DAYS_AHEAD"), default=DEFAULT_WINDOW,
+                        help=f"Span of {UPCOMING_FILENAME} around today (default: {DEFAULT_WINDOW[0]} {DEFAULT_WINDOW[1]}).")
+    parser.add_argument("--no-window", action="store_true", help=f"Do not write {UPCOMING_FILENAME}.")
+    args = parser.parse_args(argv)
+
+    if args.shards:
+        # The rolling window can reach into any year, so only skip shards when it is off
+        rows = iter_sharded_readings(args.shards, args.years if args.no_window else None)
+    else:
+        with open(args.readings, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+    writer = export_ics(rows, args.output_dir, args.years, None if args.no_window else args.window)
+    print(f"Exported {writer.event_count} events to {len(writer.files)} files in {args.output_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Computed lectionary for years without calendar PDFs.
+
+Everything here follows from the date of Pascha: the Triodion and Lenten
+Sundays, Holy Week, the Paschal season up to All Saints, the numbering of
+the Sundays after Pentecost, the 8-week Tone rotation (Tone 1 on Thomas
+Sunday) and the 11-week cycle of Resurrection Matins Gospels (Gospel 1 on
+All Saints Sunday). Rows come out in the same schema as enrich_entry(), and
+PDF rows win for every date they cover:
+
+    python lectionary.py 2027 2030
+    python lectionary.py 2024 2030 --merge extracted_readings.json --output projected_readings.json
+
+Fixed-date feasts, fasting rules and the Lukan Gospel jump after the
+Exaltation of the Cross are not computed; those only come from the PDFs.
+"""
+import argparse
+import calendar
+import json
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from reading_schema import READING_FIELDS, date_key, entry_date
+from scripture_refs import parse_reference, resurrection_gospel_ranges
+
+# Moveable days as (offset from Pascha, title, epistle, gospel, holy day of obligation)
+PASCHAL_CYCLE_DAYS = (
+    (-77, "Sunday of Zacchaeus", "1 Tim 4:9-15", "Luke 19:1-10", True),
+    (-70, "Sunday of the Publican and the Pharisee. Beginning of the Triodion", "2 Tim 3:10-15", "Luke 18:10-14", True),
+    (-63, "Sunday of the Prodigal Son", "1 Cor 6:12-20", "Luke 15:11-32", True),
+    (-56, "Meat-Fare Sunday: Sunday of the Last Judgement", "1 Cor 8:8-9:2", "Matt 25:31-46", True),
+    (-49, "Cheese-Fare Sunday: Forgiveness Sunday", "Rom 13:11-14:4", "Matt 6:14-21", True),
+    (-48, "Clean Monday. Beginning of Great Lent", None, None, False),
+    (-42, "1st Sunday of Lent: Sunday of Orthodoxy", "Heb 11:24-26, 32-12:2", "John 1:43-51", True),
+    (-35, "2nd Sunday of Lent: Gregory Palamas", "Heb 1:10-2:3", "Mark 2:1-12", True),
+    (-28, "3rd Sunday of Lent: Veneration of the Holy Cross", "Heb 4:14-5:6", "Mark 8:34-9:1", True),
+    (-21, "4th Sunday of Lent: Ven. Father John of the Ladder", "Heb 6:13-20", "Mark 9:17-32", True),
+    (-14, "5th Sunday of Lent: Ven. Mother Mary of Egypt", "Heb 9:11-14", "Mark 10:32-45", True),
+    (-8, "Lazarus Saturday", "Heb 12:28-13:8", "John 11:1-45", False),
+    (-7, "Palm Sunday. Begin Holy Week", "Phil 4:4-9", "John 12:1-18", True),
+    (-3, "Great and Holy Thursday", None, None, False),
+    (-2, "Great and Holy Friday", None, None, False),
+    (-1, "Great and Holy Saturday", None, None, False),
+    (0, "Resurrection of Our Lord (Pascha)", "Acts 1:1-8", "John 1:1-17", True),
+    (1, "Bright Monday", None, None, False),
+    (7, "Thomas Sunday (2nd Sunday of Easter)", "Acts 5:12-20", "John 20:19-31", True),
+    (14, "Sunday of the Myrrh-Bearing Women (3rd Sunday of Easter)", "Acts 6:1-7", "Mark 15:43-16:8", True),
+    (21, "Sunday of the Paralytic (4th Sunday of Easter)", "Acts 9:32-42", "John 5:1-15", True),
+    (24, "Mid-Pentecost", None, None, False),
+    (28, "Sunday of the Samaritan Woman (5th Sunday of Easter)", "Acts 11:19-30", "John 4:5-42", True),
+    (35, "Sunday of the Man Born Blind (6th Sunday of Easter)", "Acts 16:16-34", "John 9:1-38", True),
+    (39, "Ascension of the Lord", "Acts 1:1-12", "Luke 24:36-53", True),
+    (42, "Fathers of the 1st Ecumenical Council of Nicaea (7th Sunday of Easter)", "Acts 20:16-18, 28-36", "John 17:1-13", True),
+    (49, "Pentecost Sunday", "Acts 2:1-11", "John 7:37-8:12", True),
+    (50, "Monday of the Holy Spirit", None, None, False),
+    (56, "1st Sunday after Pentecost: Sunday of All Saints", "Heb 11:33-12:2", "Matt 10:32-33, 37-38; 19:27-30", True),
+)
+PASCHAL_CYCLE_BY_OFFSET = {day[0]: day[1:] for day in PASCHAL_CYCLE_DAYS}
+FIRST_PASCHAL_CYCLE_OFFSET = PASCHAL_CYCLE_DAYS[0][0]
+
+# (epistle, gospel) of the 2nd to 17th Sundays after Pentecost
+SUNDAYS_AFTER_PENTECOST = {
+    2: ("Rom 2:10-16", "Matt 4:18-23"),
+    3: ("Rom 5:1-10", "Matt 6:22-33"),
+    4: ("Rom 6:18-23", "Matt 8:5-13"),
+    5: ("Rom 10:1-10", "Matt 8:28-9:1"),
+    6: ("Rom 12:6-14", "Matt 9:1-8"),
+    7: ("Rom 15:1-7", "Matt 9:27-35"),
+    8: ("1 Cor 1:10-17", "Matt 14:14-21"),
+    9: ("1 Cor 3:9-16", "Matt 14:22-34"),
+    10: ("1 Cor 4:9-16", "Matt 17:14-23"),
+    11: ("1 Cor 9:2-12", "Matt 18:23-35"),
+    12: ("1 Cor 15:1-11", "Matt 19:16-26"),
+    13: ("1 Cor 16:13-24", "Matt 21:33-42"),
+    14: ("2 Cor 1:21-2:4", "Matt 22:2-14"),
+    15: ("2 Cor 4:6-15", "Matt 22:35-46"),
+    16: ("2 Cor 6:1-10", "Matt 25:14-30"),
+    17: ("2 Cor 6:16-7:1", "Matt 15:21-28"),
+}
+
+# Resurrection Gospels of the Sundays of Easter (weeks after Pascha); Pascha and Pentecost have none
+PASCHAL_SEASON_MATINS_GOSPELS = {1: 1, 2: 4, 3: 5, 4: 7, 5: 8, 6: 10}
+PENTECOST_WEEK = 7
+ALL_SAINTS_WEEK = 8
+
+def gregorian_pascha(year):
+    """Western computus (anonymous Gregorian algorithm), as kept by the calendars."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def julian_pascha(year):
+    """Orthodox Pascha (Julian computus) as a Gregorian date."""
+    a, b, c = year % 4, year % 7, year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    month, day = divmod(d + e + 114, 31)
+    julian_offset = year // 100 - year // 400 - 2
+    return date(year, month, day + 1) + timedelta(days=julian_offset)
+
+PASCHA_FUNCTIONS = {"gregorian": gregorian_pascha, "julian": julian_pascha}
+
+ORDINAL_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
+
+def ordinal(number):
+    if 10 <= number % 100 <= 20:
+        return f"{number}th"
+    return f"{number}{ORDINAL_SUFFIXES.get(number % 10, 'th')}"
+
+def sunday_tone(weeks_after_pascha):
+    """Tone of the Sunday this many weeks after Pascha (Tone 1 on Thomas Sunday), None on Pascha and Pentecost."""
+    if weeks_after_pascha <= 0 or weeks_after_pascha == PENTECOST_WEEK:
+        return None
+    return (weeks_after_pascha - 1) % 8 + 1
+
+def sunday_matins_gospel(weeks_after_pascha):
+    """Resurrection Matins Gospel number of the Sunday this many weeks after Pascha."""
+    if weeks_after_pascha < ALL_SAINTS_WEEK:
+        return PASCHAL_SEASON_MATINS_GOSPELS.get(weeks_after_pascha)
+    return (weeks_after_pascha - ALL_SAINTS_WEEK) % 11 + 1
+
+class PaschaTable:
+    """Pascha dates by year, computed once per year."""
+
+    def __init__(self, reckoning="gregorian"):
+        self._pascha = PASCHA_FUNCTIONS[reckoning]
+        self._dates = {}
+
+    def __call__(self, year):
+        pascha = self._dates.get(year)
+        if pascha is None:
+            pascha = self._dates[year] = self._pascha(year)
+        return pascha
+
+    def previous(self, day):
+        """Pascha on or before day, i.e. the start of the Paschal year it belongs to."""
+        pascha = self(day.year)
+        return pascha if pascha <= day else self(day.year - 1)
+
+def _raw_text(day, title, tone, matins_gospel, epistle, gospel):
+    lines = [str(day.day)]
+    if title:
+        lines.append(title)
+    if tone:
+        lines.append(f"Tone {tone}, Res. Gospel {matins_gospel}" if matins_gospel else f"Tone {tone}")
+    if epistle or gospel:
+        lines.append("; ".join(part for part in (f"Epistle: {epistle}" if epistle else None,
+                                                 f"Gospel: {gospel}" if gospel else None) if part))
+    return "\n".join(lines)
+
+def computed_entry(day, pascha_table):
+    """Entry for one date in the enrich_entry() schema."""
+    previous_pascha = pascha_table.previous(day)
+    next_offset = (day - pascha_table(previous_pascha.year + 1)).days
+    offset = (day - previous_pascha).days
+
+    title = epistle = gospel = None
+    holy_day = day.weekday() == 6
+    special = PASCHAL_CYCLE_BY_OFFSET.get(next_offset) if next_offset >= FIRST_PASCHAL_CYCLE_OFFSET else None
+    if special is None:
+        special = PASCHAL_CYCLE_BY_OFFSET.get(offset)
+    if special:
+        title, epistle, gospel, holy_day = special
+    elif day.weekday() == 6:
+        after_pentecost = offset // 7 - PENTECOST_WEEK
+        title = f"{ordinal(after_pentecost)} Sunday after Pentecost"
+        epistle, gospel = SUNDAYS_AFTER_PENTECOST.get(after_pentecost, (None, None))
+
+    tone = matins_gospel = None
+    if day.weekday() == 6:
+        tone = sunday_tone(offset // 7)
+        matins_gospel = sunday_matins_gospel(offset // 7)
+    tone = str(tone) if tone else None
+    matins_gospel = str(matins_gospel) if matins_gospel else None
+
+    values = {
+        "Date": date_key(day),
+        "Year": str(day.year),
+        "Month": calendar.month_name[day.month],
+        "Day": day.day,
+        "Raw Text": _raw_text(day, title, tone, matins_gospel, epistle, gospel),
+        "Title": title,
+        "Tone": tone,
+        "Matins Gospel": matins_gospel,
+        "Matins Gospel Ranges": resurrection_gospel_ranges(matins_gospel) or None,
+        "Epistle": epistle,
+        "Epistle Ranges": parse_reference(epistle) or None,
+        "Gospel": gospel,
+        "Gospel Ranges": parse_reference(gospel) or None,
+        "Fasting": None,
+        "Notes": None,
+        "Canada Holiday": None,
+        "USA Holiday": None,
+        "Holy Day of Obligation": holy_day,
+    }
+    return {field: values[field] for field in READING_FIELDS}
+
+def iter_computed_entries(first_year, last_year, reckoning="gregorian"):
+    """One computed entry per day from January 1st of first_year to December 31st of last_year."""
+    pascha_table = PaschaTable(reckoning)
+    day = date(first_year, 1, 1)
+    end = date(last_year, 12, 31)
+    one_day = timedelta(days=1)
+    while day <= end:
+        yield computed_entry(day, pascha_table)
+        day += one_day
+
+def merge_with_extracted(computed_rows, extracted_rows):
+    """
+    Computed rows with every date that has extracted (PDF) rows replaced by
+    those rows, in date order. Extracted dates outside the computed range
+    are kept as well.
+    """
+    extracted_by_date = {}
+    for row in extracted_rows:
+        extracted_by_date.setdefault(entry_date(row), []).append(row)
+
+    merged = []
+    for row in computed_rows:
+        row_date = entry_date(row)
+        if row_date in extracted_by_date:
+            merged.extend(extracted_by_date.pop(row_date))
+        else:
+            merged.append(row)
+    for rows in extracted_by_date.values():
+        merged.extend(rows)
+    # Stable, so double entries keep their order
+    merged.sort(key=entry_date)
+    return merged
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the moveable-cycle lectionary for a range of years.")
+    parser.add_argument("first_year", type=int)
+    parser.add_argument("last_year", type=int, nargs="?", help="Last year (default: first_year).")
+    parser.add_argument("--merge", type=Path, metavar="JSON",
+                        help="Extracted readings whose dates override the computed ones (e.g. extracted_readings.json).")
+    parser.add_argument("--output", type=Path, help="Write the rows to this JSON file instead of printing a summary.")
+    parser.add_argument("--reckoning", choices=tuple(PASCHA_FUNCTIONS), default="gregorian",
+                        help="Pascha computus (default: gregorian, as in the calendars).")
+    args = parser.parse_args(argv)
+    last_year = args.last_year or args.first_year
+
+    start = time.perf_counter()
+    rows = list(iter_computed_entries(args.first_year, last_year, args.reckoning))
+    elapsed = time.perf_counter() - start
+    if args.merge:
+        with open(args.merge, "r", encoding="utf-8") as f:
+            rows = merge_with_extracted(rows, json.load(f))
+    print(f"Computed {args.first_year}-{last_year} in {elapsed * 1000:.1f} ms ({len(rows)} rows)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+        print(f"Saved to {args.output}")
+        return
+
+    for year in range(args.first_year, last_year + 1):
+        print(f"  {year}: Pascha {PASCHA_FUNCTIONS[args.reckoning](year).isoformat()}")
+
+if __name__ == "__main__":
+    main()
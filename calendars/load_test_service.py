@@ -0,0 +1,131 @@
+"""
+Load test for readings_service.py.
+
+Sends requests at a fixed target rate (an open loop: every request has a
+scheduled send time, and its latency is measured from that time, so a
+slow server cannot hide queueing delay by slowing the test down) and
+reports the latency percentiles:
+
+    python readings_service.py --port 8000 &
+    python load_test_service.py --url http://127.0.0.1:8000 --rate 500 --duration 10
+
+The mix is mostly /reading lookups of random dates, with some /range
+(one week) and /holy-days requests.
+"""
+import argparse
+import http.client
+import random
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 200
+DEFAULT_DURATION = 10.0
+DEFAULT_CONNECTIONS = 8
+
+def request_targets(first_year, last_year, count, seed=0):
+    """A reproducible mix of request paths over the given years."""
+    rng = random.Random(seed)
+    first = date(first_year, 1, 1).toordinal()
+    last = date(last_year, 12, 31).toordinal()
+    targets = []
+    for _ in range(count):
+        day = date.fromordinal(rng.randint(first, last))
+        kind = rng.random()
+        if kind < 0.8:
+            targets.append(f"/reading/{day.isoformat()}")
+        elif kind < 0.95:
+            targets.append(f"/range?start={day.isoformat()}&end={(day + timedelta(days=6)).isoformat()}")
+        else:
+            targets.append(f"/holy-days/{day.year}")
+    return targets
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def run_load_test(url, rate, duration, connections, targets):
+    """
+    Sends len(targets) requests spread evenly over duration seconds at
+    rate requests per second across keep-alive connections. Returns
+    (latencies in seconds, error count, wall time).
+    """
+    parts = urlsplit(url)
+    interval = 1.0 / rate
+    total = min(len(targets), int(rate * duration))
+    next_idx = [0]
+    idx_lock = threading.Lock()
+    latencies = []
+    errors = [0]
+    results_lock = threading.Lock()
+    start = time.perf_counter() + 0.1
+
+    def worker():
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+        local_latencies = []
+        local_errors = 0
+        while True:
+            with idx_lock:
+                request_idx = next_idx[0]
+                next_idx[0] += 1
+            if request_idx >= total:
+                break
+            scheduled = start + request_idx * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                conn.request("GET", targets[request_idx])
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+                continue
+            local_latencies.append(time.perf_counter() - scheduled)
+        conn.close()
+        with results_lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    threads = [threading.Thread(target=worker) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0], time.perf_counter() - start
+
+def format_load_test_report(latencies, errors, elapsed, rate):
+    ordered = sorted(latencies)
+    achieved = len(ordered) / elapsed if elapsed > 0 else 0.0
+    return "\n".join([
+        f"Requests: {len(ordered)} ok, {errors} errors in {elapsed:.1f}s "
+        f"({achieved:.0f} req/s achieved, {rate:.0f} req/s target)",
+        f"Latency: p50 {percentile(ordered, 0.50) * 1000:.2f} ms, p90 {percentile(ordered, 0.90) * 1000:.2f} ms, "
+        f"p99 {percentile(ordered, 0.99) * 1000:.2f} ms, max {(ordered[-1] if ordered else 0.0) * 1000:.2f} ms",
+    ])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure readings_service.py latency at a target request rate.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Service base URL (default: http://127.0.0.1:8000).")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help=f"Requests per second (default: {DEFAULT_RATE}).")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION,
+                        help=f"Test length in seconds (default: {DEFAULT_DURATION}).")
+    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS,
+                        help=f"Concurrent keep-alive connections (default: {DEFAULT_CONNECTIONS}).")
+    parser.add_argument("--years", type=int, nargs=2, metavar=("FIRST", "LAST"), default=(2024, 2026),
+                        help="Years the requested dates are drawn from (default: 2024 2026).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the request mix (default: 0).")
+    args = parser.parse_args(argv)
+
+    targets = request_targets(args.years[0], args.years[1], int(args.rate * args.duration), args.seed)
+    latencies, errors, elapsed = run_load_test(args.url, args.rate, args.duration, args.connections, targets)
+    print(format_load_test_report(latencies, errors, elapsed, args.rate))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROC_STATUS_PATH = "/proc/self/status"
+PROC_CLEAR_REFS_PATH = "/proc/self/clear_refs"
+
+def _read_proc_status_kb(field):
+    try:
+        with open(PROC_STATUS_PATH, "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+def reset_peak_rss():
+    """
+    Resets the process peak-RSS watermark where the OS allows it (Linux).
+    Returns True when later peak_rss_bytes() calls measure from this point.
+    """
+    try:
+        with open(PROC_CLEAR_REFS_PATH, "w", encoding="ascii") as f:
+            # "5" resets the peak resident set size (VmHWM) of the process
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of the current process in bytes, or None when
+    it cannot be measured on this platform.
+    """
+    peak_kb = _read_proc_status_kb("VmHWM")
+    if peak_kb is not None:
+        return peak_kb * 1024
+
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return max_rss if os.uname().sysname == "Darwin" else max_rss * 1024
+
+def format_bytes(value):
+    if value is None:
+        return "n/a"
+    return f"{value / (1024 * 1024):.1f} MiB"
@@ -0,0 +1,100 @@
+"""
+Change-aware output files for extract_readings.py.
+
+ChangeAwareOutput writes to a temp file next to the target and commit()
+only replaces the target when the bytes differ, so an unchanged run keeps
+the old mtimes and leaves nothing for git-auto-commit-action to pick up.
+RecordDigests summarizes every (Year, Date) record of an output so the
+records that were added, removed or modified can be reported.
+"""
+import filecmp
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+def record_key(row):
+    return (str(row.get("Year")), str(row.get("Date")))
+
+class ChangeAwareOutput:
+    """
+    Text file target. Use it as a context manager and call commit() once
+    everything is written; leaving the block without commit() (or with an
+    error) discards the temp file and keeps the existing output.
+    """
+
+    def __init__(self, path, newline=None):
+        self.path = Path(path)
+        self.newline = newline
+        self.file = None
+        self._tmp_name = None
+
+    def __enter__(self):
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self.file = os.fdopen(fd, "w", encoding="utf-8", newline=self.newline)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._discard()
+        return False
+
+    def write(self, text):
+        return self.file.write(text)
+
+    def _discard(self):
+        if not self.file.closed:
+            self.file.close()
+        if self._tmp_name and os.path.exists(self._tmp_name):
+            os.remove(self._tmp_name)
+        self._tmp_name = None
+
+    def is_unchanged(self):
+        """True when the target already holds exactly the bytes written so far."""
+        if not self.file.closed:
+            self.file.close()
+        return self.path.exists() and filecmp.cmp(self._tmp_name, self.path, shallow=False)
+
+    def commit(self):
+        """Atomically replaces the target if its content changed. Returns whether it did."""
+        if self.is_unchanged():
+            self._discard()
+            return False
+        # mkstemp creates the file owner-only; give it normal file permissions
+        os.chmod(self._tmp_name, 0o644)
+        os.replace(self._tmp_name, self.path)
+        self._tmp_name = None
+        return True
+
+class RecordDigests:
+    """Short digest of the serialized rows of every (Year, Date) record (double entries share a key)."""
+
+    def __init__(self):
+        self.digests = {}
+
+    def add(self, row, serialized):
+        digest = hashlib.blake2b(serialized.encode("utf-8"), digest_size=8).digest()
+        self.digests.setdefault(record_key(row), []).append(digest)
+
+    def diff(self, previous):
+        """Added, removed and modified (Year, Date) keys relative to previous, each sorted."""
+        current = self.digests
+        old = previous.digests
+        return {
+            "added": sorted(key for key in current if key not in old),
+            "removed": sorted(key for key in old if key not in current),
+            "modified": sorted(key for key in current if key in old and current[key] != old[key])
+        }
+
+def empty_diff():
+    return {"added": [], "removed": [], "modified": []}
+
+def format_diff_summary(diff, limit=10):
+    lines = [f"{len(diff['added'])} added, {len(diff['removed'])} removed, {len(diff['modified'])} modified records"]
+    for change in ("added", "removed", "modified"):
+        keys = diff[change]
+        if not keys:
+            continue
+        shown = ", ".join(f"{year}/{date_key}" for year, date_key in keys[:limit])
+        more = f" (+{len(keys) - limit} more)" if len(keys) > limit else ""
+        lines.append(f"  {change}: {shown}{more}")
+    return "\n".join(lines)
@@ -0,0 +1,200 @@
+"""
+Reverse index from scripture passages to the dates they are read on.
+
+Every Epistle, Gospel and Matins Gospel verse range of the outputs (see
+scripture_refs.py) becomes one interval. The intervals are sorted by start
+and laid out as an implicit binary search tree whose nodes also know the
+largest end below them, so an overlap query visits O(log n + k) nodes:
+
+    python passage_index.py "Luke 8"
+    python passage_index.py Hebrews --field Epistle --sundays
+"""
+import argparse
+import json
+import os
+import tempfile
+from collections import namedtuple
+from datetime import date
+from pathlib import Path
+
+from reading_schema import entry_date
+from scripture_refs import BOOK_ID_FACTOR, REFERENCE_RANGE_FIELDS, book_id, entry_ranges, format_range, parse_reference
+
+PASSAGE_INDEX_FILENAME = "passage_index.json"
+PASSAGE_INDEX_FORMAT = "passage-index"
+PASSAGE_INDEX_VERSION = 1
+INDEXED_FIELDS = tuple(REFERENCE_RANGE_FIELDS)
+
+PassageHit = namedtuple("PassageHit", ["date", "field", "start", "end"])
+
+class PassageIndex:
+    def __init__(self, intervals):
+        """intervals: iterable of (start, end, iso_date, field)."""
+        ordered = sorted(intervals)
+        self.starts = [interval[0] for interval in ordered]
+        self.ends = [interval[1] for interval in ordered]
+        self.dates = [interval[2] for interval in ordered]
+        self.fields = [interval[3] for interval in ordered]
+        self._max_ends = [0] * len(ordered)
+        self._fill_max_ends(0, len(ordered))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _fill_max_ends(self, lo, hi):
+        # Node of the implicit tree over [lo, hi) is its middle element
+        stack = [(lo, hi, False)]
+        while stack:
+            lo, hi, children_done = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if not children_done:
+                stack.append((lo, hi, True))
+                stack.append((lo, mid, False))
+                stack.append((mid + 1, hi, False))
+                continue
+            max_end = self.ends[mid]
+            if lo < mid:
+                max_end = max(max_end, self._max_ends[(lo + mid) // 2])
+            if mid + 1 < hi:
+                max_end = max(max_end, self._max_ends[(mid + 1 + hi) // 2])
+            self._max_ends[mid] = max_end
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls(iter_row_intervals(rows))
+
+    def overlapping(self, start, end):
+        """Positions of the intervals overlapping [start, end], in start order."""
+        found = []
+        # (lo, hi, node_pending): node_pending marks "report mid, then visit the right half"
+        stack = [(0, len(self.starts), False)]
+        while stack:
+            lo, hi, node_pending = stack.pop()
+            mid = (lo + hi) // 2
+            if node_pending:
+                if self.ends[mid] >= start:
+                    found.append(mid)
+                stack.append((mid + 1, hi, False))
+                continue
+            if lo >= hi or self._max_ends[mid] < start:
+                continue
+            if self.starts[mid] <= end:
+                stack.append((lo, hi, True))
+            stack.append((lo, mid, False))
+        return found
+
+    def find(self, reference, fields=None, weekday=None):
+        """
+        PassageHits for every reading overlapping a reference ("Luke 8",
+        "Heb 11:17-23", or a bare book name such as "Hebrews"), sorted by
+        date. fields limits the match to some of INDEXED_FIELDS and weekday
+        (0 = Monday ... 6 = Sunday) to one day of the week.
+        """
+        query_ranges = parse_reference(reference)
+        if not query_ranges:
+            whole_book = book_id(reference)
+            if whole_book is None:
+                raise ValueError(f"Unrecognized scripture reference {reference!r}")
+            query_ranges = ((whole_book * BOOK_ID_FACTOR, (whole_book + 1) * BOOK_ID_FACTOR - 1),)
+
+        hits = set()
+        for start, end in query_ranges:
+            for position in self.overlapping(start, end):
+                if fields and self.fields[position] not in fields:
+                    continue
+                hit_date = date.fromisoformat(self.dates[position])
+                if weekday is not None and hit_date.weekday() != weekday:
+                    continue
+                hits.add(PassageHit(hit_date, self.fields[position], self.starts[position], self.ends[position]))
+        return sorted(hits)
+
+    def dates_for(self, reference, fields=None, weekday=None):
+        """Distinct dates on which any part of the reference is read."""
+        return sorted({hit.date for hit in self.find(reference, fields, weekday)})
+
+    def save(self, path):
+        payload = {
+            "format": PASSAGE_INDEX_FORMAT,
+            "version": PASSAGE_INDEX_VERSION,
+            "fields": list(INDEXED_FIELDS),
+            "intervals": [
+                [start, end, iso_date, INDEXED_FIELDS.index(field)]
+                for start, end, iso_date, field in zip(self.starts, self.ends, self.dates, self.fields)
+            ]
+        }
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("format") != PASSAGE_INDEX_FORMAT or payload.get("version") != PASSAGE_INDEX_VERSION:
+            raise ValueError(f"Unsupported passage index in {path}")
+        fields = payload["fields"]
+        return cls((start, end, iso_date, fields[field_idx]) for start, end, iso_date, field_idx in payload["intervals"])
+
+def iter_row_intervals(rows):
+    """(start, end, iso_date, field) for every verse range of every row."""
+    for row in rows:
+        iso_date = entry_date(row).isoformat()
+        for field in INDEXED_FIELDS:
+            for start, end in entry_ranges(row, field):
+                yield start, end, iso_date, field
+
+class PassageIndexWriter:
+    """Row writer (see write_output_files) that saves the index of the written rows on close."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._intervals = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            PassageIndex(self._intervals).save(self.path)
+        return False
+
+    def write_row(self, row):
+        self._intervals.extend(iter_row_intervals((row,)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the dates on which a scripture passage is read.")
+    parser.add_argument("reference", help='Passage or book, e.g. "Luke 8", "Heb 11:17-23" or "Hebrews".')
+    parser.add_argument("--index", type=Path, help=f"Saved index (default: calendars/{PASSAGE_INDEX_FILENAME}, "
+                                                     "built from extracted_readings.json when missing).")
+    parser.add_argument("--field", action="append", choices=INDEXED_FIELDS,
+                        help="Only match this reading (repeatable; default: all).")
+    parser.add_argument("--sundays", action="store_true", help="Only report Sundays.")
+    args = parser.parse_args(argv)
+
+    calendars_dir = Path(__file__).parent
+    index_path = args.index or calendars_dir / PASSAGE_INDEX_FILENAME
+    if index_path.exists():
+        index = PassageIndex.load(index_path)
+    else:
+        with open(calendars_dir / "extracted_readings.json", "r", encoding="utf-8") as f:
+            index = PassageIndex.from_rows(json.load(f))
+
+    try:
+        hits = index.find(args.reference, args.field, 6 if args.sundays else None)
+    except ValueError as e:
+        parser.error(str(e))
+    for hit in hits:
+        print(f"{hit.date.isoformat()}  {hit.date:%a}  {hit.field:<14} {format_range(hit.start, hit.end)}")
+
+if __name__ == "__main__":
+    main()
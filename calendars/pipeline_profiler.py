@@ -0,0 +1,115 @@
+"""
+Optional per-stage instrumentation for extract_readings.py.
+
+Pipeline code wraps its stages in `with profile_stage("find_tables"):`.
+While no profiler is enabled that returns one shared no-op context manager,
+so the hooks cost a function call and nothing else. enable_profiling()
+switches on wall-time and call-count collection (plus allocated bytes when
+tracemalloc is requested) per stage and per unit (a PDF or a month), and
+PipelineProfiler.report() produces the JSON-serializable summary.
+"""
+import contextlib
+import time
+import tracemalloc
+
+_NULL_CONTEXT = contextlib.nullcontext()
+_active_profiler = None
+
+def _new_stats():
+    return {"seconds": 0.0, "calls": 0, "net_bytes": 0, "peak_bytes": 0}
+
+class PipelineProfiler:
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self.units = {}
+        self.current_unit = None
+        self._memory_frames = []
+        self._started = time.perf_counter()
+
+    def _record(self, name, seconds, net_bytes, peak_bytes):
+        targets = [self.stages.setdefault(name, _new_stats())]
+        if self.current_unit is not None:
+            kind, label = self.current_unit
+            unit_stats = self.units.setdefault(kind, {}).setdefault(label, {})
+            targets.append(unit_stats.setdefault(name, _new_stats()))
+
+        for stats in targets:
+            stats["seconds"] += seconds
+            stats["calls"] += 1
+            stats["net_bytes"] += net_bytes
+            stats["peak_bytes"] = max(stats["peak_bytes"], peak_bytes)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if not self.trace_memory:
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._record(name, time.perf_counter() - start, 0, 0)
+            return
+
+        start_current, start_peak = tracemalloc.get_traced_memory()
+        if self._memory_frames:
+            # Keep the enclosing stage's peak before resetting the watermark for this one
+            self._memory_frames[-1][1] = max(self._memory_frames[-1][1], start_peak)
+        tracemalloc.reset_peak()
+        frame = [start_current, start_current]
+        self._memory_frames.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            end_current, end_peak = tracemalloc.get_traced_memory()
+            self._memory_frames.pop()
+            peak = max(frame[1], end_peak)
+            if self._memory_frames:
+                self._memory_frames[-1][1] = max(self._memory_frames[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._record(name, elapsed, end_current - start_current, peak - start_current)
+
+    @contextlib.contextmanager
+    def unit(self, kind, label):
+        previous = self.current_unit
+        self.current_unit = (kind, label)
+        try:
+            yield
+        finally:
+            self.current_unit = previous
+
+    def report(self):
+        report = {
+            "wall_seconds": time.perf_counter() - self._started,
+            "trace_memory": self.trace_memory,
+            "stages": self.stages,
+        }
+        report.update(self.units)
+        return report
+
+def enable_profiling(trace_memory=False):
+    global _active_profiler
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _active_profiler = PipelineProfiler(trace_memory)
+    return _active_profiler
+
+def disable_profiling():
+    global _active_profiler
+    profiler = _active_profiler
+    _active_profiler = None
+    if profiler is not None and profiler.trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return profiler
+
+def profile_stage(name):
+    if _active_profiler is None:
+        return _NULL_CONTEXT
+    return _active_profiler.stage(name)
+
+def profile_unit(kind, label):
+    """Attributes the stages run inside the block to one PDF or month."""
+    if _active_profiler is None:
+        return _NULL_CONTEXT
+    return _active_profiler.unit(kind, label)
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from reading_entry import ReadingEntry
+
+# Intermediate "raw cell" file written by the layout stage of extract_readings.py.
+# JSON Lines: the first line is a header, then one line per PDF holding the
+# output of create_entries_for_cell stored positionally in RAW_CELL_FIELDS
+# order. One line per PDF lets both stages stream the file month by month.
+RAW_CELLS_FORMAT = "raw-cells"
+RAW_CELLS_FORMAT_VERSION = 2
+RAW_CELLS_FILENAME = "raw_cells.jsonl"
+RAW_CELL_FIELDS = ["Date", "Year", "Month", "Day", "Raw Text", "Cell BBox"]
+
+class RawCellsWriter:
+    """
+    Incremental raw cell writer. Lines go to a temp file that replaces the
+    target only when the writer is closed without an error.
+    """
+
+    def __init__(self, path, parser_version):
+        self.path = Path(path)
+        self.parser_version = parser_version
+        self._file = None
+        self._tmp_name = None
+
+    def __enter__(self):
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        header = {
+            "format": RAW_CELLS_FORMAT,
+            "version": RAW_CELLS_FORMAT_VERSION,
+            "parser_version": self.parser_version,
+            "fields": RAW_CELL_FIELDS
+        }
+        self._write_line(header)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is None:
+            # mkstemp creates the file owner-only; give it normal file permissions
+            os.chmod(self._tmp_name, 0o644)
+            os.replace(self._tmp_name, self.path)
+        elif os.path.exists(self._tmp_name):
+            os.remove(self._tmp_name)
+        return False
+
+    def _write_line(self, payload):
+        self._file.write(json.dumps(payload, separators=(",", ":"), ensure_ascii=False))
+        self._file.write("\n")
+
+    def write_file(self, source_name, year, month_num, entries):
+        self._write_line({
+            "source": source_name,
+            "year": year,
+            "month": month_num,
+            "rows": [[entry.get(field) for field in RAW_CELL_FIELDS] for entry in entries]
+        })
+
+    def tee(self, layout_files):
+        """Writes each (source_name, year, month_num, entries) item while passing it on."""
+        for layout_file in layout_files:
+            self.write_file(*layout_file)
+            yield layout_file
+
+def _read_header(f, path):
+    header = json.loads(f.readline() or "{}")
+    if header.get("format") != RAW_CELLS_FORMAT:
+        raise ValueError(f"{path} is not a raw cell file")
+    if header.get("version") != RAW_CELLS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported raw cell file version {header.get('version')} in {path}")
+    return header
+
+def read_raw_cells_parser_version(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return _read_header(f, path).get("parser_version")
+
+def iter_raw_cells(path):
+    """
+    Yields (source_name, year, month_num, entries) per PDF in file order,
+    with entries as ReadingEntry objects.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        fields = _read_header(f, path)["fields"]
+        for line in f:
+            if not line.strip():
+                continue
+            file_block = json.loads(line)
+            entries = [ReadingEntry.from_dict(dict(zip(fields, row))) for row in file_block["rows"]]
+            yield file_block["source"], file_block["year"], file_block["month"], entries
@@ -0,0 +1,113 @@
+"""
+Compact in-memory form of a reading while it moves through the pipeline.
+
+create_entries_for_cell builds a ReadingEntry, detect_and_split_double_entry
+copies it and enrich_entry fills in the parsed fields. A slotted object has
+no per-instance dict, and the values that repeat across thousands of rows
+(year, month name, tone, fasting rule, reading references, titles) are
+interned so every row of a run shares one string object. Entries become
+dicts only where they are serialized: to_dict() for the published rows and
+layout_dict() for the extraction cache (raw_cells.py reads fields by name
+through get()).
+"""
+import sys
+
+from reading_schema import READING_FIELDS
+
+# Layout-stage field that never reaches the published outputs
+CELL_BBOX_FIELD = "Cell BBox"
+
+# Slot of every field, in READING_FIELDS order, then the layout-only bbox
+FIELD_SLOTS = {
+    "Date": "date",
+    "Year": "year",
+    "Month": "month",
+    "Day": "day",
+    "Raw Text": "raw_text",
+    "Title": "title",
+    "Tone": "tone",
+    "Matins Gospel": "matins_gospel",
+    "Matins Gospel Ranges": "matins_gospel_ranges",
+    "Epistle": "epistle",
+    "Epistle Ranges": "epistle_ranges",
+    "Gospel": "gospel",
+    "Gospel Ranges": "gospel_ranges",
+    "Fasting": "fasting",
+    "Notes": "notes",
+    "Canada Holiday": "canada_holiday",
+    "USA Holiday": "usa_holiday",
+    "Holy Day of Obligation": "holy_day_of_obligation",
+    CELL_BBOX_FIELD: "cell_bbox",
+}
+READING_SLOTS = tuple(FIELD_SLOTS[field] for field in READING_FIELDS)
+# Fields whose values repeat across rows; raw text, notes and dates are close to unique
+INTERNED_FIELDS = ("Year", "Month", "Title", "Tone", "Matins Gospel", "Epistle", "Gospel",
+                   "Fasting", "Canada Holiday", "USA Holiday")
+INTERNED_SLOTS = frozenset(FIELD_SLOTS[field] for field in INTERNED_FIELDS)
+
+def intern_value(value):
+    return sys.intern(value) if type(value) is str else value
+
+class ReadingEntry:
+    __slots__ = tuple(FIELD_SLOTS.values())
+
+    def __init__(self, date, year, month, day, raw_text, cell_bbox=None):
+        self.date = date
+        self.year = intern_value(year)
+        self.month = intern_value(month)
+        self.day = day
+        self.raw_text = raw_text
+        self.cell_bbox = cell_bbox
+        for slot in READING_SLOTS[5:]:
+            setattr(self, slot, None)
+
+    def set_fields(self, **values):
+        """Sets parsed fields by slot name, interning the repeated ones."""
+        for slot, value in values.items():
+            setattr(self, slot, sys.intern(value) if slot in INTERNED_SLOTS and type(value) is str else value)
+
+    def copy(self):
+        duplicate = ReadingEntry.__new__(ReadingEntry)
+        for slot in ReadingEntry.__slots__:
+            setattr(duplicate, slot, getattr(self, slot))
+        return duplicate
+
+    def __getstate__(self):
+        # Pickled positionally (process pool results) instead of as a slot-name dict
+        return tuple(getattr(self, slot) for slot in ReadingEntry.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(ReadingEntry.__slots__, state):
+            setattr(self, slot, intern_value(value) if slot in INTERNED_SLOTS else value)
+
+    def get(self, field, default=None):
+        """Dict-style read by output field name (used where rows and entries are both accepted)."""
+        slot = FIELD_SLOTS.get(field)
+        value = getattr(self, slot) if slot else None
+        return default if value is None else value
+
+    def to_dict(self):
+        """Published row: READING_FIELDS in order, without layout-only fields."""
+        return {field: getattr(self, slot) for field, slot in zip(READING_FIELDS, READING_SLOTS)}
+
+    def layout_dict(self):
+        """Layout-stage form stored in the extraction cache."""
+        return {
+            "Date": self.date,
+            "Year": self.year,
+            "Month": self.month,
+            "Day": self.day,
+            "Raw Text": self.raw_text,
+            CELL_BBOX_FIELD: self.cell_bbox
+        }
+
+    @classmethod
+    def from_dict(cls, row):
+        """Entry from a layout dict or a published row; missing fields stay None."""
+        entry = cls(row.get("Date"), row.get("Year"), row.get("Month"), row.get("Day"),
+                    row.get("Raw Text"), row.get(CELL_BBOX_FIELD))
+        entry.set_fields(**{FIELD_SLOTS[field]: row[field] for field in READING_FIELDS[5:] if field in row})
+        return entry
+
+    def __repr__(self):
+        return f"ReadingEntry({self.year}-{self.date[:2]}-{self.day}, {self.title!r})"
@@ -0,0 +1,20 @@
+from datetime import date
+
+# Key order of the rows written to extracted_readings.json by enrich_entry()
+READING_FIELDS = [
+    "Date", "Year", "Month", "Day", "Raw Text", "Title", "Tone", "Matins Gospel",
+    "Matins Gospel Ranges", "Epistle", "Epistle Ranges", "Gospel", "Gospel Ranges",
+    "Fasting", "Notes", "Canada Holiday", "USA Holiday", "Holy Day of Obligation"
+]
+
+# Structured form of the reference fields: a list of [start, end] packed
+# verse ids (see scripture_refs.py) or None
+RANGE_FIELDS = ("Matins Gospel Ranges", "Epistle Ranges", "Gospel Ranges")
+
+def entry_date(row):
+    """Calendar date of an output row ("Date" is MMDDYY, "Year" the full year)."""
+    return date(int(row["Year"]), int(row["Date"][:2]), int(row["Day"]))
+
+def date_key(value):
+    """MMDDYY key used by the "Date" field and the client's readingsMap."""
+    return value.strftime("%m%d%y")
@@ -0,0 +1,230 @@
+"""
+Date-indexed binary copy of extracted_readings.json for fast cold starts.
+
+Layout (little-endian):
+
+    header        HEADER_STRUCT
+    day index     one DAY_SLOT_STRUCT (first record, record count) per
+                  calendar day from January 1st of the first year to
+                  December 31st of the last year
+    records       one RECORD_STRUCT per output row, in date order
+    string ids    string_count + 1 uint32 offsets into the string data
+    string data   the deduplicated UTF-8 strings, back to back
+
+Every text field of a record is an id into the shared string table (0 is
+None; the verse range fields are stored there as compact JSON), so a
+lookup is one slot read plus a few slices of the mapped file:
+
+    with ReadingsBinary("readings.bin") as readings:
+        readings.by_date(date(2025, 1, 6))
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from reading_schema import RANGE_FIELDS, READING_FIELDS, entry_date
+
+READINGS_BINARY_FILENAME = "readings.bin"
+READINGS_BINARY_MAGIC = b"RDGBIN\x00\x00"
+READINGS_BINARY_VERSION = 2
+
+# magic, version, first day ordinal, day count, record count, string count,
+# then the offsets of the record, string id and string data sections
+HEADER_STRUCT = struct.Struct("<8sIIIIIIII")
+DAY_SLOT_STRUCT = struct.Struct("<IH")
+STRING_FIELDS = [field for field in READING_FIELDS if field not in ("Day", "Holy Day of Obligation")]
+# One string id per STRING_FIELDS entry, then the day number and the holy-day flag
+RECORD_STRUCT = struct.Struct("<" + "I" * len(STRING_FIELDS) + "HBx")
+OFFSET_STRUCT = struct.Struct("<I")
+
+class ReadingsBinaryWriter:
+    """
+    Collects output rows (write_row) and writes the binary file when closed
+    without an error. Only the packed records and the string table are kept
+    in memory.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.count = 0
+        self._string_ids = {None: 0}
+        self._records = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._write()
+        return False
+
+    def _string_id(self, value):
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._string_ids)
+        return string_id
+
+    def write_row(self, row):
+        values = []
+        for field in STRING_FIELDS:
+            value = row.get(field)
+            if field in RANGE_FIELDS and value is not None:
+                value = json.dumps(value, separators=(",", ":"))
+            values.append(self._string_id(value))
+        values.append(int(row["Day"]))
+        values.append(1 if row.get("Holy Day of Obligation") else 0)
+        self._records.append((entry_date(row).toordinal(), RECORD_STRUCT.pack(*values)))
+        self.count += 1
+
+    def _write(self):
+        # Stable, so rows sharing a date keep their output order
+        self._records.sort(key=lambda record: record[0])
+        if self._records:
+            first_ordinal = date(date.fromordinal(self._records[0][0]).year, 1, 1).toordinal()
+            last_ordinal = date(date.fromordinal(self._records[-1][0]).year, 12, 31).toordinal()
+            day_count = last_ordinal - first_ordinal + 1
+        else:
+            first_ordinal, day_count = 0, 0
+
+        day_slots = [[0, 0] for _ in range(day_count)]
+        for record_idx, (ordinal, _) in enumerate(self._records):
+            slot = day_slots[ordinal - first_ordinal]
+            if slot[1] == 0:
+                slot[0] = record_idx
+            slot[1] += 1
+
+        encoded = [b""] * len(self._string_ids)
+        for value, string_id in self._string_ids.items():
+            if value is not None:
+                encoded[string_id] = str(value).encode("utf-8")
+        string_offsets = [0]
+        for data in encoded:
+            string_offsets.append(string_offsets[-1] + len(data))
+
+        records_offset = HEADER_STRUCT.size + day_count * DAY_SLOT_STRUCT.size
+        string_ids_offset = records_offset + len(self._records) * RECORD_STRUCT.size
+        string_data_offset = string_ids_offset + len(string_offsets) * OFFSET_STRUCT.size
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".bin.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER_STRUCT.pack(
+                    READINGS_BINARY_MAGIC, READINGS_BINARY_VERSION, first_ordinal, day_count,
+                    len(self._records), len(encoded), records_offset, string_ids_offset, string_data_offset
+                ))
+                f.write(b"".join(DAY_SLOT_STRUCT.pack(*slot) for slot in day_slots))
+                f.write(b"".join(record for _, record in self._records))
+                f.write(struct.pack(f"<{len(string_offsets)}I", *string_offsets))
+                f.write(b"".join(encoded))
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+def export_readings_binary(rows, path):
+    with ReadingsBinaryWriter(path) as writer:
+        for row in rows:
+            writer.write_row(row)
+    return writer.count
+
+class ReadingsBinary:
+    """
+    Memory-mapped reader. Opening only reads the header; by_date() decodes
+    the records of a single day.
+    """
+
+    def __init__(self, path=None):
+        path = Path(path) if path else Path(__file__).parent / READINGS_BINARY_FILENAME
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = HEADER_STRUCT.unpack_from(self._map, 0)
+        if header[0] != READINGS_BINARY_MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a readings binary file")
+        if header[1] != READINGS_BINARY_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported readings binary version {header[1]} in {path}")
+        (_, _, self.first_ordinal, self.day_count, self.record_count, self.string_count,
+         self._records_offset, self._string_ids_offset, self._string_data_offset) = header
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._map.close()
+
+    @property
+    def first_date(self):
+        return date.fromordinal(self.first_ordinal) if self.day_count else None
+
+    @property
+    def last_date(self):
+        return date.fromordinal(self.first_ordinal + self.day_count - 1) if self.day_count else None
+
+    def _string(self, string_id):
+        if string_id == 0:
+            return None
+        start, end = struct.unpack_from("<2I", self._map, self._string_ids_offset + string_id * OFFSET_STRUCT.size)
+        return self._map[self._string_data_offset + start:self._string_data_offset + end].decode("utf-8")
+
+    def _record(self, record_idx):
+        values = RECORD_STRUCT.unpack_from(self._map, self._records_offset + record_idx * RECORD_STRUCT.size)
+        row = dict(zip(STRING_FIELDS, map(self._string, values)))
+        for field in RANGE_FIELDS:
+            if row[field] is not None:
+                row[field] = json.loads(row[field])
+        row["Day"] = values[-2]
+        row["Holy Day of Obligation"] = bool(values[-1])
+        return {field: row[field] for field in READING_FIELDS}
+
+    def day_slot(self, value):
+        """(first record index, record count) for a date; (0, 0) outside the covered years."""
+        slot_idx = value.toordinal() - self.first_ordinal
+        if not 0 <= slot_idx < self.day_count:
+            return 0, 0
+        return DAY_SLOT_STRUCT.unpack_from(self._map, HEADER_STRUCT.size + slot_idx * DAY_SLOT_STRUCT.size)
+
+    def by_date(self, value):
+        """All rows for one date (a date or "YYYY-MM-DD"), empty when the day has no reading."""
+        if not isinstance(value, date):
+            value = date.fromisoformat(value)
+        first_record, count = self.day_slot(value)
+        return [self._record(record_idx) for record_idx in range(first_record, first_record + count)]
+
+    def __iter__(self):
+        for record_idx in range(self.record_count):
+            yield self._record(record_idx)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the date-indexed binary readings file.")
+    parser.add_argument("date", nargs="?", help="Show the readings for this date (YYYY-MM-DD).")
+    parser.add_argument("--file", type=Path, default=Path(__file__).parent / READINGS_BINARY_FILENAME,
+                        help=f"Binary file path (default: calendars/{READINGS_BINARY_FILENAME}).")
+    parser.add_argument("--build-from", type=Path, metavar="JSON",
+                        help="Rebuild the binary file from an extracted_readings.json file first.")
+    args = parser.parse_args(argv)
+
+    if args.build_from:
+        with open(args.build_from, "r", encoding="utf-8") as f:
+            count = export_readings_binary(json.load(f), args.file)
+        print(f"Saved {count} readings to {args.file}")
+    if args.date:
+        with ReadingsBinary(args.file) as readings:
+            print(json.dumps(readings.by_date(args.date), indent=2, ensure_ascii=False))
+    elif not args.build_from:
+        parser.error("give a date and/or --build-from")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Indexed SQLite copy of extracted_readings.json.
+
+extract_readings.py --sqlite writes it next to the JSON/CSV outputs; the
+query side answers point and range lookups from the indexes instead of
+loading the whole dataset:
+
+    python readings_db.py 2025-01-06
+    python readings_db.py --range 2025-04-13 2025-04-20
+    python readings_db.py --holy-days 2025
+    python readings_db.py --book "Heb"
+"""
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from reading_schema import RANGE_FIELDS, READING_FIELDS, entry_date
+from scripture_refs import BOOK_ID_FACTOR, book_id
+
+READINGS_DB_FILENAME = "readings.sqlite"
+READINGS_DB_SCHEMA_VERSION = 3
+
+# Output field -> column; "Tone" and the holy-day flag are stored as integers,
+# the verse range fields as JSON text. "Matins Gospel" stays text (it can be a
+# reference such as "John 20:1-10"); res_gospel_number holds it when it is a
+# Resurrection Gospel number
+FIELD_COLUMNS = {
+    "Date": "date_key",
+    "Year": "year_text",
+    "Month": "month_name",
+    "Day": "day",
+    "Raw Text": "raw_text",
+    "Title": "title",
+    "Tone": "tone",
+    "Matins Gospel": "matins_gospel",
+    "Matins Gospel Ranges": "matins_gospel_ranges",
+    "Epistle": "epistle",
+    "Epistle Ranges": "epistle_ranges",
+    "Gospel": "gospel",
+    "Gospel Ranges": "gospel_ranges",
+    "Fasting": "fasting",
+    "Notes": "notes",
+    "Canada Holiday": "canada_holiday",
+    "USA Holiday": "usa_holiday",
+    "Holy Day of Obligation": "holy_day",
+}
+INTEGER_FIELDS = ("Tone",)
+
+SCHEMA = """
+CREATE TABLE readings (
+    id INTEGER PRIMARY KEY,
+    iso_date TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    date_key TEXT NOT NULL,
+    year_text TEXT NOT NULL,
+    month_name TEXT,
+    day INTEGER NOT NULL,
+    raw_text TEXT,
+    title TEXT,
+    tone INTEGER,
+    matins_gospel TEXT,
+    res_gospel_number INTEGER,
+    matins_gospel_ranges TEXT,
+    epistle TEXT,
+    epistle_ranges TEXT,
+    epistle_book INTEGER,
+    gospel TEXT,
+    gospel_ranges TEXT,
+    gospel_book INTEGER,
+    fasting TEXT,
+    notes TEXT,
+    canada_holiday TEXT,
+    usa_holiday TEXT,
+    holy_day INTEGER NOT NULL
+);
+"""
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX readings_iso_date ON readings (iso_date);
+CREATE INDEX readings_year_month ON readings (year, month);
+CREATE INDEX readings_holy_day ON readings (holy_day, iso_date);
+CREATE INDEX readings_tone ON readings (tone);
+CREATE INDEX readings_res_gospel_number ON readings (res_gospel_number);
+CREATE INDEX readings_epistle_book ON readings (epistle_book);
+CREATE INDEX readings_gospel_book ON readings (gospel_book);
+"""
+
+INSERT_COLUMNS = ["iso_date", "year", "month", "epistle_book", "gospel_book", "res_gospel_number"] + list(FIELD_COLUMNS.values())
+INSERT_SQL = (
+    f"INSERT INTO readings ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in INSERT_COLUMNS)})"
+)
+SELECT_SQL = f"SELECT {', '.join(FIELD_COLUMNS.values())} FROM readings"
+
+INSERT_BATCH_SIZE = 500
+
+def _optional_int(value):
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def _first_book(ranges):
+    """Book id of the first verse range (see scripture_refs.py), or None."""
+    return ranges[0][0] // BOOK_ID_FACTOR if ranges else None
+
+def _res_gospel_number(matins_gospel):
+    """The Resurrection Gospel number of a numeric "Matins Gospel", or None."""
+    if isinstance(matins_gospel, str) and matins_gospel.isdigit():
+        return int(matins_gospel)
+    return None
+
+def _row_values(row):
+    row_date = entry_date(row)
+    values = [
+        row_date.isoformat(),
+        row_date.year,
+        row_date.month,
+        _first_book(row.get("Epistle Ranges")),
+        _first_book(row.get("Gospel Ranges")),
+        _res_gospel_number(row.get("Matins Gospel")),
+    ]
+    for field in FIELD_COLUMNS:
+        value = row.get(field)
+        if field in INTEGER_FIELDS:
+            value = _optional_int(value)
+        elif field == "Holy Day of Obligation":
+            value = 1 if value else 0
+        elif field in RANGE_FIELDS and value is not None:
+            value = json.dumps(value, separators=(",", ":"))
+        values.append(value)
+    return values
+
+class ReadingsDbWriter:
+    """
+    Builds the database from output rows in the order they are written.
+    The file is created next to the target and replaces it only when the
+    writer is closed without an error.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.count = 0
+        self._conn = None
+        self._tmp_name = None
+        self._pending = []
+
+    def __enter__(self):
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".sqlite.tmp")
+        os.close(fd)
+        self._conn = sqlite3.connect(self._tmp_name)
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {READINGS_DB_SCHEMA_VERSION}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._flush()
+                self._conn.executescript(INDEXES)
+                self._conn.execute("ANALYZE")
+                self._conn.commit()
+        finally:
+            self._conn.close()
+
+        if exc_type is None:
+            os.chmod(self._tmp_name, 0o644)
+            os.replace(self._tmp_name, self.path)
+        elif os.path.exists(self._tmp_name):
+            os.remove(self._tmp_name)
+        return False
+
+    def _flush(self):
+        if self._pending:
+            self._conn.executemany(INSERT_SQL, self._pending)
+            self._pending = []
+
+    def write_row(self, row):
+        self._pending.append(_row_values(row))
+        self.count += 1
+        if len(self._pending) >= INSERT_BATCH_SIZE:
+            self._flush()
+
+def _to_iso(value):
+    return value.isoformat() if isinstance(value, date) else date.fromisoformat(value).isoformat()
+
+class ReadingsDb:
+    """Read-only queries over a database written by ReadingsDbWriter. Rows come back as output dicts."""
+
+    def __init__(self, path=None):
+        path = Path(path) if path else Path(__file__).parent / READINGS_DB_FILENAME
+        if not path.exists():
+            raise FileNotFoundError(f"Readings database not found at {path}")
+        self._conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != READINGS_DB_SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(f"Unsupported readings database version {version} in {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._conn.close()
+
+    def _query(self, where, params):
+        cursor = self._conn.execute(f"{SELECT_SQL} WHERE {where} ORDER BY iso_date, id", params)
+        rows = []
+        for values in cursor:
+            row = dict(zip(FIELD_COLUMNS, values))
+            for field in INTEGER_FIELDS:
+                if row[field] is not None:
+                    row[field] = str(row[field])
+            for field in RANGE_FIELDS:
+                if row[field] is not None:
+                    row[field] = json.loads(row[field])
+            row["Holy Day of Obligation"] = bool(row["Holy Day of Obligation"])
+            rows.append({field: row[field] for field in READING_FIELDS})
+        return rows
+
+    def by_date(self, value):
+        """All rows for one date (a date or "YYYY-MM-DD"); most days have exactly one."""
+        return self._query("iso_date = ?", (_to_iso(value),))
+
+    def in_range(self, start, end):
+        """Rows from start to end inclusive, in date order."""
+        return self._query("iso_date BETWEEN ? AND ?", (_to_iso(start), _to_iso(end)))
+
+    def holy_days(self, year):
+        return self._query("holy_day = 1 AND iso_date BETWEEN ? AND ?", (f"{int(year):04d}-01-01", f"{int(year):04d}-12-31"))
+
+    def by_book(self, book, field="both"):
+        """
+        Rows whose Epistle and/or Gospel (field = "epistle", "gospel" or
+        "both") starts in the given book, under any of its spellings
+        ("Heb", "Hebrews", "1 Cor.", "Lk").
+        """
+        key = book_id(book)
+        if key is None:
+            raise ValueError(f"Unknown book {book!r}")
+        if field == "epistle":
+            return self._query("epistle_book = ?", (key,))
+        if field == "gospel":
+            return self._query("gospel_book = ?", (key,))
+        return self._query("epistle_book = ? OR gospel_book = ?", (key, key))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the SQLite copy of the extracted readings.")
+    parser.add_argument("date", nargs="?", help="Show the readings for this date (YYYY-MM-DD).")
+    parser.add_argument("--db", type=Path, help=f"Database path (default: calendars/{READINGS_DB_FILENAME}).")
+    parser.add_argument("--range", nargs=2, metavar=("START", "END"), help="Show every date from START to END.")
+    parser.add_argument("--holy-days", type=int, metavar="YEAR", help="Show the holy days of obligation of YEAR.")
+    parser.add_argument("--book", help="Show the days whose Epistle or Gospel is read from this book.")
+    args = parser.parse_args(argv)
+
+    with ReadingsDb(args.db) as db:
+        if args.range:
+            rows = db.in_range(*args.range)
+        elif args.holy_days:
+            rows = db.holy_days(args.holy_days)
+        elif args.book:
+            rows = db.by_book(args.book)
+        elif args.date:
+            rows = db.by_date(args.date)
+        else:
+            parser.error("give a date, --range, --holy-days or --book")
+
+    print(json.dumps(rows, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
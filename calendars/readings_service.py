@@ -0,0 +1,225 @@
+"""
+Local HTTP lookup service over extracted_readings.json.
+
+The JSON is loaded once into a date index keyed by the same MMDDYY strings
+as the client's localReadingsService.js, and reloaded in the background
+when the file changes:
+
+    python readings_service.py --port 8000
+    curl localhost:8000/reading/2025-01-06        (or /reading/010625)
+    curl "localhost:8000/range?start=2025-04-13&end=2025-04-20"
+    curl localhost:8000/holy-days/2025
+
+Every response carries a strong ETag (a hash of its body) and a
+Cache-Control header; a request whose If-None-Match matches gets a 304.
+Bodies are encoded once per data version and reused until the next reload.
+load_test_service.py measures the latency at a given request rate.
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from reading_schema import date_key, entry_date
+
+DEFAULT_PORT = 8000
+DEFAULT_MAX_AGE = 300
+DEFAULT_RELOAD_INTERVAL = 2.0
+MAX_RANGE_DAYS = 366
+RESPONSE_CACHE_SIZE = 4096
+
+def parse_date(value):
+    """A date from "YYYY-MM-DD" or the MMDDYY key; ValueError otherwise."""
+    if len(value) == 6 and value.isdigit():
+        return datetime.strptime(value, "%m%d%y").date()
+    return date.fromisoformat(value)
+
+class ReadingsIndex:
+    """
+    Immutable date index over output rows. by_key mirrors readingsMap in
+    localReadingsService.js (the last row of a date wins); the rows are also
+    kept in date order for range queries.
+    """
+
+    def __init__(self, rows, version=None):
+        self.version = version
+        self.rows = sorted(rows, key=entry_date)
+        self.ordinals = [entry_date(row).toordinal() for row in self.rows]
+        self.by_key = {row["Date"]: row for row in self.rows}
+        self.holy_days = {}
+        for row in self.rows:
+            if row.get("Holy Day of Obligation") is True:
+                self.holy_days.setdefault(str(row["Year"]), []).append(row["Date"])
+
+    @classmethod
+    def load(cls, path):
+        stat = os.stat(path)
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        return cls(rows, version=(stat.st_mtime_ns, stat.st_size))
+
+    def reading(self, value):
+        return self.by_key.get(date_key(value))
+
+    def in_range(self, start, end):
+        lo = bisect_left(self.ordinals, start.toordinal())
+        hi = bisect_right(self.ordinals, end.toordinal())
+        return self.rows[lo:hi]
+
+    def holy_days_of(self, year):
+        """MMDDYY keys of the holy days of obligation of a year, like getHolyDays()."""
+        return self.holy_days.get(str(year), [])
+
+class ReadingsService:
+    """Holds the current index, answers lookups and swaps in a new index when the file changes."""
+
+    def __init__(self, path, max_age=DEFAULT_MAX_AGE):
+        self.path = Path(path)
+        self.cache_control = f"public, max-age={max_age}"
+        self.index = ReadingsIndex.load(self.path)
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def reload_if_changed(self):
+        """Reloads the JSON when its mtime or size changed. Returns whether it did."""
+        try:
+            stat = os.stat(self.path)
+            if (stat.st_mtime_ns, stat.st_size) == self.index.version:
+                return False
+            index = ReadingsIndex.load(self.path)
+        except (OSError, ValueError) as e:
+            # Keep serving the previous data until the file is readable again
+            print(f"Reload of {self.path} failed: {e}")
+            return False
+        with self._lock:
+            self.index = index
+            self._responses = {}
+        print(f"Reloaded {len(index.rows)} readings from {self.path}")
+        return True
+
+    def watch(self, interval=DEFAULT_RELOAD_INTERVAL):
+        def loop():
+            while True:
+                time.sleep(interval)
+                self.reload_if_changed()
+        thread = threading.Thread(target=loop, name="readings-reload", daemon=True)
+        thread.start()
+        return thread
+
+    def _lookup(self, index, route, query):
+        """(status, payload) for a request path split into its parts."""
+        if len(route) == 2 and route[0] == "reading":
+            row = index.reading(parse_date(route[1]))
+            if row is None:
+                return HTTPStatus.NOT_FOUND, {"error": f"no reading for {route[1]}"}
+            return HTTPStatus.OK, row
+        if len(route) == 1 and route[0] == "range":
+            try:
+                start = parse_date(query["start"][0])
+                end = parse_date(query["end"][0])
+            except KeyError:
+                return HTTPStatus.BAD_REQUEST, {"error": "range needs start and end"}
+            if end < start or (end - start).days >= MAX_RANGE_DAYS:
+                return HTTPStatus.BAD_REQUEST, {"error": f"range must run forward and span at most {MAX_RANGE_DAYS} days"}
+            return HTTPStatus.OK, index.in_range(start, end)
+        if len(route) == 2 and route[0] == "holy-days" and route[1].isdigit():
+            return HTTPStatus.OK, index.holy_days_of(int(route[1]))
+        return HTTPStatus.NOT_FOUND, {"error": "unknown path"}
+
+    def response(self, target):
+        """(status, body bytes, etag) for a request target such as "/reading/010625"."""
+        index = self.index
+        cached = self._responses.get(target)
+        if cached is not None and cached[0] is index:
+            return cached[1]
+
+        parts = urlsplit(target)
+        route = [part for part in parts.path.split("/") if part]
+        try:
+            status, payload = self._lookup(index, route, parse_qs(parts.query))
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        result = (status, body, etag)
+
+        with self._lock:
+            if self.index is index:
+                if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                    self._responses = {}
+                self._responses[target] = (index, result)
+        return result
+
+def make_handler(service):
+    class ReadingsRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # One send per response (handle_one_request flushes) and no Nagle delay on keep-alive connections
+        wbufsize = 64 * 1024
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            status, body, etag = service.response(self.path)
+            not_modified = status == HTTPStatus.OK and etag in _etag_list(self.headers.get("If-None-Match"))
+            self.send_response(HTTPStatus.NOT_MODIFIED if not_modified else status)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", service.cache_control if status == HTTPStatus.OK else "no-store")
+            if not_modified:
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReadingsRequestHandler
+
+def _etag_list(header):
+    if not header:
+        return ()
+    return [tag.strip() for tag in header.split(",")]
+
+class ReadingsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # socketserver listens with a backlog of 5, which drops connection bursts
+    request_queue_size = 128
+
+def make_server(service, host="127.0.0.1", port=DEFAULT_PORT):
+    return ReadingsHTTPServer((host, port), make_handler(service))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve readings by date over HTTP.")
+    parser.add_argument("--readings", type=Path, default=Path(__file__).parent / "extracted_readings.json",
+                        help="Readings to serve (default: calendars/extracted_readings.json).")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT}).")
+    parser.add_argument("--max-age", type=int, default=DEFAULT_MAX_AGE,
+                        help=f"Cache-Control max-age of successful responses in seconds (default: {DEFAULT_MAX_AGE}).")
+    parser.add_argument("--reload-interval", type=float, default=DEFAULT_RELOAD_INTERVAL,
+                        help=f"Seconds between checks for a changed JSON file (default: {DEFAULT_RELOAD_INTERVAL}).")
+    args = parser.parse_args(argv)
+
+    service = ReadingsService(args.readings, args.max_age)
+    service.watch(args.reload_interval)
+    server = make_server(service, args.host, args.port)
+    print(f"Serving {len(service.index.rows)} readings from {args.readings} on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Year (or month) sharded, minified copies of extracted_readings.json.
+
+Every shard holds the rows of one year (or one month with --shard-by month)
+in a compact form:
+
+    {"format": "readings-shard", "version": 1, "year": 2025, "month": null,
+     "strings": ["January", "Strict Fast", ...],
+     "rows": [{"Date": "010625", "Day": 6, "Title": "...", "Fasting": 1, ...}]}
+
+"Year" is stored once per shard, fields that are None (or a False holy-day
+flag) are left out, and the INTERNED_FIELDS hold an index into "strings"
+instead of the repeated text. manifest.json lists every shard with its row
+count, date range and sha256, so consumers fetch only the shards they need
+and re-fetch only the ones whose hash changed.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from reading_schema import READING_FIELDS, entry_date
+
+SHARDS_DIRNAME = "shards"
+MANIFEST_FILENAME = "manifest.json"
+SHARD_FORMAT = "readings-shard"
+MANIFEST_FORMAT = "readings-shard-manifest"
+SHARDS_FORMAT_VERSION = 1
+SHARD_BY_CHOICES = ("year", "month")
+
+INTERNED_FIELDS = ("Month", "Tone", "Matins Gospel", "Fasting", "Canada Holiday", "USA Holiday")
+COMPACT_SEPARATORS = (",", ":")
+
+def shard_filename(year, month=None):
+    return f"{year}.json" if month is None else f"{year}-{month:02d}.json"
+
+def _write_atomic(path, data):
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+def encode_shard(year, month, rows):
+    """Compact JSON bytes of one shard."""
+    strings = []
+    string_ids = {}
+    compact_rows = []
+    for row in rows:
+        compact = {}
+        for field in READING_FIELDS:
+            value = row.get(field)
+            if value is None or field == "Year" or (field == "Holy Day of Obligation" and not value):
+                continue
+            if field in INTERNED_FIELDS:
+                string_id = string_ids.get(value)
+                if string_id is None:
+                    string_id = string_ids[value] = len(strings)
+                    strings.append(value)
+                value = string_id
+            compact[field] = value
+        compact_rows.append(compact)
+
+    shard = {
+        "format": SHARD_FORMAT,
+        "version": SHARDS_FORMAT_VERSION,
+        "year": year,
+        "month": month,
+        "strings": strings,
+        "rows": compact_rows
+    }
+    return json.dumps(shard, separators=COMPACT_SEPARATORS, ensure_ascii=False).encode("utf-8")
+
+def decode_shard(data):
+    """Rows of a shard (bytes, str or parsed dict) in the extracted_readings.json shape."""
+    shard = json.loads(data) if isinstance(data, (bytes, str)) else data
+    if shard.get("format") != SHARD_FORMAT or shard.get("version") != SHARDS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported readings shard {shard.get('format')} v{shard.get('version')}")
+
+    strings = shard["strings"]
+    year = str(shard["year"])
+    rows = []
+    for compact in shard["rows"]:
+        row = {}
+        for field in READING_FIELDS:
+            value = compact.get(field)
+            if field == "Year":
+                value = year
+            elif field == "Holy Day of Obligation":
+                value = bool(value)
+            elif field in INTERNED_FIELDS and value is not None:
+                value = strings[value]
+            row[field] = value
+        rows.append(row)
+    return rows
+
+class ShardedOutputWriter:
+    """
+    Row writer (see write_output_files) that writes a shard as soon as the
+    rows of its year or month are complete, then manifest.json on close.
+    Rows must arrive in date order. Shards from an earlier run that are no
+    longer produced are deleted.
+    """
+
+    def __init__(self, shards_dir, shard_by="year"):
+        if shard_by not in SHARD_BY_CHOICES:
+            raise ValueError(f"shard_by must be one of {SHARD_BY_CHOICES}")
+        self.shards_dir = Path(shards_dir)
+        self.shard_by = shard_by
+        self.shards = []
+        self._current_key = None
+        self._current_rows = []
+        self._current_dates = []
+
+    def __enter__(self):
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._flush()
+            self._write_manifest()
+        return False
+
+    def write_row(self, row):
+        row_date = entry_date(row)
+        key = (row_date.year, row_date.month if self.shard_by == "month" else None)
+        if key != self._current_key:
+            self._flush()
+            self._current_key = key
+        self._current_rows.append(row)
+        self._current_dates.append(row_date)
+
+    def _flush(self):
+        if not self._current_rows:
+            return
+        year, month = self._current_key
+        data = encode_shard(year, month, self._current_rows)
+        filename = shard_filename(year, month)
+        _write_atomic(self.shards_dir / filename, data)
+        self.shards.append({
+            "path": filename,
+            "year": year,
+            "month": month,
+            "rows": len(self._current_rows),
+            "first_date": min(self._current_dates).isoformat(),
+            "last_date": max(self._current_dates).isoformat(),
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest()
+        })
+        self._current_rows = []
+        self._current_dates = []
+
+    def _write_manifest(self):
+        manifest_path = self.shards_dir / MANIFEST_FILENAME
+        written = {shard["path"] for shard in self.shards}
+        try:
+            previous = load_manifest(self.shards_dir)
+        except (OSError, ValueError):
+            previous = {"shards": []}
+        for shard in previous["shards"]:
+            stale_path = self.shards_dir / shard["path"]
+            if shard["path"] not in written and stale_path.parent == self.shards_dir and stale_path.exists():
+                stale_path.unlink()
+
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "version": SHARDS_FORMAT_VERSION,
+            "shard_by": self.shard_by,
+            "shards": self.shards
+        }
+        _write_atomic(manifest_path, (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+
+def load_manifest(shards_dir):
+    with open(Path(shards_dir) / MANIFEST_FILENAME, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("version") != SHARDS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported shard manifest in {shards_dir}")
+    return manifest
+
+def iter_sharded_readings(shards_dir, years=None, verify=False):
+    """
+    Yields the rows of every shard (only those of the given years when
+    years is set) in manifest order, loading one shard at a time. With
+    verify=True a shard whose sha256 does not match the manifest raises
+    ValueError.
+    """
+    shards_dir = Path(shards_dir)
+    wanted = None if years is None else {int(year) for year in years}
+    for shard in load_manifest(shards_dir)["shards"]:
+        if wanted is not None and shard["year"] not in wanted:
+            continue
+        data = (shards_dir / shard["path"]).read_bytes()
+        if verify and hashlib.sha256(data).hexdigest() != shard["sha256"]:
+            raise ValueError(f"Shard {shard['path']} does not match its manifest hash")
+        yield from decode_shard(data)
@@ -0,0 +1,330 @@
+"""
+Structured scripture references.
+
+parse_reference() turns the free-form strings produced by
+normalize_scripture_reference() ("Heb. 7:26-8:2", "Lk 1:1-25;57-68; 76-80",
+"Acts. 6:8 to 7:5a and 47-60") into a tuple of (start, end) verse ranges.
+Every verse is packed into one integer, BBCCCVVV:
+
+    verse_id = book_id * 1_000_000 + chapter * 1_000 + verse
+
+so a range is two ints, ranges of one book sort together and an overlap
+test is two comparisons. Book ids follow the 73-book Catholic canon
+(Genesis = 1, Matthew = 47, Revelation = 73), which is also the order of
+the Douay-Rheims Bible. All spellings of a book ("Rom.", "Romans", "Ro")
+resolve through the single BOOK_ALIASES table.
+"""
+import re
+import sys
+from functools import lru_cache
+
+BOOK_ID_FACTOR = 1_000_000
+CHAPTER_FACTOR = 1_000
+# Verse number standing for "to the end of the chapter" in whole-chapter references
+LAST_VERSE = 999
+
+# (canonical name, other spellings) in canon order; the position + 1 is the book id.
+# Spellings are compared lower-case without spaces or periods.
+BOOKS = (
+    ("Genesis", "gen", "ge", "gn"),
+    ("Exodus", "exod", "exo", "ex"),
+    ("Leviticus", "lev", "lv"),
+    ("Numbers", "num", "nm", "nb"),
+    ("Deuteronomy", "deut", "dt"),
+    ("Joshua", "josh", "jos", "josue"),
+    ("Judges", "judg", "jdg"),
+    ("Ruth", "ru", "rt"),
+    ("1 Samuel", "1sam", "1sm", "1kingdoms"),
+    ("2 Samuel", "2sam", "2sm", "2kingdoms"),
+    ("1 Kings", "1kgs", "1kg", "3kings", "3kgs"),
+    ("2 Kings", "2kgs", "2kg", "4kings", "4kgs"),
+    ("1 Chronicles", "1chron", "1chr", "1paralipomenon", "1par"),
+    ("2 Chronicles", "2chron", "2chr", "2paralipomenon", "2par"),
+    ("Ezra", "ezr", "1esdras", "1esd"),
+    ("Nehemiah", "neh", "2esdras", "2esd"),
+    ("Tobit", "tob", "tb", "tobias"),
+    ("Judith", "jdt", "jth"),
+    ("Esther", "esth", "est"),
+    ("1 Maccabees", "1macc", "1mac", "1mc", "1machabees"),
+    ("2 Maccabees", "2macc", "2mac", "2mc", "2machabees"),
+    ("Job", "jb"),
+    ("Psalms", "psalm", "ps", "pss", "psa"),
+    ("Proverbs", "prov", "prv", "pr"),
+    ("Ecclesiastes", "eccl", "eccles", "ecc", "qoheleth"),
+    ("Song of Songs", "songofsolomon", "song", "sg", "canticleofcanticles", "canticles", "cant"),
+    ("Wisdom", "wis", "ws", "wisdomofsolomon"),
+    ("Sirach", "sir", "ecclesiasticus", "ecclus"),
+    ("Isaiah", "isa", "is", "isaias"),
+    ("Jeremiah", "jer", "jeremias"),
+    ("Lamentations", "lam"),
+    ("Baruch", "bar"),
+    ("Ezekiel", "ezek", "ez", "ezechiel"),
+    ("Daniel", "dan", "dn"),
+    ("Hosea", "hos", "osee"),
+    ("Joel", "jl"),
+    ("Amos", "am"),
+    ("Obadiah", "obad", "ob", "abdias"),
+    ("Jonah", "jon", "jonas"),
+    ("Micah", "mic", "micheas"),
+    ("Nahum", "nah"),
+    ("Habakkuk", "hab", "habacuc"),
+    ("Zephaniah", "zeph", "zep", "sophonias"),
+    ("Haggai", "hag", "hg", "aggeus"),
+    ("Zechariah", "zech", "zec", "zacharias"),
+    ("Malachi", "mal", "malachias"),
+    ("Matthew", "matt", "mat", "mt"),
+    ("Mark", "mk", "mrk", "mar"),
+    ("Luke", "lk", "luk", "lu"),
+    ("John", "jn", "jhn", "joh"),
+    ("Acts", "act", "ac", "actsoftheapostles"),
+    ("Romans", "rom", "ro", "rm"),
+    ("1 Corinthians", "1cor", "1co"),
+    ("2 Corinthians", "2cor", "2co"),
+    ("Galatians", "gal", "ga"),
+    ("Ephesians", "eph", "ephes", "efes", "efe"),
+    ("Philippians", "phil", "php", "pp"),
+    ("Colossians", "col", "co"),
+    ("1 Thessalonians", "1thess", "1thes", "1th"),
+    ("2 Thessalonians", "2thess", "2thes", "2th"),
+    ("1 Timothy", "1tim", "1ti", "1tm"),
+    ("2 Timothy", "2tim", "2ti", "2tm"),
+    ("Titus", "tit", "ti"),
+    ("Philemon", "philem", "phlm", "phm"),
+    ("Hebrews", "heb", "he"),
+    ("James", "jas", "jam", "jm"),
+    ("1 Peter", "1pet", "1pt", "1pe"),
+    ("2 Peter", "2pet", "2pt", "2pe"),
+    ("1 John", "1jn", "1jo", "1jhn"),
+    ("2 John", "2jn", "2jo", "2jhn"),
+    ("3 John", "3jn", "3jo", "3jhn"),
+    ("Jude", "jud", "jd"),
+    ("Revelation", "rev", "apocalypse", "apoc", "apo", "rv"),
+)
+
+BOOK_NAMES = tuple(sys.intern(names[0]) for names in BOOKS)
+SINGLE_CHAPTER_BOOKS = frozenset(BOOK_NAMES.index(name) + 1 for name in ("Obadiah", "Philemon", "2 John", "3 John", "Jude"))
+
+def _alias_key(name):
+    return name.lower().replace(" ", "").replace(".", "")
+
+BOOK_ALIASES = {}
+for _book_id, _names in enumerate(BOOKS, start=1):
+    for _name in _names:
+        BOOK_ALIASES[sys.intern(_alias_key(_name))] = _book_id
+
+# Two-letter spellings that are also English words ("He is risen"); they
+# only name a book when a chapter:verse follows, as in "Is 7:14"
+AMBIGUOUS_BOOK_ALIASES = frozenset(("is", "am", "ac", "pp", "co", "he"))
+
+# Passages of the eleven Resurrection (Matins) Gospels, indexed by the number
+# that follows "Res. Gospel" in the calendars (MATINS_RES_RE)
+RESURRECTION_GOSPELS = {
+    1: "Matthew 28:16-20",
+    2: "Mark 16:1-8",
+    3: "Mark 16:9-20",
+    4: "Luke 24:1-12",
+    5: "Luke 24:12-35",
+    6: "Luke 24:36-53",
+    7: "John 20:1-10",
+    8: "John 20:11-18",
+    9: "John 20:19-31",
+    10: "John 21:1-14",
+    11: "John 21:15-25",
+}
+
+REFERENCE_TOKEN_RE = re.compile(r'\d+|[A-Za-z]+|[:;,.\-]')
+VERSE_SUFFIX_RE = re.compile(r'(?<=\d)[a-d]\b')
+SEPARATORS = (",", ";", ".")
+
+def pack_verse(book_id, chapter, verse):
+    return book_id * BOOK_ID_FACTOR + chapter * CHAPTER_FACTOR + verse
+
+def unpack_verse(verse_id):
+    """(book_id, chapter, verse) of a packed verse id."""
+    book_id, rest = divmod(verse_id, BOOK_ID_FACTOR)
+    chapter, verse = divmod(rest, CHAPTER_FACTOR)
+    return book_id, chapter, verse
+
+def book_id(name):
+    """Book id for any known spelling ("1 Cor.", "Romans", "Lk"), or None."""
+    if not name:
+        return None
+    return BOOK_ALIASES.get(_alias_key(name))
+
+def book_name(book_id_value):
+    return BOOK_NAMES[book_id_value - 1]
+
+def format_range(start, end):
+    """Canonical text of one packed range, e.g. "Hebrews 7:26-8:2"."""
+    book, start_chapter, start_verse = unpack_verse(start)
+    _, end_chapter, end_verse = unpack_verse(end)
+    text = f"{book_name(book)} {start_chapter}"
+    if start_verse == 1 and end_verse == LAST_VERSE:
+        return text if end_chapter == start_chapter else f"{text}-{end_chapter}"
+    text += f":{start_verse}"
+    if end_chapter != start_chapter:
+        return f"{text}-{end_chapter}:{end_verse}"
+    return text if end_verse == start_verse else f"{text}-{end_verse}"
+
+def format_ranges(ranges):
+    return "; ".join(format_range(start, end) for start, end in ranges)
+
+def _tokenize(text):
+    """
+    Tokens of a reference with "to" read as "-", "and" as "," and "1 Cor"
+    merged into one book token. AMBIGUOUS_BOOK_ALIASES not followed by a
+    chapter:verse are read as words.
+    """
+    tokens = []
+    for token in REFERENCE_TOKEN_RE.findall(VERSE_SUFFIX_RE.sub("", text.replace("_", ":"))):
+        lowered = token.lower()
+        if lowered == "to":
+            tokens.append("-")
+        elif lowered == "and":
+            tokens.append(",")
+        elif token[0].isalpha():
+            if tokens and tokens[-1] in ("1", "2", "3") and (tokens[-1] + lowered) in BOOK_ALIASES:
+                tokens[-1] = ("book", BOOK_ALIASES[tokens[-1] + lowered])
+            elif lowered in AMBIGUOUS_BOOK_ALIASES:
+                # Kept as a book only if _chapter_verse_follows() below
+                tokens.append(("book", BOOK_ALIASES[lowered], token))
+            elif lowered in BOOK_ALIASES:
+                tokens.append(("book", BOOK_ALIASES[lowered]))
+            else:
+                tokens.append(("word", token))
+        else:
+            tokens.append(token)
+    for idx, token in enumerate(tokens):
+        if isinstance(token, tuple) and len(token) == 3 and not _chapter_verse_follows(tokens, idx + 1):
+            tokens[idx] = ("word", token[2])
+    return tokens
+
+def _chapter_verse_follows(tokens, idx):
+    if idx < len(tokens) and tokens[idx] == ".":
+        idx += 1
+    return (
+        idx + 2 < len(tokens) and tokens[idx + 1] == ":"
+        and isinstance(tokens[idx], str) and tokens[idx].isdigit()
+        and isinstance(tokens[idx + 2], str) and tokens[idx + 2].isdigit()
+    )
+
+@lru_cache(maxsize=4096)
+def parse_reference(text):
+    """
+    Tuple of (start, end) packed verse ranges for a reference string, in
+    the order written, or () when it holds no recognizable book and verse.
+    Parsing stops at the first word that is not a book name, so trailing
+    notes ("John 11:1-45 Commemoration of ...") are ignored; ranges whose
+    end precedes their start are dropped.
+    """
+    if not text:
+        return ()
+
+    tokens = _tokenize(text)
+    has_verses = ":" in tokens
+    ranges = []
+    book = None
+    chapter = None
+    range_start = None      # packed start of a range waiting for its end after "-"
+    last_single = None      # index in ranges of the last single verse, extendable by "-"
+    idx = 0
+
+    def read_point():
+        """Reads "C:V", "V" or (whole chapter) "C" at idx. Returns (chapter, verse, is_whole_chapter)."""
+        nonlocal idx
+        number = int(tokens[idx])
+        idx += 1
+        if idx + 1 < len(tokens) and tokens[idx] == ":" and isinstance(tokens[idx + 1], str) and tokens[idx + 1].isdigit():
+            verse = int(tokens[idx + 1])
+            idx += 2
+            return number, verse, False
+        if chapter is None:
+            if book in SINGLE_CHAPTER_BOOKS:
+                return 1, number, False
+            if has_verses and idx + 1 < len(tokens) and tokens[idx] in (",", "-") and isinstance(tokens[idx + 1], str) and tokens[idx + 1].isdigit():
+                # "Heb 7,26-28" / "Heb. 7-26-8:2": a comma or dash typed for the chapter colon
+                verse = int(tokens[idx + 1])
+                idx += 2
+                return number, verse, False
+            if not has_verses:
+                return number, None, True
+        if not has_verses and book not in SINGLE_CHAPTER_BOOKS:
+            return number, None, True
+        return chapter, number, False
+
+    while idx < len(tokens):
+        token = tokens[idx]
+        if isinstance(token, tuple):
+            if token[0] == "word":
+                if ranges or range_start is not None:
+                    break
+                return ()
+            book, chapter, range_start, last_single = token[1], None, None, None
+            idx += 1
+            continue
+        if token in SEPARATORS or token == ":":
+            idx += 1
+            continue
+        if token == "-":
+            idx += 1
+            if last_single is not None:
+                range_start = ranges.pop(last_single)[0]
+                last_single = None
+            continue
+        if book is None:
+            return ()
+
+        point_chapter, verse, whole_chapter = read_point()
+        if whole_chapter:
+            start, end = pack_verse(book, point_chapter, 1), pack_verse(book, point_chapter, LAST_VERSE)
+        else:
+            start = end = pack_verse(book, point_chapter, verse)
+        chapter = point_chapter
+
+        if range_start is not None:
+            if end >= range_start:
+                ranges.append((range_start, end))
+            range_start = None
+            last_single = None
+        else:
+            ranges.append((start, end))
+            last_single = len(ranges) - 1
+
+    if range_start is not None:
+        ranges.append((range_start, range_start))
+    return tuple(ranges)
+
+def resurrection_gospel_ranges(number):
+    """Ranges of Resurrection Gospel 1-11 ("5" or 5), or () for anything else."""
+    try:
+        reference = RESURRECTION_GOSPELS.get(int(number))
+    except (TypeError, ValueError):
+        return ()
+    return parse_reference(reference) if reference else ()
+
+def matins_gospel_ranges(value):
+    """The "Matins Gospel" field is either a Resurrection Gospel number or a reference."""
+    if value and str(value).strip().isdigit():
+        return resurrection_gospel_ranges(value)
+    return parse_reference(value)
+
+REFERENCE_RANGE_FIELDS = {
+    "Matins Gospel": "Matins Gospel Ranges",
+    "Epistle": "Epistle Ranges",
+    "Gospel": "Gospel Ranges",
+}
+
+def entry_ranges(row, field):
+    """
+    Verse ranges of a reference field ("Epistle", "Gospel" or "Matins
+    Gospel") of an output row, taken from the emitted "<field> Ranges" when
+    present and parsed from the string for outputs written before it existed.
+    """
+    ranges = row.get(REFERENCE_RANGE_FIELDS[field])
+    if ranges is not None:
+        return tuple(tuple(verse_range) for verse_range in ranges)
+    if REFERENCE_RANGE_FIELDS[field] in row:
+        return ()
+    if field == "Matins Gospel":
+        return matins_gospel_ranges(row.get(field))
+    return parse_reference(row.get(field))
@@ -0,0 +1,289 @@
+"""
+Offline scripture text store.
+
+Ingests a locally supplied Douay-Rheims text file into a SQLite store keyed
+by the packed verse ids of scripture_refs.py, so a passage is one primary
+key range scan, then pre-renders the Epistle, Gospel and Matins Gospel text
+of every date in extracted_readings.json so a day is served by one lookup:
+
+    python scripture_text.py build --source douay_rheims.txt
+    python scripture_text.py show 2025-01-06
+    python scripture_text.py show "Luke 8:5-15"
+
+Two source layouts are understood, one verse per line:
+
+    Genesis 1:1 In the beginning God created heaven, and earth.
+
+or the Project Gutenberg edition, with "<Book> Chapter <n>" headings and
+"1:1. In the beginning ..." verses that may wrap over several lines.
+Book names are read with the Douay-Rheims numbering, so "1 Kings" is
+1 Samuel and "3 Kings" is 1 Kings.
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from reading_schema import entry_date
+from scripture_refs import (
+    BOOK_ALIASES,
+    REFERENCE_RANGE_FIELDS,
+    entry_ranges,
+    format_ranges,
+    pack_verse,
+    parse_reference,
+    unpack_verse,
+)
+
+SCRIPTURE_STORE_FILENAME = "scripture.sqlite"
+SCRIPTURE_STORE_SCHEMA_VERSION = 1
+
+# Douay-Rheims names whose number means a different book than in modern Bibles
+DOUAY_RHEIMS_BOOK_OVERRIDES = {
+    "1kings": BOOK_ALIASES["1samuel"],
+    "2kings": BOOK_ALIASES["2samuel"],
+    "1kgs": BOOK_ALIASES["1samuel"],
+    "2kgs": BOOK_ALIASES["2samuel"],
+}
+
+VERSE_LINE_RE = re.compile(r'^\s*((?:[1-4]\s*)?[A-Za-z][A-Za-z .]*?)\.?\s+(\d+)\s*:\s*(\d+)\.?\s+(.+?)\s*$')
+CHAPTER_HEADING_RE = re.compile(r'^\s*((?:[1-4]\s*)?[A-Za-z][A-Za-z .]*?)\s+Chapter\s+(\d+)\s*$', re.IGNORECASE)
+NUMBERED_VERSE_RE = re.compile(r'^\s*(\d+)\s*:\s*(\d+)\.?\s+(.*?)\s*$')
+WHITESPACE_RE = re.compile(r'\s+')
+
+SCHEMA = """
+CREATE TABLE verses (
+    verse_id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE passages (
+    reference TEXT PRIMARY KEY,
+    ranges TEXT NOT NULL,
+    text TEXT
+);
+CREATE TABLE day_passages (
+    iso_date TEXT PRIMARY KEY,
+    readings TEXT NOT NULL
+);
+"""
+
+def douay_rheims_book_id(name):
+    key = name.lower().replace(" ", "").replace(".", "")
+    return DOUAY_RHEIMS_BOOK_OVERRIDES.get(key) or BOOK_ALIASES.get(key)
+
+def iter_source_verses(lines):
+    """Yields (verse_id, text) from either supported source layout."""
+    book = None
+    chapter_book = None
+    verse_id = None
+    verse_parts = []
+
+    def finish():
+        if verse_id is not None and verse_parts:
+            return verse_id, WHITESPACE_RE.sub(" ", " ".join(verse_parts)).strip()
+        return None
+
+    for line in lines:
+        match = VERSE_LINE_RE.match(line)
+        if match and douay_rheims_book_id(match.group(1)):
+            done = finish()
+            if done:
+                yield done
+            verse_id = None
+            verse_parts = []
+            book = douay_rheims_book_id(match.group(1))
+            yield pack_verse(book, int(match.group(2)), int(match.group(3))), match.group(4)
+            continue
+
+        heading = CHAPTER_HEADING_RE.match(line)
+        if heading and douay_rheims_book_id(heading.group(1)):
+            done = finish()
+            if done:
+                yield done
+            verse_id = None
+            verse_parts = []
+            chapter_book = douay_rheims_book_id(heading.group(1))
+            continue
+
+        numbered = NUMBERED_VERSE_RE.match(line)
+        if numbered and chapter_book:
+            done = finish()
+            if done:
+                yield done
+            verse_id = pack_verse(chapter_book, int(numbered.group(1)), int(numbered.group(2)))
+            verse_parts = [numbered.group(3)]
+        elif not line.strip():
+            # A blank line ends a wrapped verse (chapter summaries sit between blank lines)
+            done = finish()
+            if done:
+                yield done
+            verse_id = None
+            verse_parts = []
+        elif verse_id is not None:
+            verse_parts.append(line.strip())
+
+    done = finish()
+    if done:
+        yield done
+
+def render_passage(verses):
+    """
+    Text of (verse_id, text) pairs in order, each verse prefixed by its
+    number and by "chapter:" at the start and whenever the chapter changes.
+    """
+    parts = []
+    chapter = None
+    for verse_id, text in verses:
+        _, verse_chapter, verse = unpack_verse(verse_id)
+        label = f"{verse_chapter}:{verse}" if verse_chapter != chapter else str(verse)
+        chapter = verse_chapter
+        parts.append(f"{label} {text}")
+    return " ".join(parts) if parts else None
+
+def _passage_verses(conn, ranges):
+    verses = []
+    for start, end in ranges:
+        verses.extend(conn.execute(
+            "SELECT verse_id, text FROM verses WHERE verse_id BETWEEN ? AND ? ORDER BY verse_id", (start, end)
+        ))
+    return verses
+
+def build_scripture_store(source_path, store_path, rows=()):
+    """
+    Builds the store from a Douay-Rheims text file and pre-renders the
+    passages of rows (output rows of extract_readings.py). Returns
+    (verse count, rendered passage count, references without text).
+    """
+    store_path = Path(store_path)
+    fd, tmp_name = tempfile.mkstemp(dir=store_path.parent, suffix=".sqlite.tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_name)
+        try:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCRIPTURE_STORE_SCHEMA_VERSION}")
+            with open(source_path, "r", encoding="utf-8-sig") as f:
+                conn.executemany("INSERT OR REPLACE INTO verses (verse_id, text) VALUES (?, ?)", iter_source_verses(f))
+            verse_count = conn.execute("SELECT COUNT(*) FROM verses").fetchone()[0]
+
+            passages = {}
+            missing = set()
+            days = {}
+            for row in rows:
+                readings = []
+                for field in REFERENCE_RANGE_FIELDS:
+                    ranges = entry_ranges(row, field)
+                    if not ranges:
+                        continue
+                    reference = format_ranges(ranges)
+                    if reference not in passages:
+                        passages[reference] = (ranges, render_passage(_passage_verses(conn, ranges)))
+                        if passages[reference][1] is None:
+                            missing.add(reference)
+                    readings.append({"field": field, "reference": reference, "text": passages[reference][1]})
+                days.setdefault(entry_date(row).isoformat(), []).extend(readings)
+
+            conn.executemany(
+                "INSERT INTO passages (reference, ranges, text) VALUES (?, ?, ?)",
+                ((reference, json.dumps(ranges), text) for reference, (ranges, text) in passages.items())
+            )
+            conn.executemany(
+                "INSERT INTO day_passages (iso_date, readings) VALUES (?, ?)",
+                ((iso_date, json.dumps(readings, ensure_ascii=False)) for iso_date, readings in days.items())
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, store_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+    return verse_count, len(passages), sorted(missing)
+
+class ScriptureStore:
+    """Read-only access to a store written by build_scripture_store()."""
+
+    def __init__(self, path=None):
+        path = Path(path) if path else Path(__file__).parent / SCRIPTURE_STORE_FILENAME
+        if not path.exists():
+            raise FileNotFoundError(f"Scripture store not found at {path}")
+        self._conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCRIPTURE_STORE_SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(f"Unsupported scripture store version {version} in {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._conn.close()
+
+    def day(self, value):
+        """
+        Pre-rendered readings of one date (a date or "YYYY-MM-DD"): a list of
+        {"field", "reference", "text"} dicts, empty for unknown dates.
+        """
+        iso_date = value.isoformat() if isinstance(value, date) else date.fromisoformat(value).isoformat()
+        found = self._conn.execute("SELECT readings FROM day_passages WHERE iso_date = ?", (iso_date,)).fetchone()
+        return json.loads(found[0]) if found else []
+
+    def passage(self, reference):
+        """Text of any reference, pre-rendered or not; None when the store has none of its verses."""
+        ranges = parse_reference(reference) if isinstance(reference, str) else tuple(reference)
+        if not ranges:
+            raise ValueError(f"Unrecognized scripture reference {reference!r}")
+        found = self._conn.execute("SELECT text FROM passages WHERE reference = ?", (format_ranges(ranges),)).fetchone()
+        if found:
+            return found[0]
+        return render_passage(_passage_verses(self._conn, ranges))
+
+def main(argv=None):
+    calendars_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Build or query the offline Douay-Rheims scripture store.")
+    parser.add_argument("--store", type=Path, default=calendars_dir / SCRIPTURE_STORE_FILENAME,
+                        help=f"Store path (default: calendars/{SCRIPTURE_STORE_FILENAME}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Ingest a Douay-Rheims text file and pre-render the readings.")
+    build.add_argument("--source", type=Path, required=True, help="Douay-Rheims text file (UTF-8).")
+    build.add_argument("--readings", type=Path, default=calendars_dir / "extracted_readings.json",
+                       help="Readings to pre-render (default: calendars/extracted_readings.json).")
+    show = commands.add_parser("show", help="Print the readings of a date (YYYY-MM-DD) or the text of a reference.")
+    show.add_argument("target")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        with open(args.readings, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        verse_count, passage_count, missing = build_scripture_store(args.source, args.store, rows)
+        print(f"Stored {verse_count} verses and {passage_count} pre-rendered passages in {args.store}")
+        if missing:
+            print(f"{len(missing)} references have no text in {args.source}:")
+            for reference in missing:
+                print(f"  {reference}")
+        return
+
+    try:
+        target_date = date.fromisoformat(args.target)
+    except ValueError:
+        target_date = None
+    with ScriptureStore(args.store) as store:
+        try:
+            result = store.day(target_date) if target_date else store.passage(args.target)
+        except ValueError as e:
+            parser.error(str(e))
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Synthesizes month-grid calendar PDFs shaped like the parish calendars, for
+benchmarking the extraction pipeline well past the real corpus.
+
+Files are written as <out>/YYYY/NN Calendar YYYY Month.pdf so they can be fed
+straight to extract_readings.process_pdfs. Only the standard library is used:
+the PDFs draw the grid with stroked lines (what pdfplumber's table finder
+looks for) and the text in the built-in Helvetica font.
+"""
+import argparse
+import calendar
+import random
+import zlib
+from pathlib import Path
+
+PAGE_WIDTH = 792
+PAGE_HEIGHT = 612
+MARGIN = 30
+TITLE_HEIGHT = 28
+HEADER_HEIGHT = 16
+DAY_FONT_SIZE = 11
+TEXT_FONT_SIZE = 5.5
+TEXT_LEADING = 6.5
+# Conservative per-character width (in ems) for Helvetica, uppercase included
+AVERAGE_CHAR_WIDTH = 0.62
+
+WEEKDAY_HEADERS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+SUNDAY_TITLES = [
+    "SUNDAY AFTER PENTECOST", "SUNDAY OF THE PUBLICAN AND PHARISEE",
+    "SUNDAY OF THE PRODIGAL SON", "SUNDAY OF ALL SAINTS", "SUNDAY OF THE HOLY FATHERS",
+    "SUNDAY OF THE MYRRH-BEARING WOMEN", "SUNDAY OF THE PARALYTIC", "SUNDAY OF THE BLIND MAN"
+]
+FEAST_TITLES = [
+    "(†) THEOPHANY OF OUR LORD", "(†) ENCOUNTER OF OUR LORD", "(†) ANNUNCIATION",
+    "(†) TRANSFIGURATION OF OUR LORD", "(†) DORMITION OF THE THEOTOKOS",
+    "(†) NATIVITY OF THE THEOTOKOS", "(†) EXALTATION OF THE HOLY CROSS", "(†) NATIVITY OF OUR LORD"
+]
+SAINTS = [
+    "St. Nicholas the Wonderworker", "St. Basil the Great", "Ss. Peter and Paul",
+    "St. John Chrysostom", "St. Demetrius", "Holy Prophet Elias", "St. Anthony the Great",
+    "Ss. Cyril and Methodius", "St. Sava", "Venerable Theodosius"
+]
+EPISTLES = [
+    "Rom 5:1-10", "Rom 12:6-14", "1 Cor 1:10-18", "1 Cor 15:1-11", "2 Cor 6:16-7:1",
+    "Gal 2:16-20", "Eph 2:4-10", "Phil 2:5-11", "Col 3:4-11", "1 Thess 4:13-17",
+    "2 Tim 3:10-15", "Heb 7:26-8:2", "Heb 11:33-12:2", "Jas 2:14-26", "1 Pet 1:1-2, 10-12"
+]
+GOSPELS = [
+    "Matt 4:18-23", "Matt 9:1-8", "Matt 14:22-34", "Matt 22:35-46", "Mark 1:1-8",
+    "Mark 8:34-9:1", "Luke 5:1-11", "Luke 8:5-15", "Luke 10:38-42, 11:27-28",
+    "Luke 18:10-14", "John 1:18-28", "John 5:1-15", "John 9:1-38", "John 20:19-31"
+]
+FASTING_LINES = ["Common Abstinence", "Strict Fast", "Strict Abstinence", "Dispensation (Bright Week)"]
+HOLIDAY_LINES = ["CANADA: Civic Holiday", "USA: Labor Day", "CANADA: Thanksgiving Day USA: Columbus Day"]
+
+def pdf_string(text):
+    """Encodes text as a PDF literal string in WinAnsiEncoding (Latin-1 superset)."""
+    raw = text.encode("cp1252", errors="replace")
+    escaped = raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(" + escaped + b")"
+
+class PageCanvas:
+    def __init__(self):
+        self.ops = []
+
+    def line(self, x0, top0, x1, top1, width=0.75):
+        # Callers use pdfplumber-style "top" coordinates; PDF y grows upwards
+        self.ops.append(
+            f"{width:.2f} w {x0:.2f} {PAGE_HEIGHT - top0:.2f} m {x1:.2f} {PAGE_HEIGHT - top1:.2f} l S".encode("ascii")
+        )
+
+    def text(self, x, top, size, value, font="F1"):
+        baseline = PAGE_HEIGHT - top - size
+        self.ops.append(
+            f"BT /{font} {size:.2f} Tf {x:.2f} {baseline:.2f} Td ".encode("ascii") + pdf_string(value) + b" Tj ET"
+        )
+
+    def content(self):
+        return b"\n".join(self.ops)
+
+def write_pdf(path, content):
+    stream = zlib.compress(content)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+         f"/Resources << /Font << /F1 4 0 R /F2 5 0 R >> >> /Contents 6 0 R >>").encode("ascii"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("ascii") + stream + b"\nendstream",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{obj_num} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode("ascii")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode("ascii")
+
+    Path(path).write_bytes(bytes(out))
+
+def wrap_text(text, width, size):
+    max_chars = max(4, int(width / (size * AVERAGE_CHAR_WIDTH)))
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            if current:
+                lines.append(current)
+            current = word[:max_chars]
+    if current:
+        lines.append(current)
+    return lines
+
+def day_reading_lines(rng, year, month, day):
+    weekday = calendar.weekday(year, month, day)
+    lines = []
+
+    if rng.random() < 0.08:
+        lines.append(rng.choice(FEAST_TITLES))
+        lines.append("Holy Day of Obligation")
+    elif weekday == 6:
+        ordinal = rng.randint(1, 32)
+        suffix = "th" if 10 <= ordinal % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(ordinal % 10, "th")
+        lines.append(f"{ordinal}{suffix} {rng.choice(SUNDAY_TITLES)}")
+        lines.append(f"Tone {rng.randint(1, 8)} Res. Gospel {rng.randint(1, 11)}")
+    else:
+        lines.append(rng.choice(SAINTS))
+
+    if weekday == 4 or rng.random() < 0.1:
+        lines.append(rng.choice(FASTING_LINES))
+
+    lines.append(f"Ep. {rng.choice(EPISTLES)}")
+    lines.append(f"Gospel: {rng.choice(GOSPELS)}")
+
+    if rng.random() < 0.04:
+        lines.append(rng.choice(HOLIDAY_LINES))
+    if weekday == 6 and rng.random() < 0.1:
+        lines.append("Following week readings: see bulletin")
+    return lines
+
+def month_week_rows(year, month, stack_last_week):
+    """
+    Returns a list of week rows, each a list of 7 lists of day numbers.
+    When a month needs six weeks and stack_last_week is set, the sixth week
+    is stacked into the fifth row (the "23/30" layout of the real calendars).
+    """
+    weeks = calendar.Calendar(firstweekday=6).monthdayscalendar(year, month)
+    rows = [[[day] if day else [] for day in week] for week in weeks]
+    if stack_last_week and len(rows) == 6:
+        for col_idx, day in enumerate(weeks[5]):
+            if day:
+                rows[4][col_idx].append(day)
+        rows = rows[:5]
+    return rows
+
+def render_month_pdf(path, year, month, rng, group_width=1, stack_last_week=True):
+    canvas = PageCanvas()
+    # Grouped cells keep the day number in its own physical column, so a
+    # stacked second day would be separated from its text; use a sixth row.
+    rows = month_week_rows(year, month, stack_last_week and group_width == 1)
+
+    grid_left = MARGIN
+    grid_right = PAGE_WIDTH - MARGIN
+    grid_top = MARGIN + TITLE_HEIGHT
+    grid_bottom = PAGE_HEIGHT - MARGIN
+    logical_width = (grid_right - grid_left) / 7
+    physical_width = logical_width / group_width
+    body_top = grid_top + HEADER_HEIGHT
+    row_height = (grid_bottom - body_top) / len(rows)
+
+    canvas.text(grid_left, MARGIN, 16, f"{calendar.month_name[month]} {year}", font="F2")
+
+    # Grid: horizontal lines across, vertical lines at every physical column
+    row_edges = [grid_top, body_top] + [body_top + row_height * (i + 1) for i in range(len(rows))]
+    for top in row_edges:
+        canvas.line(grid_left, top, grid_right, top)
+    for col in range(7 * group_width + 1):
+        x = grid_left + physical_width * col
+        canvas.line(x, grid_top, x, grid_bottom)
+
+    for col_idx, header in enumerate(WEEKDAY_HEADERS):
+        canvas.text(grid_left + logical_width * col_idx + 3, grid_top + 4, 7, header, font="F2")
+
+    for row_idx, week in enumerate(rows):
+        row_top = body_top + row_height * row_idx
+        for col_idx, days in enumerate(week):
+            if not days:
+                continue
+
+            cell_left = grid_left + logical_width * col_idx
+            text_left = cell_left + (physical_width if group_width > 1 else 0) + 2
+            text_width = (logical_width - (physical_width if group_width > 1 else 0)) - 4
+            slot_height = row_height / len(days)
+
+            for slot_idx, day in enumerate(days):
+                slot_top = row_top + slot_height * slot_idx + 2
+                # The day number sits top-left in a larger font, as on the real calendars
+                canvas.text(cell_left + 2, slot_top, DAY_FONT_SIZE, str(day), font="F2")
+
+                body_lines = []
+                for reading_line in day_reading_lines(rng, year, month, day):
+                    body_lines.extend(wrap_text(reading_line, text_width, TEXT_FONT_SIZE))
+
+                line_top = slot_top + (DAY_FONT_SIZE + 2 if group_width == 1 else 1)
+                max_lines = int((slot_height - (line_top - slot_top) - 2) // TEXT_LEADING)
+                for body_line in body_lines[:max(0, max_lines)]:
+                    canvas.text(text_left, line_top, TEXT_FONT_SIZE, body_line)
+                    line_top += TEXT_LEADING
+
+    write_pdf(path, canvas.content())
+
+def generate_calendar_corpus(out_dir, start_year=2030, months=120, seed=7, grouped_every=3, stack_last_week=True):
+    """
+    Writes `months` consecutive monthly calendars starting at January of
+    start_year. Every `grouped_every`-th month uses two physical columns per
+    weekday (the grouped-cell layout collapse_row_to_7_columns handles).
+    Returns the list of written paths.
+    """
+    rng = random.Random(seed)
+    out_path = Path(out_dir)
+    written = []
+
+    for month_offset in range(months):
+        year = start_year + month_offset // 12
+        month = month_offset % 12 + 1
+        month_name = calendar.month_name[month]
+
+        year_dir = out_path / str(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        pdf_path = year_dir / f"{month:02d} Calendar {year} {month_name}.pdf"
+
+        group_width = 2 if grouped_every and month_offset % grouped_every == grouped_every - 1 else 1
+        render_month_pdf(pdf_path, year, month, rng, group_width=group_width, stack_last_week=stack_last_week)
+        written.append(pdf_path)
+
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic month-grid calendar PDFs.")
+    parser.add_argument("out_dir", type=Path, help="Directory that receives the YYYY/ sub-directories.")
+    parser.add_argument("--months", type=int, default=120, help="Number of consecutive months to generate (default: 120).")
+    parser.add_argument("--start-year", type=int, default=2030, help="First calendar year (default: 2030).")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the cell text (default: 7).")
+    parser.add_argument("--grouped-every", type=int, default=3,
+                        help="Use two physical columns per weekday every N-th month, 0 to disable (default: 3).")
+    parser.add_argument("--no-stacking", action="store_true", help="Give six-week months a sixth row instead of stacking days.")
+    args = parser.parse_args(argv)
+
+    written = generate_calendar_corpus(
+        args.out_dir, args.start_year, args.months, args.seed, args.grouped_every, not args.no_stacking
+    )
+    print(f"Wrote {len(written)} calendar PDFs to {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import calendar
+import sys
+from pathlib import Path
+
+import pytest
+
+# The calendar scripts import each other as top-level modules, as when run from calendars/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reading_schema import READING_FIELDS
+
+def build_row(year, month, day, **fields):
+    """An output row in the enrich_entry() schema; extra fields use their output names."""
+    row = {field: None for field in READING_FIELDS}
+    row.update({
+        "Date": f"{month:02d}{day:02d}{str(year)[-2:]}",
+        "Year": str(year),
+        "Month": calendar.month_name[month],
+        "Day": day,
+        "Raw Text": f"{day}",
+        "Holy Day of Obligation": False
+    })
+    row.update(fields)
+    return row
+
+@pytest.fixture
+def make_row():
+    return build_row
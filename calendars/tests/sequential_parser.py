@@ -0,0 +1,129 @@
+"""
+The sequential search-and-replace parser that parse_reading_text replaced,
+kept as the reference its output is compared against.
+"""
+import re
+
+from extract_readings import (
+    EPISTLE_BEFORE_GOSPEL_RE,
+    FASTING_RE,
+    MATINS_RES_RE,
+    TAGS_RE,
+    TONE_RE,
+    WHITESPACE_RE,
+    clean_string,
+    normalize_mojibake,
+    normalize_scripture_reference,
+)
+
+MATINS_TEXT_RE = re.compile(r'Matins\s+Gospel:?\s*(.+?)(?=\s*(?:Divine Liturgy|Epistle|Gospel|Following)|$)', re.IGNORECASE)
+IMPLICIT_LITURGY_RE = re.compile(r'Divine Liturgy:?\s*([^;]+);\s*([^;]+?)(?=\s*(?:Following|\.\s*[A-Z]|$))', re.IGNORECASE)
+EPISTLE_RE = re.compile(r'(?:^|[\s,;.])(?:Epistle\b|Ep\b\.?)\s*:?\s*(.+?)(?=\s*(?:Gospel|G\s*:|Following)|$)', re.IGNORECASE)
+APOSTLE_EPISTLE_RE = re.compile(r'(?:^|[\s,;.])(?:Apostle\b|Apost\.)\s+((?:[1-3]\s*)?(?:Acts|Rom|Cor|Gal|Eph|Phil|Col|Thess|Tim|Tit|Phlm|Philem|Heb|Jas|James|Pet|Jude|Rev)\.?\s*[^;]*?\d\s*:\s*\d[^;]*?)(?=\s*(?:;\s*)?(?:Gospel|G\s*:|Following)|$)', re.IGNORECASE)
+GOSPEL_RE = re.compile(r'(?:^|[\s,;.])(?:Gospel|G\s*:)\s*(.+?)(?=\s*(?:Following|(?:Divine\s+)?Liturgy|Great\s+blessing\s+of\s+water|Holy\s+Day\s+of\s+Obligation|\.\s+[A-Z])|$)', re.IGNORECASE)
+DIVINE_LITURGY_HEADER_RE = re.compile(r'Divine Liturgy:?', re.IGNORECASE)
+CANADA_HOLIDAY_RE = re.compile(r'\bCANADA\s*:\s*(.+?)(?=(?:\s+USA\s*:)|$)', re.IGNORECASE)
+USA_HOLIDAY_RE = re.compile(r'\bUSA\s*:\s*(.+?)(?=(?:\s+CANADA\s*:)|$)', re.IGNORECASE)
+
+def extract_country_holidays(text):
+    canada_holiday = None
+    usa_holiday = None
+    work_text = text
+
+    canada_match = CANADA_HOLIDAY_RE.search(work_text)
+    if canada_match:
+        canada_holiday = clean_string(canada_match.group(1))
+        work_text = work_text.replace(canada_match.group(0), ' ')
+
+    usa_match = USA_HOLIDAY_RE.search(work_text)
+    if usa_match:
+        usa_holiday = clean_string(usa_match.group(1))
+        work_text = work_text.replace(usa_match.group(0), ' ')
+
+    work_text = WHITESPACE_RE.sub(' ', work_text).strip()
+    return work_text, canada_holiday, usa_holiday
+
+def sequential_parse_reading_text(text):
+    if not text:
+        return None
+
+    work_text = TAGS_RE.sub(' ', text)
+    work_text = WHITESPACE_RE.sub(' ', work_text).strip()
+    work_text = normalize_mojibake(work_text)
+
+    work_text, canada_holiday, usa_holiday = extract_country_holidays(work_text)
+
+    fasting = None
+    fasting_match = FASTING_RE.search(work_text)
+    if fasting_match:
+        fasting = WHITESPACE_RE.sub(' ', fasting_match.group(1)).strip()
+        if re.match(r'^Abstinence\b', fasting, re.IGNORECASE) and ' from ' not in fasting.lower():
+            fasting = 'Abstinence'
+        work_text = work_text.replace(fasting_match.group(0), '')
+
+    tone = None
+    tone_match = TONE_RE.search(work_text)
+    if tone_match:
+        tone = tone_match.group(1)
+        work_text = work_text.replace(tone_match.group(0), '')
+
+    matins_gospel = None
+    matins_res_match = MATINS_RES_RE.search(work_text)
+    if matins_res_match:
+        matins_gospel = matins_res_match.group(1)
+        work_text = work_text.replace(matins_res_match.group(0), '')
+    else:
+        matins_text_match = MATINS_TEXT_RE.search(work_text)
+        if matins_text_match:
+            matins_gospel = clean_string(matins_text_match.group(1))
+            work_text = work_text.replace(matins_text_match.group(0), '')
+
+    epistle = None
+    gospel = None
+    implicit_match = IMPLICIT_LITURGY_RE.search(work_text)
+    if implicit_match:
+        epistle = normalize_scripture_reference(implicit_match.group(1))
+        gospel = normalize_scripture_reference(implicit_match.group(2))
+        work_text = work_text.replace(implicit_match.group(0), '')
+    else:
+        work_text = DIVINE_LITURGY_HEADER_RE.sub('', work_text)
+
+        epistle_match = EPISTLE_RE.search(work_text)
+        if epistle_match:
+            epistle = normalize_scripture_reference(epistle_match.group(1))
+            work_text = work_text.replace(epistle_match.group(0), '')
+        else:
+            apostle_match = APOSTLE_EPISTLE_RE.search(work_text)
+            if apostle_match:
+                epistle = normalize_scripture_reference(apostle_match.group(1))
+                work_text = work_text.replace(apostle_match.group(0), '')
+            else:
+                epistle_fallback_match = EPISTLE_BEFORE_GOSPEL_RE.search(work_text)
+                if epistle_fallback_match:
+                    epistle = normalize_scripture_reference(epistle_fallback_match.group(1))
+                    work_text = work_text.replace(epistle_fallback_match.group(0), '')
+
+        gospel_match = GOSPEL_RE.search(work_text)
+        if gospel_match:
+            gospel = normalize_scripture_reference(gospel_match.group(1))
+            work_text = work_text.replace(gospel_match.group(0), '')
+
+    notes = work_text
+    notes = re.sub(r'^[\s,;.]+|[\s,;.]+$', '', notes)
+    notes = re.sub(r'\s+([,;.])', r'\1', notes)
+    notes = re.sub(r'[,;]+\s*\.', '.', notes)
+    notes = re.sub(r'\.\s*[,;]+', '.', notes)
+    notes = re.sub(r',,+', ',', notes)
+    notes = re.sub(r'\.\.+', '.', notes)
+    notes = notes.strip()
+
+    return {
+        "tone": tone,
+        "matinsGospel": matins_gospel,
+        "epistle": epistle,
+        "gospel": gospel,
+        "fasting": fasting,
+        "notes": notes if notes else None,
+        "canadaHoliday": canada_holiday,
+        "usaHoliday": usa_holiday
+    }
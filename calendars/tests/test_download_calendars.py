@@ -0,0 +1,164 @@
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import download_calendars
+from download_calendars import DOWNLOAD_STATE_FILENAME, calendar_pdf_filename, download_year
+
+YEAR = 2026
+JANUARY = calendar_pdf_filename(YEAR, 1)
+FEBRUARY = calendar_pdf_filename(YEAR, 2)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        stand_in = self.server.stand_in
+        name = urllib.parse.unquote(self.path.rsplit("/", 1)[-1])
+        with stand_in.lock:
+            stand_in.requests.append((name, self.headers.get("If-None-Match")))
+            failures = stand_in.failures.get(name, 0)
+            if failures:
+                stand_in.failures[name] = failures - 1
+
+        if failures:
+            self.send_error(503)
+            return
+        if name not in stand_in.files:
+            self.send_error(404)
+            return
+        body, etag = stand_in.files[name]
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body) + stand_in.truncate.get(name, 0)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StandInServer:
+    """Serves files[name] = (body, etag) under /docs; failures[name] 503s come first, truncate[name] overstates Content-Length."""
+
+    def __init__(self):
+        self.files = {}
+        self.failures = {}
+        self.truncate = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self._httpd.stand_in = self
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}/docs"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def requests_for(self, name):
+        return [request for request in self.requests if request[0] == name]
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(download_calendars, "RETRY_BACKOFF_SECONDS", 0)
+    stand_in = StandInServer()
+    yield stand_in
+    stand_in.close()
+
+def run(server, tmp_path, retries=2):
+    results = download_year(YEAR, tmp_path, server.base_url, workers=4, retries=retries, timeout=5)
+    return {result.job.filename: result for result in results}
+
+def leftover_temp_files(tmp_path):
+    return [path.name for path in (tmp_path / str(YEAR)).iterdir() if path.name.endswith(".tmp")]
+
+def test_download_falls_back_to_the_next_pattern(server, tmp_path):
+    server.files[f"Calendar {YEAR} January.pdf"] = (b"%PDF-1.7 january", '"jan-1"')
+    server.files["February.pdf"] = (b"%PDF-1.7 february", '"feb-1"')
+
+    results = run(server, tmp_path)
+    assert results[JANUARY].status == "downloaded"
+    assert results[FEBRUARY].status == "downloaded"
+    assert results[FEBRUARY].pattern == "February.pdf"
+    assert results[calendar_pdf_filename(YEAR, 3)].status == "missing"
+    assert (tmp_path / str(YEAR) / FEBRUARY).read_bytes() == b"%PDF-1.7 february"
+
+    state = json.loads((tmp_path / str(YEAR) / DOWNLOAD_STATE_FILENAME).read_text(encoding="utf-8"))
+    assert state[FEBRUARY]["etag"] == '"feb-1"'
+    assert state[FEBRUARY]["url"].endswith("/February.pdf")
+
+def test_unchanged_file_is_skipped_on_304(server, tmp_path):
+    server.files["February.pdf"] = (b"%PDF-1.7 february", '"feb-1"')
+    run(server, tmp_path)
+    server.requests.clear()
+
+    results = run(server, tmp_path)
+    assert results[FEBRUARY].status == "unchanged"
+    # The URL that worked last time is asked first, with its ETag
+    assert server.requests_for("February.pdf") == [("February.pdf", '"feb-1"')]
+    assert server.requests_for(f"Calendar {YEAR} February.pdf") == []
+
+def test_changed_file_replaces_the_old_one(server, tmp_path):
+    server.files["February.pdf"] = (b"%PDF-1.7 february", '"feb-1"')
+    run(server, tmp_path)
+    server.files["February.pdf"] = (b"%PDF-1.7 february, corrected", '"feb-2"')
+
+    results = run(server, tmp_path)
+    assert results[FEBRUARY].status == "downloaded"
+    assert (tmp_path / str(YEAR) / FEBRUARY).read_bytes() == b"%PDF-1.7 february, corrected"
+    assert leftover_temp_files(tmp_path) == []
+
+def test_retries_on_503(server, tmp_path):
+    name = f"Calendar {YEAR} January.pdf"
+    server.files[name] = (b"%PDF-1.7 january", None)
+    server.failures[name] = 2
+
+    results = run(server, tmp_path, retries=2)
+    assert results[JANUARY].status == "downloaded"
+    assert len(server.requests_for(name)) == 3
+
+def test_gives_up_after_the_retries(server, tmp_path):
+    name = f"Calendar {YEAR} January.pdf"
+    server.files[name] = (b"%PDF-1.7 january", None)
+    server.failures[name] = 5
+
+    results = run(server, tmp_path, retries=1)
+    assert results[JANUARY].status == "missing"
+    assert "503" in results[JANUARY].error
+    assert len(server.requests_for(name)) == 2
+    assert not (tmp_path / str(YEAR) / JANUARY).exists()
+
+def test_non_pdf_body_keeps_the_existing_file(server, tmp_path):
+    name = f"Calendar {YEAR} January.pdf"
+    server.files[name] = (b"%PDF-1.7 january", '"jan-1"')
+    run(server, tmp_path)
+    server.files[name] = (b"<html>Maintenance</html>", '"jan-2"')
+
+    results = run(server, tmp_path)
+    assert results[JANUARY].status == "missing"
+    assert "not a PDF" in results[JANUARY].error
+    assert (tmp_path / str(YEAR) / JANUARY).read_bytes() == b"%PDF-1.7 january"
+    assert leftover_temp_files(tmp_path) == []
+
+def test_truncated_body_is_retried_and_never_replaces_the_file(server, tmp_path):
+    name = f"Calendar {YEAR} January.pdf"
+    server.files[name] = (b"%PDF-1.7 january", '"jan-1"')
+    run(server, tmp_path)
+    server.files[name] = (b"%PDF-1.7 janu", '"jan-2"')
+    server.truncate[name] = 100
+    server.requests.clear()
+
+    results = run(server, tmp_path, retries=1)
+    assert results[JANUARY].status == "missing"
+    assert "incomplete response" in results[JANUARY].error
+    assert len(server.requests_for(name)) == 2
+    assert (tmp_path / str(YEAR) / JANUARY).read_bytes() == b"%PDF-1.7 january"
+    assert leftover_temp_files(tmp_path) == []
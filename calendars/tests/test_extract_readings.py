@@ -0,0 +1,50 @@
+import pytest
+
+from extract_readings import parse_raw_entries, parse_reading_text, split_stacked_cell_text
+from reading_entry import ReadingEntry
+
+# Stacked cells as the layout stage leaves them (2024-06 and 2025-08 calendars)
+SLASH_SEPARATED_CELL = (
+    "23/30\nCommon Abstinence\n5th SUNDAY AFTER PENTECOST\nTone 4, Res. Gospel 5, Epistle Rom. 10:\n"
+    "1–10, Gospel Matt. 8: 28 -9:1.\n/\n6TH SUNDAY AFTER PENTECOST\n"
+    "Tone 5, Res. Gospel 6, Epistle Rom. 12:\n6-14, Gospel Mt. 9: 1-8."
+)
+HEADING_SEPARATED_CELL = (
+    "24/31\n11th SUNDAY AFTER PENTECOST\nTone 2, Res. Gospel 11, Epistle 1 Cor. 9:\n"
+    "2 – 12, Gospel Matt. 18: 23 – 35.\n12th SUNDAY AFTER PENTECOST\n"
+    "Tone 3, Res. Gospel 1, Epistle 1 Cor.\n15:1-11, Gospel Matt. 19:16-26."
+)
+
+def layout_entry(year, month, day, raw_text):
+    return ReadingEntry(f"{month:02d}{day:02d}{str(year)[-2:]}", str(year), "June", day, raw_text)
+
+@pytest.mark.parametrize("text, day, expected_start", [
+    (SLASH_SEPARATED_CELL, 23, "23\nCommon Abstinence\n5th SUNDAY"),
+    (SLASH_SEPARATED_CELL, 30, "30\n6TH SUNDAY"),
+    (HEADING_SEPARATED_CELL, 24, "24\n11th SUNDAY"),
+    (HEADING_SEPARATED_CELL, 31, "31\n12th SUNDAY"),
+])
+def test_split_stacked_cell_text(text, day, expected_start):
+    day_text = split_stacked_cell_text(text, day)
+    assert day_text.startswith(expected_start)
+    assert day_text.count("Tone") == 1
+
+@pytest.mark.parametrize("text, day", [
+    ("23\n5th SUNDAY AFTER PENTECOST\nTone 4, Res. Gospel 5", 23),
+    (SLASH_SEPARATED_CELL, 24),
+    (SLASH_SEPARATED_CELL.replace("30", "29", 1), 29),
+    ("23/30\nCommon Abstinence\n/\nMartyrs", 23),
+])
+def test_split_stacked_cell_text_leaves_other_cells(text, day):
+    assert split_stacked_cell_text(text, day) is None
+
+def test_parse_gives_each_stacked_day_its_own_readings():
+    entries = parse_raw_entries([layout_entry(2024, 6, 23, SLASH_SEPARATED_CELL),
+                                 layout_entry(2024, 6, 30, SLASH_SEPARATED_CELL)])
+    assert [(entry.day, entry.tone, entry.matins_gospel) for entry in entries] == [(23, "4", "5"), (30, "5", "6")]
+    assert entries[1].epistle.startswith("Rom. 12")
+
+def test_comma_after_res_is_read_as_matins_gospel():
+    parsed = parse_reading_text("19\n12th Sunday after The Holy Cross\nTone 2, Res, Gospel 2, Epistle Col. 3: 4-11")
+    assert parsed["tone"] == "2"
+    assert parsed["matinsGospel"] == "2"
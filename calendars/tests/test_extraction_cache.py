@@ -0,0 +1,31 @@
+from extract_readings import PARSER_VERSION, layout_cache_version
+from extraction_cache import (
+    cache_entry_path,
+    load_cached_entries,
+    prune_stale_versions,
+    source_fingerprint,
+    store_cached_entries,
+)
+
+def test_source_fingerprint_follows_file_content(tmp_path):
+    source = tmp_path / "layout.py"
+    source.write_text("def layout():\n    return 1\n", encoding="utf-8")
+    before = source_fingerprint([source], ["0.11.4"])
+    assert source_fingerprint([source], ["0.11.4"]) == before
+
+    source.write_text("def layout():\n    return 2\n", encoding="utf-8")
+    assert source_fingerprint([source], ["0.11.4"]) != before
+    assert source_fingerprint([source], ["0.11.5"]) != source_fingerprint([source], ["0.11.4"])
+
+def test_layout_cache_version_includes_parser_version():
+    assert layout_cache_version().startswith(f"{PARSER_VERSION}-")
+
+def test_entries_of_other_versions_are_not_read_and_pruned(tmp_path):
+    entries = [{"date": "010125", "raw_text": "1\nTheophany"}]
+    store_cached_entries(tmp_path, "2-old", "abc", "01 Calendar 2025 January.pdf", entries)
+    store_cached_entries(tmp_path, "2-new", "abc", "01 Calendar 2025 January.pdf", entries)
+
+    assert load_cached_entries(tmp_path, "2-new", "abc") == entries
+    assert prune_stale_versions(tmp_path, "2-new") == 1
+    assert not cache_entry_path(tmp_path, "2-old", "abc").exists()
+    assert load_cached_entries(tmp_path, "2-old", "abc") is None
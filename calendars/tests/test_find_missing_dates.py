@@ -0,0 +1,38 @@
+from datetime import date
+
+import pytest
+
+from find_missing_dates import COVERAGE_SOURCES, check_missing_dates, coverage_report, missing_ranges
+from readings_db import ReadingsDbWriter
+
+def test_missing_ranges_split_at_month_end():
+    ordinals = [date(2025, 1, day).toordinal() for day in range(1, 30)]
+    first, last = date(2025, 1, 1).toordinal(), date(2025, 2, 2).toordinal()
+    assert missing_ranges(ordinals, first, last) == [
+        (date(2025, 1, 30).toordinal(), date(2025, 1, 31).toordinal()),
+        (date(2025, 2, 1).toordinal(), date(2025, 2, 2).toordinal()),
+    ]
+
+def test_coverage_report_names_the_expected_pdf(tmp_path):
+    ordinals = [date(2025, 1, 1).toordinal() + offset for offset in range(365) if offset != 40]
+    report = coverage_report(ordinals, calendars_dir=tmp_path)
+    assert report["missing_days"] == 1
+    [gap] = report["gaps"]
+    assert gap["start"] == gap["end"] == "2025-02-10"
+    assert gap["pdf"] == "2025/02 Calendar 2025 February.pdf"
+    assert not gap["pdf_exists"]
+
+@pytest.mark.parametrize("source", COVERAGE_SOURCES)
+def test_missing_source_reports_file_not_found(source, tmp_path, capsys):
+    path = tmp_path / "missing"
+    assert check_missing_dates(path, source) is None
+    assert capsys.readouterr().out.strip() == f"Error: File not found at {path}"
+
+def test_sqlite_source(make_row, tmp_path):
+    path = tmp_path / "readings.sqlite"
+    with ReadingsDbWriter(path) as writer:
+        for day in (1, 2, 4):
+            writer.write_row(make_row(2025, 3, day))
+    report = check_missing_dates(path, "sqlite", years=[2025])
+    assert report["covered_days"] == 3
+    assert [gap["start"] for gap in report["gaps"] if gap["month"] == 3] == ["2025-03-03", "2025-03-05"]
@@ -0,0 +1,65 @@
+from datetime import date, datetime, timezone
+
+from ics_export import (
+    MAX_LINE_OCTETS,
+    UPCOMING_FILENAME,
+    escape_text,
+    export_ics,
+    fold_line,
+    format_event,
+    year_filename,
+)
+
+def unfold(text):
+    return text.replace("\r\n ", "")
+
+def test_escape_text():
+    assert escape_text("Rom. 12:6-14; Mt. 9:1-8, ch\\1\nnext") == "Rom. 12:6-14\\; Mt. 9:1-8\\, ch\\\\1\\nnext"
+    assert escape_text("a\r\nb") == "a\\nb"
+
+def test_short_line_is_not_folded():
+    assert fold_line("SUMMARY:Theophany") == "SUMMARY:Theophany\r\n"
+
+def test_fold_line_keeps_octet_limit_and_utf8_characters():
+    line = "DESCRIPTION:" + "Hârți (†) " * 30
+    folded = fold_line(line)
+    assert folded.endswith("\r\n")
+    parts = folded[:-2].split("\r\n")
+    assert len(parts) > 1
+    assert all(len(part.encode("utf-8")) <= MAX_LINE_OCTETS for part in parts)
+    assert all(part.startswith(" ") for part in parts[1:])
+    assert unfold(folded) == line + "\r\n"
+
+def test_format_event(make_row):
+    rows = [make_row(2025, 1, 6, Title="(†)THEOPHANY", Epistle="Tit. 2:11-14; 3:4-7", Gospel="Matt. 3:13-17",
+                     **{"Holy Day of Obligation": True}),
+            make_row(2025, 1, 6, Title="Great blessing of water")]
+    event = unfold(format_event(date(2025, 1, 6), rows))
+    lines = event.split("\r\n")
+    assert lines[0] == "BEGIN:VEVENT"
+    assert "UID:20250106@byzantine-liturgy-readings" in lines
+    assert "DTSTAMP:20250106T000000Z" in lines
+    assert "DTSTART;VALUE=DATE:20250106" in lines
+    assert "DTEND;VALUE=DATE:20250107" in lines
+    assert "SUMMARY:(†)THEOPHANY" in lines
+    assert ("DESCRIPTION:(†)THEOPHANY\\nEpistle: Tit. 2:11-14\\; 3:4-7\\nGospel: Matt. 3:13-17"
+            "\\n\\nGreat blessing of water") in lines
+    assert "CATEGORIES:Holy Day of Obligation" in lines
+
+def test_build_stamp_overrides_the_event_date(make_row):
+    stamp = datetime(2024, 12, 1, 8, 30, tzinfo=timezone.utc)
+    assert "DTSTAMP:20241201T083000Z\r\n" in format_event(date(2025, 1, 6), [make_row(2025, 1, 6)], stamp)
+
+def test_export_is_byte_identical_across_runs(make_row, tmp_path):
+    rows = [make_row(2025, 12, 31, Title="Sylvester"), make_row(2026, 1, 1, Title="Circumcision"),
+            make_row(2026, 1, 6, Title="Theophany")]
+    writer = export_ics(rows, tmp_path, today=date(2026, 1, 2), window=(1, 5))
+    assert writer.event_count == 3
+    first = {path.name: (path.read_bytes(), path.stat().st_mtime_ns) for path in tmp_path.iterdir()}
+    assert set(first) == {year_filename(2025), year_filename(2026), UPCOMING_FILENAME}
+    assert b"Theophany" in first[UPCOMING_FILENAME][0] and b"Sylvester" not in first[UPCOMING_FILENAME][0]
+
+    export_ics(rows, tmp_path, today=date(2026, 1, 2), window=(1, 5))
+    second = {path.name: (path.read_bytes(), path.stat().st_mtime_ns) for path in tmp_path.iterdir()}
+    # Unchanged content is not rewritten at all
+    assert second == first
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from lectionary import (
+    PaschaTable,
+    computed_entry,
+    gregorian_pascha,
+    iter_computed_entries,
+    julian_pascha,
+    merge_with_extracted,
+    ordinal,
+    sunday_matins_gospel,
+    sunday_tone,
+)
+from reading_schema import READING_FIELDS
+
+@pytest.mark.parametrize("year, gregorian, julian", [
+    (2000, date(2000, 4, 23), date(2000, 4, 30)),
+    (2024, date(2024, 3, 31), date(2024, 5, 5)),
+    (2025, date(2025, 4, 20), date(2025, 4, 20)),
+    (2026, date(2026, 4, 5), date(2026, 4, 12)),
+    (2027, date(2027, 3, 28), date(2027, 5, 2)),
+])
+def test_pascha_dates(year, gregorian, julian):
+    assert gregorian_pascha(year) == gregorian
+    assert julian_pascha(year) == julian
+
+def test_previous_pascha():
+    table = PaschaTable()
+    assert table.previous(date(2025, 4, 19)) == date(2024, 3, 31)
+    assert table.previous(date(2025, 4, 20)) == date(2025, 4, 20)
+
+def test_sunday_cycles():
+    assert [sunday_tone(week) for week in (0, 1, 2, 7, 8, 9, 16, 17)] == [None, 1, 2, None, 8, 1, 8, 1]
+    assert [sunday_matins_gospel(week) for week in (0, 1, 6, 7, 8, 18, 19)] == [None, 1, 10, None, 1, 11, 1]
+
+def test_ordinal():
+    assert [ordinal(n) for n in (1, 2, 3, 4, 11, 12, 13, 21, 22, 101)] == [
+        "1st", "2nd", "3rd", "4th", "11th", "12th", "13th", "21st", "22nd", "101st"]
+
+# Tone and Resurrection Gospel as printed in the 2025 calendars
+@pytest.mark.parametrize("day, tone, matins_gospel", [
+    (date(2025, 1, 19), "2", "2"),
+    (date(2025, 4, 13), "6", "3"),
+    (date(2025, 4, 27), "1", "1"),
+    (date(2025, 6, 22), "1", "2"),
+    (date(2025, 9, 21), "6", "4"),
+])
+def test_computed_sundays_match_the_calendars(day, tone, matins_gospel):
+    entry = computed_entry(day, PaschaTable())
+    assert (entry["Tone"], entry["Matins Gospel"]) == (tone, matins_gospel)
+    assert entry["Holy Day of Obligation"] is True
+
+def test_computed_entry_schema():
+    table = PaschaTable()
+    entry = computed_entry(date(2025, 6, 22), table)
+    assert list(entry) == READING_FIELDS
+    assert entry["Date"] == "062225"
+    assert entry["Title"] == "2nd Sunday after Pentecost"
+    assert entry["Epistle"] == "Rom 2:10-16"
+    assert entry["Epistle Ranges"] is not None
+
+    pascha = computed_entry(date(2025, 4, 20), table)
+    assert pascha["Title"] == "Resurrection of Our Lord (Pascha)"
+    assert pascha["Tone"] is None
+    # The Triodion of the next year is found from the next Pascha
+    assert computed_entry(date(2026, 1, 18), table)["Title"] == "Sunday of Zacchaeus"
+
+    weekday = computed_entry(date(2025, 6, 24), table)
+    assert (weekday["Title"], weekday["Tone"], weekday["Holy Day of Obligation"]) == (None, None, False)
+
+def test_one_entry_per_day():
+    entries = list(iter_computed_entries(2024, 2025))
+    assert len(entries) == 366 + 365
+    assert entries[0]["Date"] == "010124" and entries[-1]["Date"] == "123125"
+
+def test_extracted_rows_win(make_row):
+    computed = list(iter_computed_entries(2025, 2025))[:3]
+    extracted = [make_row(2025, 1, 2, Title="A"), make_row(2025, 1, 2, Title="B"), make_row(2026, 1, 1, Title="C")]
+    merged = merge_with_extracted(computed, extracted)
+    assert [(row["Date"], row["Title"]) for row in merged] == [
+        ("010125", computed[0]["Title"]), ("010225", "A"), ("010225", "B"),
+        ("010325", computed[2]["Title"]), ("010126", "C")]
@@ -0,0 +1,45 @@
+import pytest
+
+import memory_usage
+from memory_usage import format_bytes, peak_rss_bytes, reset_peak_rss
+
+def test_format_bytes():
+    assert format_bytes(None) == "n/a"
+    assert format_bytes(0) == "0.0 MiB"
+    assert format_bytes(3 * 1024 * 1024 + 512 * 1024) == "3.5 MiB"
+
+def test_peak_rss_reads_proc_status_high_water_mark(tmp_path, monkeypatch):
+    status = tmp_path / "status"
+    status.write_text("Name:\tpython\nVmPeak:\t  900000 kB\nVmHWM:\t  123456 kB\nVmRSS:\t  100000 kB\n", encoding="ascii")
+    monkeypatch.setattr(memory_usage, "PROC_STATUS_PATH", str(status))
+    assert peak_rss_bytes() == 123456 * 1024
+
+@pytest.mark.skipif(memory_usage.resource is None, reason="no resource module on this platform")
+def test_peak_rss_falls_back_to_getrusage(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory_usage, "PROC_STATUS_PATH", str(tmp_path / "missing"))
+    peak = peak_rss_bytes()
+    assert peak is not None and peak > 1024 * 1024
+
+def test_peak_rss_is_unknown_without_proc_or_resource(tmp_path, monkeypatch):
+    monkeypatch.setattr(memory_usage, "PROC_STATUS_PATH", str(tmp_path / "missing"))
+    monkeypatch.setattr(memory_usage, "resource", None)
+    assert peak_rss_bytes() is None
+    assert format_bytes(peak_rss_bytes()) == "n/a"
+
+def test_reset_peak_rss_reports_whether_the_watermark_was_reset(tmp_path, monkeypatch):
+    clear_refs = tmp_path / "clear_refs"
+    monkeypatch.setattr(memory_usage, "PROC_CLEAR_REFS_PATH", str(clear_refs))
+    assert reset_peak_rss() is True
+    assert clear_refs.read_text(encoding="ascii") == "5"
+
+    monkeypatch.setattr(memory_usage, "PROC_CLEAR_REFS_PATH", str(tmp_path / "missing" / "clear_refs"))
+    assert reset_peak_rss() is False
+
+def test_peak_rss_covers_current_process():
+    before = peak_rss_bytes()
+    if before is None:
+        pytest.skip("peak RSS cannot be measured on this platform")
+    block = bytearray(32 * 1024 * 1024)
+    block[::4096] = b"\x01" * len(block[::4096])
+    assert peak_rss_bytes() >= before
+    assert peak_rss_bytes() >= len(block)
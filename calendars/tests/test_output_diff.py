@@ -0,0 +1,99 @@
+import io
+import json
+import os
+
+import pytest
+
+from extract_readings import format_json_array_item, iter_json_array_items, load_record_digests, write_output_files
+from output_diff import ChangeAwareOutput, RecordDigests
+from reading_entry import ReadingEntry
+
+OLD_MTIME = 1_000_000_000
+
+def entries_from_rows(rows):
+    return [ReadingEntry.from_dict(row) for row in rows]
+
+def written_files(directory):
+    return sorted(path.name for path in directory.iterdir())
+
+def test_unchanged_output_is_left_untouched(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("same\n", encoding="utf-8")
+    os.utime(target, (OLD_MTIME, OLD_MTIME))
+
+    with ChangeAwareOutput(target) as output:
+        output.write("same\n")
+        assert output.commit() is False
+    assert target.stat().st_mtime == OLD_MTIME
+    assert written_files(tmp_path) == ["out.txt"]
+
+def test_changed_output_replaces_target(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("old\n", encoding="utf-8")
+
+    with ChangeAwareOutput(target) as output:
+        output.write("new\n")
+        assert output.commit() is True
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert written_files(tmp_path) == ["out.txt"]
+
+def test_output_without_commit_keeps_target(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("old\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with ChangeAwareOutput(target) as output:
+            output.write("partial")
+            raise RuntimeError("extraction failed")
+    assert target.read_text(encoding="utf-8") == "old\n"
+    assert written_files(tmp_path) == ["out.txt"]
+
+def test_json_array_items_stream_back_as_written(make_row):
+    rows = [make_row(2025, 1, 6, Title="Theophany", Notes="Line one\n  }"), make_row(2025, 1, 7)]
+    text = json.dumps(rows, indent=2)
+    assert list(iter_json_array_items(io.StringIO(text))) == [format_json_array_item(row) for row in rows]
+    assert list(iter_json_array_items(io.StringIO("[]"))) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array_items(io.StringIO(text[:-3])))
+    with pytest.raises(ValueError):
+        list(iter_json_array_items(io.StringIO(json.dumps(rows))))
+
+def test_load_record_digests_reads_other_layouts_and_bad_files(tmp_path, make_row):
+    rows = [make_row(2025, 1, 6), make_row(2025, 1, 7)]
+    expected = RecordDigests()
+    for row in rows:
+        expected.add(row, format_json_array_item(row))
+
+    indented = tmp_path / "indented.json"
+    indented.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    minified = tmp_path / "minified.json"
+    minified.write_text(json.dumps(rows), encoding="utf-8")
+    broken = tmp_path / "broken.json"
+    broken.write_text(json.dumps(rows, indent=2)[:-10], encoding="utf-8")
+
+    assert load_record_digests(indented).digests == expected.digests
+    assert load_record_digests(minified).digests == expected.digests
+    assert load_record_digests(broken).digests == {}
+    assert load_record_digests(tmp_path / "missing.json").digests == {}
+
+def test_rewrite_reports_added_modified_and_removed_records(tmp_path, make_row, capsys):
+    rows = [make_row(2025, 1, day, Title=f"Day {day}") for day in (5, 6, 7)]
+    write_output_files(tmp_path, entries_from_rows(rows))
+    for name in ("extracted_readings.json", "readings.csv"):
+        os.utime(tmp_path / name, (OLD_MTIME, OLD_MTIME))
+
+    unchanged = write_output_files(tmp_path, entries_from_rows(rows))
+    assert unchanged == {"added": [], "removed": [], "modified": [], "json_changed": False, "csv_changed": False}
+    assert (tmp_path / "extracted_readings.json").stat().st_mtime == OLD_MTIME
+    assert (tmp_path / "readings.csv").stat().st_mtime == OLD_MTIME
+    assert "are unchanged" in capsys.readouterr().out
+
+    new_rows = [rows[0], make_row(2025, 1, 6, Title="Theophany"), make_row(2025, 1, 8, Title="Synaxis")]
+    diff = write_output_files(tmp_path, entries_from_rows(new_rows))
+    assert diff["added"] == [("2025", "010825")]
+    assert diff["modified"] == [("2025", "010625")]
+    assert diff["removed"] == [("2025", "010725")]
+    assert diff["json_changed"] and diff["csv_changed"]
+    assert "1 added, 1 removed, 1 modified records" in capsys.readouterr().out
+    with open(tmp_path / "extracted_readings.json", "r", encoding="utf-8") as f:
+        assert json.load(f) == [entry.to_dict() for entry in entries_from_rows(new_rows)]
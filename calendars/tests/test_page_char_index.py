@@ -0,0 +1,108 @@
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from extract_readings import PageCharIndex, extract_day_from_cell_style
+
+CALENDARS_DIR = Path(__file__).resolve().parent.parent
+
+class FakePage:
+    def __init__(self, chars):
+        self.chars = chars
+
+def full_scan_digits(chars, bbox):
+    """The per-cell walk over page.chars that PageCharIndex replaced, as (top, size, x0, text)."""
+    x0, top, x1, bottom = bbox
+    digits = []
+    for ch in chars:
+        try:
+            cx = (float(ch["x0"]) + float(ch["x1"])) / 2.0
+            cy = (float(ch["top"]) + float(ch["bottom"])) / 2.0
+            if x0 <= cx <= x1 and top <= cy <= bottom and str(ch.get("text", "")).isdigit():
+                digits.append((float(ch.get("top", top)), float(ch.get("size", 0)), float(ch.get("x0", 0)), str(ch["text"])))
+        except Exception:
+            continue
+    return digits
+
+def full_scan_day(chars, bbox):
+    x0, top, x1, bottom = bbox
+    if x1 <= x0 or bottom <= top:
+        return None
+    digit_chars = full_scan_digits(chars, bbox)
+    if not digit_chars:
+        return None
+    top_band = top + (bottom - top) * 0.40
+    candidates = [c for c in digit_chars if c[0] <= top_band] or digit_chars
+    max_size = max(c[1] for c in candidates)
+    prominent = sorted((c for c in candidates if c[1] >= max_size - 0.25), key=lambda c: c[2])
+    match = re.search(r'(\d{1,2})', "".join(c[3] for c in prominent))
+    if not match:
+        return None
+    day_num = int(match.group(1))
+    return day_num if 1 <= day_num <= 31 else None
+
+def glyph(text, cx, cy, size, width=4.0):
+    return {"text": text, "x0": cx - width / 2, "x1": cx + width / 2,
+            "top": cy - size / 2, "bottom": cy + size / 2, "size": size}
+
+def synthetic_chars(rng, columns, rows, cell):
+    chars = []
+    for row in range(rows):
+        for col in range(columns):
+            x0, top = col * cell, row * cell
+            day = str(rng.randint(1, 31))
+            size = rng.choice([9.0, 11.0, 11.1])
+            for idx, digit in enumerate(day):
+                chars.append(glyph(digit, x0 + 6 + idx * 5, top + 8, size))
+            for _ in range(rng.randint(2, 6)):
+                chars.append(glyph(rng.choice("123456789abcG:"), x0 + rng.uniform(0, cell), top + rng.uniform(10, cell), 5.5))
+            # Glyphs centred exactly on the column and row edges belong to both neighbours
+            chars.append(glyph(str(rng.randint(0, 9)), x0, top + rng.uniform(0, cell), 5.5))
+            chars.append(glyph(str(rng.randint(0, 9)), x0 + rng.uniform(0, cell), top, 5.5))
+    chars.append({"text": "7", "x0": "10", "x1": "14", "top": "3", "bottom": "9", "size": "6"})
+    chars.append({"text": "8", "x0": float("nan"), "x1": 4.0, "top": 1.0, "bottom": 2.0, "size": 6.0})
+    chars.append({"text": "9", "x1": 4.0, "top": 1.0, "bottom": 2.0})
+    chars.append({"text": "5", "x0": 20.0, "x1": 24.0, "top": 30.0, "bottom": 36.0})
+    rng.shuffle(chars)
+    return chars
+
+def cell_bboxes(columns, rows, cell):
+    bboxes = []
+    for row in range(rows):
+        for col in range(columns):
+            bboxes.append((col * cell, row * cell, (col + 1) * cell, (row + 1) * cell))
+    # Cells spanning several columns, and degenerate ones
+    bboxes.append((0.0, 0.0, columns * cell, cell))
+    bboxes.append((cell, cell, cell, 2 * cell))
+    bboxes.append((cell * 2, cell, cell, 2 * cell))
+    return bboxes
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_index_matches_full_scan_on_synthetic_page(seed):
+    rng = random.Random(seed)
+    chars = synthetic_chars(rng, columns=7, rows=6, cell=40.0)
+    index = PageCharIndex(FakePage(chars))
+    for bbox in cell_bboxes(7, 6, 40.0):
+        assert index.digits_in_bbox(*bbox) == full_scan_digits(chars, bbox)
+        assert extract_day_from_cell_style(index, bbox) == full_scan_day(chars, bbox)
+
+def test_index_matches_full_scan_on_calendar_pages():
+    pdfplumber = pytest.importorskip("pdfplumber")
+    pdf_files = sorted(CALENDARS_DIR.glob("20*/*.pdf"))[:2]
+    if not pdf_files:
+        pytest.skip("no calendar PDFs checked out")
+
+    checked = 0
+    for pdf_file in pdf_files:
+        with pdfplumber.open(pdf_file) as pdf:
+            for page in pdf.pages:
+                chars = page.chars
+                index = PageCharIndex(page)
+                for table in page.find_tables():
+                    for bbox in table.cells:
+                        assert extract_day_from_cell_style(index, bbox) == full_scan_day(chars, bbox)
+                        assert index.digits_in_bbox(*bbox) == full_scan_digits(chars, bbox)
+                        checked += 1
+    assert checked > 100
@@ -0,0 +1,72 @@
+import pytest
+
+from extract_readings import collect_pdf_jobs, iter_extracted_pdfs, iter_layout_stage, iter_pdf_results
+from synthetic_calendars import generate_calendar_corpus
+
+JOBS = 2
+# More PDFs than the 2 * JOBS futures kept in flight, so the pool refills while results are consumed
+SYNTHETIC_MONTHS = 4 * JOBS + 1
+
+@pytest.fixture(scope="module")
+def corpus_root(tmp_path_factory):
+    root = tmp_path_factory.mktemp("synthetic_calendars")
+    generate_calendar_corpus(root, months=SYNTHETIC_MONTHS, seed=11)
+    return root
+
+@pytest.fixture(scope="module")
+def pdf_jobs(corpus_root):
+    return collect_pdf_jobs(corpus_root)
+
+@pytest.fixture(scope="module")
+def serial_results(pdf_jobs):
+    return [layout_rows(entries, ok) for entries, ok in iter_pdf_results(pdf_jobs)]
+
+def layout_rows(entries, ok=True):
+    return ok, [entry.layout_dict() for entry in entries]
+
+def test_parallel_results_match_serial_run(pdf_jobs, serial_results):
+    assert len(pdf_jobs) == SYNTHETIC_MONTHS
+    assert all(ok and rows for ok, rows in serial_results)
+
+    parallel_results = [layout_rows(entries, ok) for entries, ok in iter_pdf_results(pdf_jobs, jobs=JOBS)]
+    assert parallel_results == serial_results
+
+def test_parallel_results_come_back_in_job_order(pdf_jobs, serial_results):
+    # Jobs submitted in reverse still come back in submission order
+    reversed_results = [layout_rows(entries, ok) for entries, ok in iter_pdf_results(pdf_jobs[::-1], jobs=JOBS)]
+    assert reversed_results == serial_results[::-1]
+
+def test_cached_and_extracted_pdfs_interleave_in_job_order(pdf_jobs, serial_results, tmp_path):
+    # Prime the cache with every third PDF so cached and pool results alternate in the stream
+    list(iter_extracted_pdfs(pdf_jobs[::3], cache_dir=tmp_path))
+
+    extracted = [layout_rows(entries) for entries in iter_extracted_pdfs(pdf_jobs, jobs=JOBS, cache_dir=tmp_path)]
+    assert extracted == serial_results
+
+def test_at_most_two_jobs_per_worker_are_in_flight(pdf_jobs, serial_results):
+    submitted = []
+    def job_stream():
+        for pdf_job in pdf_jobs:
+            submitted.append(pdf_job)
+            yield pdf_job
+
+    in_flight = []
+    results = []
+    for entries, ok in iter_pdf_results(job_stream(), jobs=JOBS):
+        in_flight.append(len(submitted) - len(results))
+        results.append(layout_rows(entries, ok))
+    assert results == serial_results
+    assert max(in_flight) == 2 * JOBS
+
+def test_files_are_reported_as_their_results_are_consumed(corpus_root, pdf_jobs, capsys):
+    collect_pdf_jobs(corpus_root)
+    assert capsys.readouterr().out == ""
+
+    layout_files = iter_layout_stage(corpus_root, jobs=JOBS)
+    _, _, _, entries = next(layout_files)
+    out = capsys.readouterr().out
+    assert out.count("Processed file:") == 1
+    assert f"Processed file: {pdf_jobs[0][0].name} ({len(entries)} entries)" in out
+
+    list(layout_files)
+    assert capsys.readouterr().out.count("Processed file:") == SYNTHETIC_MONTHS - 1
@@ -0,0 +1,70 @@
+import random
+from datetime import date
+
+import pytest
+
+from passage_index import PassageIndex, PassageIndexWriter
+from scripture_refs import matins_gospel_ranges, parse_reference
+
+def with_ranges(row):
+    """Fills the "* Ranges" fields the way enrich_entry does."""
+    row["Matins Gospel Ranges"] = matins_gospel_ranges(row["Matins Gospel"]) or None
+    row["Epistle Ranges"] = parse_reference(row["Epistle"]) or None
+    row["Gospel Ranges"] = parse_reference(row["Gospel"]) or None
+    return row
+
+@pytest.fixture
+def rows(make_row):
+    return [with_ranges(row) for row in [
+        make_row(2025, 1, 5, Epistle="Heb 11:9-10, 17-23, 32-40", Gospel="Mt 1:1-25", Tone="3",
+                 **{"Matins Gospel": "5"}),
+        make_row(2025, 1, 6, Epistle="Titus 2:11-14; 3:4-7", Gospel="Mt 3:13-17"),
+        make_row(2025, 1, 7, Epistle="Acts 19:1-8", Gospel="John 1:29-34"),
+        make_row(2025, 1, 8, Epistle="Heb 7:26-8:2", Gospel="Lk 24:12-35"),
+    ]]
+
+def test_find_by_passage(rows):
+    index = PassageIndex.from_rows(rows)
+    assert index.dates_for("Heb 11:17") == [date(2025, 1, 5)]
+    assert index.dates_for("Hebrews") == [date(2025, 1, 5), date(2025, 1, 8)]
+    assert index.dates_for("Heb 8") == [date(2025, 1, 8)]
+    assert index.dates_for("Heb 9") == []
+
+def test_matins_gospel_number_is_indexed(rows):
+    # Resurrection Gospel 5 is Luke 24:12-35
+    hits = PassageIndex.from_rows(rows).find("Luke 24:30")
+    assert [(hit.date.day, hit.field) for hit in hits] == [(5, "Matins Gospel"), (8, "Gospel")]
+
+def test_field_and_weekday_filters(rows):
+    index = PassageIndex.from_rows(rows)
+    assert index.dates_for("Luke 24", fields=["Gospel"]) == [date(2025, 1, 8)]
+    # 2025-01-05 is a Sunday
+    assert index.dates_for("Luke 24", weekday=6) == [date(2025, 1, 5)]
+
+def test_unrecognized_reference(rows):
+    with pytest.raises(ValueError):
+        PassageIndex.from_rows(rows).find("Foo 3:2")
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(3)
+    intervals = []
+    for idx in range(500):
+        start = rng.randint(0, 10_000)
+        intervals.append((start, start + rng.randint(0, 300), f"2025-01-{idx % 28 + 1:02d}", "Epistle"))
+    index = PassageIndex(intervals)
+    for _ in range(200):
+        start = rng.randint(0, 10_500)
+        end = start + rng.randint(0, 200)
+        found = {(index.starts[pos], index.ends[pos], index.dates[pos]) for pos in index.overlapping(start, end)}
+        expected = {(s, e, d) for s, e, d, _ in intervals if s <= end and e >= start}
+        assert found == expected
+
+def test_save_and_load(tmp_path, rows):
+    path = tmp_path / "passage_index.json"
+    with PassageIndexWriter(path) as writer:
+        for row in rows:
+            writer.write_row(row)
+    loaded = PassageIndex.load(path)
+    assert len(loaded) == len(PassageIndex.from_rows(rows))
+    assert loaded.find("Titus 3:5") == PassageIndex.from_rows(rows).find("Titus 3:5")
+    assert loaded.find("Titus 3:5")[0].start == parse_reference("Titus 3:4-7")[0][0]
@@ -0,0 +1,77 @@
+import json
+import shutil
+
+import pytest
+
+from extract_readings import PARSER_VERSION, parse_args, run_pipeline
+from raw_cells import RAW_CELLS_FILENAME, read_raw_cells_parser_version
+from synthetic_calendars import generate_calendar_corpus
+
+OUTPUT_FILENAMES = ("extracted_readings.json", "readings.csv")
+
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("synthetic_calendars")
+    generate_calendar_corpus(root, months=3, seed=5)
+    return root
+
+@pytest.fixture
+def calendars_dir(corpus_dir, tmp_path):
+    target = tmp_path / "calendars"
+    shutil.copytree(corpus_dir, target)
+    return target
+
+@pytest.fixture(scope="module")
+def full_run_outputs(corpus_dir, tmp_path_factory):
+    target = tmp_path_factory.mktemp("full_run") / "calendars"
+    shutil.copytree(corpus_dir, target)
+    assert run(target) == 0
+    assert json.loads((target / "extracted_readings.json").read_text(encoding="utf-8"))
+    return {name: (target / name).read_bytes() for name in OUTPUT_FILENAMES}
+
+def run(calendars_dir, *argv):
+    return run_pipeline(parse_args(["--no-cache", *argv]), calendars_dir, 1, None)
+
+def test_full_run_does_not_write_raw_cells(calendars_dir, full_run_outputs, capsys):
+    assert run(calendars_dir) == 0
+    assert not (calendars_dir / RAW_CELLS_FILENAME).exists()
+    assert "Saved raw cells" not in capsys.readouterr().out
+    assert {name: (calendars_dir / name).read_bytes() for name in OUTPUT_FILENAMES} == full_run_outputs
+
+def test_full_run_writes_raw_cells_when_asked(calendars_dir, tmp_path, capsys):
+    raw_cells = tmp_path / "cells.jsonl"
+    assert run(calendars_dir, "--raw-cells", str(raw_cells)) == 0
+    assert read_raw_cells_parser_version(raw_cells) == PARSER_VERSION
+    assert f"Saved raw cells to {raw_cells}" in capsys.readouterr().out
+
+def test_layout_then_parse_reproduces_full_run(calendars_dir, full_run_outputs):
+    assert run(calendars_dir, "--stage", "layout") == 0
+    assert (calendars_dir / RAW_CELLS_FILENAME).exists()
+    assert not (calendars_dir / "extracted_readings.json").exists()
+
+    # The parse stage never opens a PDF
+    for pdf_file in calendars_dir.glob("20*/*.pdf"):
+        pdf_file.unlink()
+    assert run(calendars_dir, "--stage", "parse") == 0
+    assert {name: (calendars_dir / name).read_bytes() for name in OUTPUT_FILENAMES} == full_run_outputs
+
+def test_parse_warns_about_raw_cells_of_another_parser_version(calendars_dir, full_run_outputs, capsys):
+    raw_cells = calendars_dir / RAW_CELLS_FILENAME
+    assert run(calendars_dir, "--stage", "layout") == 0
+    lines = raw_cells.read_text(encoding="utf-8").split("\n")
+    header = json.loads(lines[0])
+    header["parser_version"] = PARSER_VERSION - 1
+    raw_cells.write_text("\n".join([json.dumps(header)] + lines[1:]), encoding="utf-8")
+    capsys.readouterr()
+
+    assert run(calendars_dir, "--stage", "parse") == 0
+    out = capsys.readouterr().out
+    assert (f"Warning: {raw_cells} was written by parser version {PARSER_VERSION - 1} "
+            f"(current is {PARSER_VERSION})") in out
+    # The outputs are still rebuilt from the older raw cells
+    assert (calendars_dir / "extracted_readings.json").read_bytes() == full_run_outputs["extracted_readings.json"]
+
+def test_parse_of_current_raw_cells_does_not_warn(calendars_dir, capsys):
+    assert run(calendars_dir, "--stage", "layout") == 0
+    assert run(calendars_dir, "--stage", "parse") == 0
+    assert "Warning:" not in capsys.readouterr().out
@@ -0,0 +1,101 @@
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+from reading_entry import ReadingEntry
+from reading_schema import READING_FIELDS
+
+EXTRACTED_READINGS_PATH = Path(__file__).resolve().parent.parent / "extracted_readings.json"
+
+BBOX = (30.0, 120.5, 135.25, 210.0)
+PARSED_FIELDS = {
+    "Title": "Theophany",
+    "Tone": "8",
+    "Matins Gospel": "Mk 1:9-11",
+    "Matins Gospel Ranges": [[41001009, 41001011]],
+    "Epistle": "Tit 2:11-14; 3:4-7",
+    "Epistle Ranges": [[56002011, 56002014], [56003004, 56003007]],
+    "Gospel": "Mt 3:13-17",
+    "Gospel Ranges": [[40003013, 40003017]],
+    "Fasting": "Dispensation",
+    "Notes": None,
+    "Canada Holiday": None,
+    "USA Holiday": None,
+    "Holy Day of Obligation": True,
+}
+
+def dict_layout_entry():
+    """A layout-stage entry as the dict pipeline built it in create_entries_for_cell."""
+    return {
+        "Date": "010625",
+        "Year": "2025",
+        "Month": "January",
+        "Day": 6,
+        "Raw Text": "6\nTHEOPHANY\nTone 8",
+        "Cell BBox": BBOX
+    }
+
+def dict_published_row():
+    """The same entry after enrich_entry, without the layout-only bbox, as the dict pipeline wrote it."""
+    row = dict_layout_entry()
+    del row["Cell BBox"]
+    row.update(PARSED_FIELDS)
+    return row
+
+def enriched_entry():
+    entry = ReadingEntry("010625", "2025", "January", 6, "6\nTHEOPHANY\nTone 8", BBOX)
+    entry.set_fields(
+        title="Theophany", tone="8", matins_gospel="Mk 1:9-11",
+        matins_gospel_ranges=[[41001009, 41001011]], epistle="Tit 2:11-14; 3:4-7",
+        epistle_ranges=[[56002011, 56002014], [56003004, 56003007]], gospel="Mt 3:13-17",
+        gospel_ranges=[[40003013, 40003017]], fasting="Dispensation", notes=None,
+        canada_holiday=None, usa_holiday=None, holy_day_of_obligation=True
+    )
+    return entry
+
+def test_dicts_match_old_schema_and_field_order():
+    entry = enriched_entry()
+    assert list(entry.layout_dict().items()) == list(dict_layout_entry().items())
+    assert list(entry.to_dict().items()) == list(dict_published_row().items())
+    assert list(entry.to_dict()) == READING_FIELDS
+
+def test_from_dict_round_trips():
+    layout = ReadingEntry.from_dict(dict_layout_entry())
+    assert layout.layout_dict() == dict_layout_entry()
+    assert layout.title is None and layout.holy_day_of_obligation is None
+
+    published = ReadingEntry.from_dict(dict_published_row())
+    assert list(published.to_dict().items()) == list(dict_published_row().items())
+    assert published.cell_bbox is None
+
+def test_committed_rows_round_trip():
+    with open(EXTRACTED_READINGS_PATH, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    assert rows
+    for row in rows:
+        assert list(ReadingEntry.from_dict(row).to_dict().items()) == list(row.items())
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(protocol):
+    entry = enriched_entry()
+    restored = pickle.loads(pickle.dumps(entry, protocol=protocol))
+    assert restored.to_dict() == entry.to_dict()
+    assert restored.layout_dict() == entry.layout_dict()
+    # Repeated values are interned again in the receiving process
+    assert restored.year is sys.intern("2025")
+    assert restored.fasting is sys.intern("Dispensation")
+
+def test_copy_and_get():
+    entry = enriched_entry()
+    duplicate = entry.copy()
+    duplicate.raw_text = "part two"
+    assert entry.raw_text == "6\nTHEOPHANY\nTone 8"
+    assert duplicate.to_dict() == dict(dict_published_row(), **{"Raw Text": "part two"})
+
+    assert entry.get("Title") == "Theophany"
+    assert entry.get("Cell BBox") == BBOX
+    assert entry.get("Notes", "") == ""
+    assert entry.get("Unknown", 1) == 1
@@ -0,0 +1,101 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from extract_readings import clear_parse_caches, parse_reading_text, parse_reading_texts, scan_segment_tokens
+from sequential_parser import sequential_parse_reading_text
+
+EXTRACTED_READINGS_PATH = Path(__file__).resolve().parent.parent / "extracted_readings.json"
+
+# Texts where the old regexes backtracked or re-searched the text left by an
+# earlier replace; the labeller has to read them the same way.
+EDGE_TEXTS = [
+    "",
+    "Tone",
+    "Matins Gospel:",
+    "Matins Gospel: ",
+    "Divine Liturgy:;",
+    "Divine Liturgy: Rom 1:1; ",
+    "Divine Liturgy: Heb 1:1-12; John 5:1-10. Great Vespers",
+    "Divine Liturgy of St. Basil. Epistle Heb 7:26-28 Gospel Jn 10:9-16",
+    "Tone Common Abstinence 4, Res. Gospel 5",
+    "Res. Gospel Tone 3 7",
+    "Epistle Rom 5:1-10 Following week readings: G: Lk 2:20",
+    "Ep. 2 Tim 4:5-8 Epistle Rom 1:1 Gospel Mt 5:1. Keep the fast",
+    "Apost. Gal 4:4-7; Gospel: Mark 2:1-12",
+    "Apostle Heb 7:26-28",
+    "Rom 5:1-10; G : Jn 1:1",
+    "Gospel Matt. 8: 28 -9:1. Holy Day of Obligation",
+    "Gospel Lk 1:1 Liturgy of the Presanctified",
+    "USA: Labor Day CANADA: Civic Holiday USA: Labor Day",
+    "CANADA: Civic Holiday   USA:",
+    "Strict abstinence from meat and dairy this week; Dispensation (Hârți) Abstinence",
+    "EPİSTLE Rom 1:1 Goſpel Lk 1:1 abſtinence",
+    "<b>Theophany</b> â€“ Forefeast Gospel Mt 3:13-17",
+    "Epistle Rom 1:1 Rom 1:1 Gospel Mt 5:1 Rom 1:1",
+]
+
+FRAGMENTS = [
+    "Common Abstinence", "Strict Fast", "Strict Fast and abstinence", "Abstinence from meat",
+    "Dispensation (Hârți)", "Dispensation", "Abstinence", "Tone 4", "Tone", "Res. Gospel 5", "Res, Gospel 2",
+    "Res. Gospel", "Matins Gospel: John 20:1-10", "Matins Gospel Lk 24:1-12", "MATINS GOSPEL:",
+    "Divine Liturgy: Heb 1:1-12; John 5:1-10", "Divine Liturgy:", "Divine Liturgy of St. Basil",
+    "Liturgy of St. Basil", "Epistle Rom. 10: 1–10", "Epistle: Heb. 1: 10-14 2:1-4", "Ep. 2 Tim 4:5-8",
+    "Ep 1 Cor 1:18-24", "Apostle 1 Cor 1:18-24", "Apost. Gal 4:4-7", "Gospel Matt. 8: 28 -9:1",
+    "Gospel: Mark 2:1-12", "G: Lk 2:20-21", "G : Jn 1:1", "Rom 5:1-10", "Heb 7:26-28", "Following",
+    "Following week readings – 6th week after Pentecost", "Great blessing of water", "Holy Day of Obligation",
+    "CANADA: Civic Holiday", "USA: Labor Day", "5th SUNDAY AFTER PENTECOST", "St. Nicholas", "Epistles",
+    "also Matt 5:1", "â€“ Forefeast", "<b>Feast</b>", "EPİSTLE Rom 1:1", "Goſpel Lk 1:1", "Epistle", "Gospel",
+]
+SEPARATORS = [" ", ", ", ". ", "; ", "\n", ": ", ".", ",", ";", "  "]
+
+def corpus_texts():
+    """Distinct cell texts of the committed outputs, as the parse stage saw them (stacked and double cells split)."""
+    with open(EXTRACTED_READINGS_PATH, "r", encoding="utf-8") as f:
+        return sorted({row["Raw Text"] for row in json.load(f) if row["Raw Text"]})
+
+def generated_texts(seed, count):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        text = f"{rng.randint(1, 31)}\n"
+        for fragment in rng.sample(FRAGMENTS, rng.randint(1, 8)):
+            text += fragment + rng.choice(SEPARATORS)
+        texts.append(text)
+    return texts
+
+def assert_same_as_sequential(texts):
+    clear_parse_caches()
+    batch = parse_reading_texts(texts)
+    differing = [text for text, parsed in zip(texts, batch) if parsed != sequential_parse_reading_text(text)]
+    assert differing == []
+
+def test_labeller_matches_sequential_parser_on_corpus():
+    texts = corpus_texts()
+    assert len(texts) > 900
+    assert_same_as_sequential(texts)
+
+def test_labeller_matches_sequential_parser_on_edge_texts():
+    assert_same_as_sequential(EDGE_TEXTS)
+    for text in EDGE_TEXTS:
+        assert parse_reading_text(text) == sequential_parse_reading_text(text)
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_labeller_matches_sequential_parser_on_generated_texts(seed):
+    assert_same_as_sequential(generated_texts(seed, 2000))
+
+def test_batch_results_are_independent_copies():
+    texts = ["Tone 4, Epistle Rom 1:1, Gospel Mt 5:1", None, "Tone 4, Epistle Rom 1:1, Gospel Mt 5:1"]
+    first, empty, second = parse_reading_texts(texts)
+    assert empty is None
+    assert first == second and first is not second
+    first["tone"] = "8"
+    assert parse_reading_text(texts[0])["tone"] == "4"
+
+def test_scan_segment_tokens_labels_keywords_left_to_right():
+    tokens = scan_segment_tokens("Tone 4, Res. Gospel 5, Epistle Rom 1:1, G: Mt 5:1 Following")
+    assert [(token.kind, token.number) for token in tokens] == [
+        ("tone", "4"), ("res", "5"), ("epistle", None), ("gospel", None), ("following", None)
+    ]
@@ -0,0 +1,43 @@
+from datetime import date
+
+import pytest
+
+from readings_binary import ReadingsBinary, export_readings_binary
+
+@pytest.fixture
+def rows(make_row):
+    return [
+        make_row(2024, 12, 31, Title="St. Melania"),
+        make_row(2025, 2, 2, Title="Encounter of Our Lord", Epistle="Heb 7:7-17",
+                 **{"Epistle Ranges": [[58007007, 58007017]], "Holy Day of Obligation": True}),
+        make_row(2025, 2, 2, Title="Sunday of Zacchaeus", Tone="4", **{"Matins Gospel": "7"}),
+        make_row(2025, 3, 1, Title="Ação de graças", Notes="Non-ASCII text"),
+    ]
+
+def test_round_trip(tmp_path, rows):
+    path = tmp_path / "readings.bin"
+    assert export_readings_binary(reversed(rows[2:]), path) == 2
+    export_readings_binary(rows, path)
+
+    with ReadingsBinary(path) as readings:
+        assert list(readings) == rows
+        assert readings.first_date == date(2024, 1, 1)
+        assert readings.last_date == date(2025, 12, 31)
+        # Rows sharing a date keep their output order
+        assert readings.by_date("2025-02-02") == rows[1:3]
+        assert readings.by_date(date(2025, 3, 1)) == rows[3:]
+
+def test_missing_days(tmp_path, rows):
+    path = tmp_path / "readings.bin"
+    export_readings_binary(rows, path)
+
+    with ReadingsBinary(path) as readings:
+        assert readings.by_date("2025-02-03") == []
+        assert readings.by_date("2030-01-01") == []
+        assert readings.day_slot(date(2023, 12, 31)) == (0, 0)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "readings.bin"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        ReadingsBinary(path)
@@ -0,0 +1,29 @@
+from readings_db import ReadingsDb, ReadingsDbWriter
+
+def write_db(path, rows):
+    with ReadingsDbWriter(path) as writer:
+        for row in rows:
+            writer.write_row(row)
+
+def test_rows_round_trip_unchanged(tmp_path, make_row):
+    rows = [
+        make_row(2025, 1, 5, Tone="3", **{"Matins Gospel": "5", "Matins Gospel Ranges": [[43020001, 43020010]],
+                                          "Holy Day of Obligation": True}),
+        make_row(2025, 1, 6, **{"Matins Gospel": "John 20:1-10", "Epistle": "Titus 2:11-14; 3:4-7",
+                                "Epistle Ranges": [[56002011, 56002014], [56003004, 56003007]]}),
+    ]
+    path = tmp_path / "readings.sqlite"
+    write_db(path, rows)
+
+    with ReadingsDb(path) as db:
+        assert db.in_range("2025-01-01", "2025-01-31") == rows
+        assert db.holy_days(2025) == rows[:1]
+
+def test_res_gospel_number_only_for_numbers(tmp_path, make_row):
+    path = tmp_path / "readings.sqlite"
+    write_db(path, [make_row(2025, 1, 5, **{"Matins Gospel": "5"}),
+                    make_row(2025, 1, 6, **{"Matins Gospel": "John 20:1-10"})])
+
+    with ReadingsDb(path) as db:
+        numbers = db._conn.execute("SELECT res_gospel_number FROM readings ORDER BY iso_date").fetchall()
+    assert numbers == [(5,), (None,)]
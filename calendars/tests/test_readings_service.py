@@ -0,0 +1,141 @@
+import http.client
+import json
+import os
+import threading
+
+import pytest
+
+from readings_service import MAX_RANGE_DAYS, ReadingsService, make_server
+
+@pytest.fixture
+def rows(make_row):
+    return [
+        make_row(2024, 12, 25, Title="Nativity", **{"Holy Day of Obligation": True}),
+        make_row(2025, 1, 6, Title="Theophany", Gospel="Mt 3:13-17", **{"Holy Day of Obligation": True}),
+        make_row(2025, 1, 5, Title="Sunday before Theophany"),
+        make_row(2025, 1, 7, Title="Synaxis of St. John"),
+        make_row(2025, 8, 15, Title="Dormition", **{"Holy Day of Obligation": True}),
+    ]
+
+@pytest.fixture
+def readings_path(tmp_path, rows):
+    path = tmp_path / "extracted_readings.json"
+    path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    return path
+
+@pytest.fixture
+def service(readings_path):
+    return ReadingsService(readings_path, max_age=60)
+
+@pytest.fixture
+def client(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    yield connection
+    connection.close()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+def get(client, target, headers=None):
+    client.request("GET", target, headers=headers or {})
+    response = client.getresponse()
+    body = response.read()
+    return response, json.loads(body) if body else None
+
+def test_reading_by_iso_date_and_key(client, rows):
+    response, payload = get(client, "/reading/2025-01-06")
+    assert response.status == 200
+    assert payload == rows[1]
+    assert response.getheader("Content-Type") == "application/json; charset=utf-8"
+    assert response.getheader("Cache-Control") == "public, max-age=60"
+
+    response, by_key = get(client, "/reading/010625")
+    assert response.status == 200
+    assert by_key == payload
+
+def test_missing_and_malformed_readings(client):
+    response, payload = get(client, "/reading/2025-01-08")
+    assert response.status == 404
+    assert response.getheader("Cache-Control") == "no-store"
+    assert "2025-01-08" in payload["error"]
+
+    response, _ = get(client, "/reading/2025-13-01")
+    assert response.status == 400
+    response, _ = get(client, "/unknown")
+    assert response.status == 404
+
+def test_range_is_in_date_order(client, rows):
+    response, payload = get(client, "/range?start=2025-01-05&end=010725")
+    assert response.status == 200
+    assert payload == [rows[2], rows[1], rows[3]]
+
+    response, payload = get(client, "/range?start=2025-02-01&end=2025-02-28")
+    assert response.status == 200
+    assert payload == []
+
+def test_range_limits(client):
+    # MAX_RANGE_DAYS days at most, both ends included
+    response, _ = get(client, "/range?start=2024-01-01&end=2024-12-31")
+    assert response.status == 200
+    response, payload = get(client, "/range?start=2024-01-01&end=2025-01-01")
+    assert response.status == 400
+    assert str(MAX_RANGE_DAYS) in payload["error"]
+    for target in ("/range?start=2025-01-07&end=2025-01-06", "/range?start=2025-01-07", "/range?start=soon&end=later"):
+        response, payload = get(client, target)
+        assert response.status == 400
+        assert payload["error"]
+
+def test_holy_days(client):
+    response, payload = get(client, "/holy-days/2025")
+    assert response.status == 200
+    assert payload == ["010625", "081525"]
+
+    response, payload = get(client, "/holy-days/2030")
+    assert payload == []
+
+def test_if_none_match_gets_304(client):
+    response, _ = get(client, "/reading/2025-01-06")
+    etag = response.getheader("ETag")
+    assert etag.startswith('"') and etag.endswith('"')
+
+    response, body = get(client, "/reading/2025-01-06", {"If-None-Match": f'"stale", {etag}'})
+    assert response.status == 304
+    assert body is None
+    assert response.getheader("ETag") == etag
+
+    response, _ = get(client, "/reading/2025-01-07", {"If-None-Match": etag})
+    assert response.status == 200
+
+def test_hot_reload_after_json_changes(client, service, readings_path, rows, make_row):
+    response, _ = get(client, "/reading/2025-01-06")
+    old_etag = response.getheader("ETag")
+    assert service.reload_if_changed() is False
+
+    changed = [dict(rows[1], Title="Holy Theophany"), make_row(2025, 1, 8, Title="St. George")]
+    readings_path.write_text(json.dumps(changed, indent=2), encoding="utf-8")
+    stat = readings_path.stat()
+    # Make the change visible even on filesystems with coarse mtimes
+    os.utime(readings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert service.reload_if_changed() is True
+
+    response, payload = get(client, "/reading/2025-01-06", {"If-None-Match": old_etag})
+    assert response.status == 200
+    assert payload["Title"] == "Holy Theophany"
+    response, payload = get(client, "/reading/2025-01-08")
+    assert payload["Title"] == "St. George"
+    response, _ = get(client, "/reading/2024-12-25")
+    assert response.status == 404
+
+def test_unreadable_json_keeps_serving_previous_data(client, service, readings_path, capsys):
+    readings_path.write_text("[{", encoding="utf-8")
+    stat = readings_path.stat()
+    os.utime(readings_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert service.reload_if_changed() is False
+    assert "Reload of" in capsys.readouterr().out
+
+    response, payload = get(client, "/reading/2025-01-06")
+    assert response.status == 200
+    assert payload["Title"] == "Theophany"
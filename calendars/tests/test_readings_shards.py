@@ -0,0 +1,90 @@
+import hashlib
+import json
+
+import pytest
+
+from readings_shards import (
+    MANIFEST_FILENAME,
+    ShardedOutputWriter,
+    decode_shard,
+    encode_shard,
+    iter_sharded_readings,
+    load_manifest,
+)
+
+@pytest.fixture
+def rows(make_row):
+    return [
+        make_row(2024, 12, 31, Title="St. Melania", Fasting="Dispensation"),
+        make_row(2025, 1, 6, Title="Theophany", Tone="8", Gospel="Mt 3:13-17",
+                 **{"Gospel Ranges": [[40003013, 40003017]], "Holy Day of Obligation": True}),
+        make_row(2025, 1, 6, Title="Sunday after Theophany", Fasting="Dispensation"),
+        make_row(2025, 3, 1, Title="Ação de graças", Notes="Non-ASCII text"),
+    ]
+
+def write_shards(shards_dir, rows, shard_by="year"):
+    with ShardedOutputWriter(shards_dir, shard_by) as writer:
+        for row in rows:
+            writer.write_row(row)
+    return writer
+
+def test_encode_decode_round_trip(rows):
+    data = encode_shard(2025, None, rows[1:])
+    assert decode_shard(data) == rows[1:]
+    assert decode_shard(data.decode("utf-8")) == rows[1:]
+    # Repeated values are stored once
+    assert json.loads(data)["strings"].count("Dispensation") == 1
+
+def test_write_read_round_trip(tmp_path, rows):
+    write_shards(tmp_path, rows)
+
+    assert list(iter_sharded_readings(tmp_path)) == rows
+    assert list(iter_sharded_readings(tmp_path, years=[2025])) == rows[1:]
+    assert list(iter_sharded_readings(tmp_path, years=["2024"], verify=True)) == rows[:1]
+
+def test_manifest_lists_shards_with_hashes(tmp_path, rows):
+    write_shards(tmp_path, rows, shard_by="month")
+
+    manifest = load_manifest(tmp_path)
+    assert manifest["shard_by"] == "month"
+    assert [(shard["path"], shard["rows"]) for shard in manifest["shards"]] == [
+        ("2024-12.json", 1), ("2025-01.json", 2), ("2025-03.json", 1)
+    ]
+    for shard in manifest["shards"]:
+        data = (tmp_path / shard["path"]).read_bytes()
+        assert shard["sha256"] == hashlib.sha256(data).hexdigest()
+        assert shard["bytes"] == len(data)
+    assert manifest["shards"][1]["first_date"] == manifest["shards"][1]["last_date"] == "2025-01-06"
+
+def test_rewrite_deletes_stale_shards(tmp_path, rows):
+    (tmp_path / "notes.txt").write_text("kept", encoding="utf-8")
+    write_shards(tmp_path, rows, shard_by="month")
+
+    write_shards(tmp_path, rows[1:3])
+    # Only the shards the previous manifest listed are deleted
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2025.json", MANIFEST_FILENAME, "notes.txt"]
+    assert list(iter_sharded_readings(tmp_path, verify=True)) == rows[1:3]
+
+def test_unchanged_shard_keeps_its_hash(tmp_path, rows):
+    write_shards(tmp_path, rows)
+    before = {shard["path"]: shard["sha256"] for shard in load_manifest(tmp_path)["shards"]}
+
+    write_shards(tmp_path, rows[:3] + [dict(rows[3], Notes="Changed")])
+    after = {shard["path"]: shard["sha256"] for shard in load_manifest(tmp_path)["shards"]}
+    assert after["2024.json"] == before["2024.json"]
+    assert after["2025.json"] != before["2025.json"]
+
+def test_verify_rejects_tampered_shard(tmp_path, rows):
+    write_shards(tmp_path, rows)
+    shard_path = tmp_path / "2025.json"
+    shard_path.write_bytes(shard_path.read_bytes().replace(b"Theophany", b"Theophanx"))
+
+    assert list(iter_sharded_readings(tmp_path))[1]["Title"] == "Theophanx"
+    with pytest.raises(ValueError, match="manifest hash"):
+        list(iter_sharded_readings(tmp_path, verify=True))
+
+def test_rejects_other_shard_formats(rows):
+    shard = json.loads(encode_shard(2025, None, rows[1:]))
+    shard["version"] += 1
+    with pytest.raises(ValueError):
+        decode_shard(shard)
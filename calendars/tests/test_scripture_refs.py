@@ -0,0 +1,61 @@
+import pytest
+
+from scripture_refs import (
+    book_id,
+    entry_ranges,
+    format_ranges,
+    matins_gospel_ranges,
+    pack_verse,
+    parse_reference,
+    unpack_verse,
+)
+
+@pytest.mark.parametrize("text, expected", [
+    ("Heb. 7:26-8:2", "Hebrews 7:26-8:2"),
+    ("Lk 1:1-25;57-68; 76-80", "Luke 1:1-25; Luke 1:57-68; Luke 1:76-80"),
+    ("Acts. 6:8 to 7:5a and 47-60", "Acts 6:8-7:5; Acts 7:47-60"),
+    ("1 Cor. 1:10-18", "1 Corinthians 1:10-18"),
+    ("Heb. 7-26-8:2", "Hebrews 7:26-8:2"),
+    ("Jude 1-10", "Jude 1:1-10"),
+    ("Ps 90", "Psalms 90"),
+    ("Gen 1-2", "Genesis 1-2"),
+    ("John 11:1-45 Commemoration of St. Lazarus", "John 11:1-45"),
+    ("Mt 10:1, 5-8; Rom 2:10-16", "Matthew 10:1; Matthew 10:5-8; Romans 2:10-16"),
+    ("Is 7:14", "Isaiah 7:14"),
+    ("He. 7:26-8:2", "Hebrews 7:26-8:2"),
+    ("Mt 28:1-20 He is risen", "Matthew 28:1-20"),
+])
+def test_parse_reference(text, expected):
+    assert format_ranges(parse_reference(text)) == expected
+
+@pytest.mark.parametrize("text", [
+    None, "", "Holy Day of Obligation", "7:26-28", "Rom 5:10-1",
+    # Two-letter spellings that are English words need a chapter:verse
+    "He is risen", "Is 1", "I am 40 days", "Co 3", "Pp 2-4",
+])
+def test_unparseable_references(text):
+    assert parse_reference(text) == ()
+
+def test_verse_packing():
+    verse_id = pack_verse(book_id("Hebrews"), 7, 26)
+    assert verse_id == 65007026
+    assert unpack_verse(verse_id) == (65, 7, 26)
+
+def test_book_spellings():
+    assert book_id("1 Cor.") == book_id("1 Corinthians") == book_id("1cor")
+    assert book_id("Lk") == book_id("Luke") == 49
+    assert book_id("Romanz") is None
+
+def test_matins_gospel_number_or_reference():
+    assert matins_gospel_ranges("7") == parse_reference("John 20:1-10")
+    assert matins_gospel_ranges("John 21:1-14") == parse_reference("John 21:1-14")
+    assert matins_gospel_ranges("12") == ()
+    assert matins_gospel_ranges(None) == ()
+
+def test_entry_ranges_prefers_emitted_ranges():
+    emitted = {"Epistle": "Heb 7:26-8:2", "Epistle Ranges": [[1001001, 1001002]]}
+    assert entry_ranges(emitted, "Epistle") == ((1001001, 1001002),)
+    assert entry_ranges({"Epistle": "Heb 7:26-8:2", "Epistle Ranges": None}, "Epistle") == ()
+    # Outputs written before the ranges existed are parsed from the string
+    assert entry_ranges({"Gospel": "Lk 2:20-21"}, "Gospel") == parse_reference("Lk 2:20-21")
+    assert entry_ranges({"Matins Gospel": "1"}, "Matins Gospel") == parse_reference("Matthew 28:16-20")
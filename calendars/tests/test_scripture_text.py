@@ -0,0 +1,47 @@
+import pytest
+
+from scripture_text import ScriptureStore, build_scripture_store, iter_source_verses
+from scripture_refs import pack_verse, parse_reference
+
+SOURCE = """\
+Luke 8:5 The sower went out to sow his seed.
+Luke 8:6 And other some fell upon a rock.
+4 Kings 2:1 And it came to pass.
+
+Hebrews Chapter 11
+
+11:17. By faith Abraham, when he was tried,
+offered Isaac.
+11:18. To whom it was said.
+"""
+
+@pytest.fixture
+def store_path(tmp_path, make_row):
+    source = tmp_path / "douay_rheims.txt"
+    source.write_text(SOURCE, encoding="utf-8")
+    row = make_row(2025, 1, 5, Epistle="Heb 11:17-18", Gospel="Lk 8:5-15",
+                   **{"Epistle Ranges": parse_reference("Heb 11:17-18"), "Gospel Ranges": parse_reference("Lk 8:5-15")})
+    path = tmp_path / "scripture.sqlite"
+    assert build_scripture_store(source, path, [row]) == (5, 2, [])
+    return path
+
+def test_both_source_layouts():
+    verses = dict(iter_source_verses(SOURCE.splitlines()))
+    # Douay-Rheims "4 Kings" is 2 Kings
+    assert verses[pack_verse(12, 2, 1)] == "And it came to pass."
+    assert verses[pack_verse(65, 11, 17)] == "By faith Abraham, when he was tried, offered Isaac."
+
+def test_pre_rendered_day(store_path):
+    with ScriptureStore(store_path) as store:
+        readings = store.day("2025-01-05")
+        assert [(reading["field"], reading["reference"]) for reading in readings] == [
+            ("Epistle", "Hebrews 11:17-18"), ("Gospel", "Luke 8:5-15")]
+        assert readings[0]["text"].startswith("11:17 By faith Abraham")
+        assert store.day("2025-01-06") == []
+
+def test_passage_lookup(store_path):
+    with ScriptureStore(store_path) as store:
+        assert store.passage("Lk 8:5-6") == "8:5 The sower went out to sow his seed. 6 And other some fell upon a rock."
+        assert store.passage("John 1:1") is None
+        with pytest.raises(ValueError):
+            store.passage("Foo 1:1")
@@ -0,0 +1,65 @@
+import pytest
+
+from text_index import TextIndex, TextIndexWriter, _decode_postings, _encode_postings
+
+@pytest.fixture
+def rows(make_row):
+    return [
+        make_row(2025, 1, 6, Title="(†)THEOPHANY", Notes="Great blessing of water",
+                 **{"Raw Text": "6\n(†)THEOPHANY\nGreat blessing of water"}),
+        make_row(2025, 1, 5, Title="Sunday before Theophany", Fasting="Strict Fast",
+                 **{"Raw Text": "5\nSunday before Theophany\nStrict Fast"}),
+        make_row(2025, 3, 3, Title="Great Lent begins", Fasting="Fasting",
+                 Notes="Water and great blessing", **{"Raw Text": "3\nGreat Lent begins"}),
+    ]
+
+def dates(hits):
+    return [hit.date for hit in hits]
+
+def test_postings_round_trip():
+    doc_positions = {0: [1, 4, 9], 3: [65536], 7: [2]}
+    assert _decode_postings(_encode_postings(doc_positions)) == doc_positions
+
+def test_words_match_case_insensitively_in_date_order(rows):
+    index = TextIndex.from_rows(rows)
+    assert dates(index.search("theophany")) == ["2025-01-05", "2025-01-06"]
+    assert dates(index.search("THEOPHANY sunday")) == ["2025-01-05"]
+    assert index.search("pentecost") == []
+    assert index.search('""') == []
+
+def test_phrase_needs_adjacent_words(rows):
+    index = TextIndex.from_rows(rows)
+    assert dates(index.search("great blessing")) == ["2025-01-06", "2025-03-03"]
+    assert dates(index.search('"great blessing of water"')) == ["2025-01-06"]
+
+def test_phrase_does_not_run_across_fields(make_row):
+    index = TextIndex.from_rows([make_row(2025, 1, 1, Title="Holy Water", Notes="blessing",
+                                          **{"Raw Text": None})])
+    assert index.search('"water blessing"') == []
+    assert dates(index.search("water blessing")) == ["2025-01-01"]
+
+def test_prefix_and_field_filter(rows):
+    index = TextIndex.from_rows(rows)
+    assert dates(index.search("fast*")) == ["2025-01-05", "2025-03-03"]
+    [hit] = index.search("strict", fields=["Fasting"])
+    assert hit.fields == ("Fasting",)
+    assert index.search("begins", fields=["Notes"]) == []
+    assert index.search("begins")[0].fields == ("Title", "Raw Text")
+
+def test_writer_matches_from_rows_and_load(rows, tmp_path):
+    path = tmp_path / "text_index.json"
+    with TextIndexWriter(path) as writer:
+        for row in rows:
+            writer.write_row(row)
+
+    loaded = TextIndex.load(path)
+    built = TextIndex.from_rows(rows)
+    assert len(loaded) == len(built) == 3
+    for query in ("theophany", '"great blessing"', "fast* water", "lent"):
+        assert loaded.search(query) == built.search(query)
+
+def test_load_rejects_other_formats(tmp_path):
+    path = tmp_path / "text_index.json"
+    path.write_text('{"format": "text-index", "version": 0}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        TextIndex.load(path)
@@ -0,0 +1,53 @@
+import json
+
+from lectionary import PaschaTable
+from validate_readings import (
+    anomaly_key,
+    check_row,
+    format_validation_report,
+    load_baseline,
+    save_baseline,
+    validate_rows,
+)
+
+def check(row):
+    return check_row(row, PaschaTable(), {})
+
+def test_sunday_with_expected_cycle_is_clean(make_row):
+    # 2025-01-19: 39 weeks after Pascha 2024 -> Tone 2, Resurrection Gospel 2
+    assert check(make_row(2025, 1, 19, Tone="2", **{"Matins Gospel": "2"})) == []
+
+def test_wrong_tone_and_matins_gospel(make_row):
+    anomalies = check(make_row(2025, 1, 19, Tone="3", **{"Matins Gospel": "4"}))
+    assert [anomaly.kind for anomaly in anomalies] == ["tone", "matins_gospel"]
+    assert anomaly_key(anomalies[0]) == "2025-01-19 tone"
+
+def test_sunday_cycle_on_a_weekday_reports_the_shift(make_row):
+    # 2025-01-20 is a Monday: the column is one day late
+    [anomaly] = check(make_row(2025, 1, 20, Tone="2", **{"Matins Gospel": "2"}))
+    assert anomaly.kind == "weekday"
+    assert "+1" in anomaly.message
+
+def test_weekday_without_cycle_is_clean(make_row):
+    assert check(make_row(2025, 1, 20)) == []
+
+def test_day_outside_month(make_row):
+    [anomaly] = check(make_row(2025, 2, 30))
+    assert anomaly.kind == "day"
+
+def test_great_feast_on_a_sunday_is_exempt(make_row):
+    # Transfiguration, Sunday 2023-08-06
+    assert check(make_row(2023, 8, 6)) == []
+
+def test_baseline_filters_known_anomalies(make_row, tmp_path):
+    validator = validate_rows([make_row(2025, 1, 19, Tone="3", **{"Matins Gospel": "2"}),
+                               make_row(2025, 1, 26, Tone="1", **{"Matins Gospel": "3"})])
+    baseline_path = tmp_path / "baseline.json"
+    assert load_baseline(baseline_path) == frozenset()
+
+    save_baseline(baseline_path, validator)
+    assert json.loads(baseline_path.read_text(encoding="utf-8")) == ["2025-01-19 tone", "2025-01-26 tone"]
+    baseline = load_baseline(baseline_path)
+    assert validator.new_anomalies(baseline) == []
+    assert [anomaly_key(a) for a in validator.new_anomalies(baseline - {"2025-01-26 tone"})] == ["2025-01-26 tone"]
+    assert "2 anomalies, 0 not in the baseline" in format_validation_report(validator, baseline)
@@ -0,0 +1,260 @@
+"""
+Inverted full-text index over the descriptive fields of the outputs.
+
+Every word of INDEXED_TEXT_FIELDS is case-folded and recorded with the row
+(document) and position it occurs at. Positions are offset by
+FIELD_POSITION_GAP per field, so one list answers word, phrase and
+per-field queries and a phrase never runs across two fields. Posting lists
+are stored delta-encoded in text_index.json and decoded on first use:
+
+    python text_index.py theophany
+    python text_index.py '"great blessing of water"'
+    python text_index.py "fast*" --field Fasting
+
+Words of a query must all match (AND); "quoted words" must be adjacent and
+a trailing * matches every word with that prefix. Hits come in date order.
+"""
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from pathlib import Path
+
+from reading_schema import entry_date
+
+TEXT_INDEX_FILENAME = "text_index.json"
+TEXT_INDEX_FORMAT = "text-index"
+TEXT_INDEX_VERSION = 1
+INDEXED_TEXT_FIELDS = ("Title", "Notes", "Fasting", "Canada Holiday", "USA Holiday", "Raw Text")
+# Position of word n of field f is f * FIELD_POSITION_GAP + n
+FIELD_POSITION_GAP = 1 << 16
+
+TOKEN_RE = re.compile(r"\w+")
+QUERY_CLAUSE_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+TextHit = namedtuple("TextHit", ["date", "title", "fields"])
+
+def tokenize(text):
+    return [token.casefold() for token in TOKEN_RE.findall(text)] if text else []
+
+def _encode_postings(doc_positions):
+    """{doc: [positions]} -> [doc delta, position count, first position, position deltas..., ...]."""
+    encoded = []
+    previous_doc = 0
+    for doc in sorted(doc_positions):
+        positions = doc_positions[doc]
+        encoded.append(doc - previous_doc)
+        encoded.append(len(positions))
+        previous_position = 0
+        for position in positions:
+            encoded.append(position - previous_position)
+            previous_position = position
+        previous_doc = doc
+    return encoded
+
+def _decode_postings(encoded):
+    doc_positions = {}
+    idx = 0
+    doc = 0
+    while idx < len(encoded):
+        doc += encoded[idx]
+        count = encoded[idx + 1]
+        idx += 2
+        positions = []
+        position = 0
+        for delta in encoded[idx:idx + count]:
+            position += delta
+            positions.append(position)
+        idx += count
+        doc_positions[doc] = positions
+    return doc_positions
+
+def _row_postings(row, doc, postings):
+    for field_idx, field in enumerate(INDEXED_TEXT_FIELDS):
+        base = field_idx * FIELD_POSITION_GAP
+        for position, token in enumerate(tokenize(row.get(field))):
+            postings.setdefault(token, {}).setdefault(doc, []).append(base + position)
+
+class TextIndex:
+    def __init__(self, docs, encoded_postings):
+        """docs: [(iso_date, title)] by document id; encoded_postings: {term: delta-encoded list}."""
+        self.docs = docs
+        self._encoded = encoded_postings
+        self.terms = sorted(encoded_postings)
+        self._decoded = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    @classmethod
+    def from_rows(cls, rows):
+        docs = []
+        postings = {}
+        for row in rows:
+            _row_postings(row, len(docs), postings)
+            docs.append((entry_date(row).isoformat(), row.get("Title")))
+        return cls(docs, {term: _encode_postings(doc_positions) for term, doc_positions in postings.items()})
+
+    def _postings(self, term):
+        """{doc: frozenset of positions} of one term, decoded once."""
+        doc_positions = self._decoded.get(term)
+        if doc_positions is None:
+            encoded = self._encoded.get(term)
+            decoded = _decode_postings(encoded) if encoded else {}
+            doc_positions = self._decoded[term] = {doc: frozenset(positions) for doc, positions in decoded.items()}
+        return doc_positions
+
+    def _word_positions(self, word):
+        """{doc: set of positions} of a query word; "word*" unions every term with that prefix."""
+        if not word.endswith("*"):
+            return self._postings(word)
+        prefix = word.rstrip("*")
+        merged = {}
+        for term_idx in range(bisect_left(self.terms, prefix), len(self.terms)):
+            term = self.terms[term_idx]
+            if not term.startswith(prefix):
+                break
+            for doc, positions in self._postings(term).items():
+                merged.setdefault(doc, set()).update(positions)
+        return merged
+
+    def _clause_matches(self, words):
+        """{doc: set of start positions} where the words occur one after another."""
+        matches = None
+        for offset, word in enumerate(words):
+            word_positions = self._word_positions(word)
+            if matches is None:
+                matches = word_positions
+                continue
+            next_matches = {}
+            for doc, starts in matches.items():
+                positions = word_positions.get(doc)
+                if positions:
+                    found = {start for start in starts if start + offset in positions}
+                    if found:
+                        next_matches[doc] = found
+            matches = next_matches
+            if not matches:
+                break
+        return matches or {}
+
+    def search(self, query, fields=None):
+        """
+        TextHits for the rows matching every clause of query (words, "phrases",
+        prefix*), in date order. fields limits the match to some of
+        INDEXED_TEXT_FIELDS; TextHit.fields lists where the clauses matched.
+        """
+        field_ids = None if not fields else {INDEXED_TEXT_FIELDS.index(field) for field in fields}
+        clauses = []
+        for phrase, word in QUERY_CLAUSE_RE.findall(query):
+            words = [token.casefold() + ("*" if part.endswith("*") else "")
+                     for part in (phrase or word).split()
+                     for token in TOKEN_RE.findall(part)]
+            if words:
+                clauses.append(words)
+        if not clauses:
+            return []
+
+        matched_fields = None
+        for words in clauses:
+            clause_fields = {}
+            for doc, starts in self._clause_matches(words).items():
+                doc_fields = {start // FIELD_POSITION_GAP for start in starts}
+                if field_ids is not None:
+                    doc_fields &= field_ids
+                if doc_fields:
+                    clause_fields[doc] = doc_fields
+            if matched_fields is None:
+                matched_fields = clause_fields
+            else:
+                matched_fields = {doc: doc_fields | clause_fields[doc]
+                                  for doc, doc_fields in matched_fields.items() if doc in clause_fields}
+            if not matched_fields:
+                return []
+
+        hits = []
+        for doc in sorted(matched_fields, key=lambda doc: (self.docs[doc][0], doc)):
+            iso_date, title = self.docs[doc]
+            hits.append(TextHit(iso_date, title, tuple(INDEXED_TEXT_FIELDS[field_id] for field_id in sorted(matched_fields[doc]))))
+        return hits
+
+    def save(self, path):
+        payload = {
+            "format": TEXT_INDEX_FORMAT,
+            "version": TEXT_INDEX_VERSION,
+            "fields": list(INDEXED_TEXT_FIELDS),
+            "docs": self.docs,
+            "postings": self._encoded
+        }
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if (payload.get("format") != TEXT_INDEX_FORMAT or payload.get("version") != TEXT_INDEX_VERSION
+                or payload.get("fields") != list(INDEXED_TEXT_FIELDS)):
+            raise ValueError(f"Unsupported text index in {path}")
+        return cls([tuple(doc) for doc in payload["docs"]], payload["postings"])
+
+class TextIndexWriter:
+    """Row writer (see write_output_files) that saves the index of the written rows on close."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._docs = []
+        self._postings = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            encoded = {term: _encode_postings(doc_positions) for term, doc_positions in self._postings.items()}
+            TextIndex(self._docs, encoded).save(self.path)
+        return False
+
+    def write_row(self, row):
+        _row_postings(row, len(self._docs), self._postings)
+        self._docs.append((entry_date(row).isoformat(), row.get("Title")))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search over the extracted readings.")
+    parser.add_argument("query", help='Words (all must match), "quoted phrases" and prefix* terms.')
+    parser.add_argument("--index", type=Path, help=f"Saved index (default: calendars/{TEXT_INDEX_FILENAME}, "
+                                                     "built from extracted_readings.json when missing).")
+    parser.add_argument("--field", action="append", choices=INDEXED_TEXT_FIELDS,
+                        help="Only match this field (repeatable; default: all).")
+    args = parser.parse_args(argv)
+
+    calendars_dir = Path(__file__).parent
+    index_path = args.index or calendars_dir / TEXT_INDEX_FILENAME
+    if index_path.exists():
+        index = TextIndex.load(index_path)
+    else:
+        with open(calendars_dir / "extracted_readings.json", "r", encoding="utf-8") as f:
+            index = TextIndex.from_rows(json.load(f))
+
+    start = time.perf_counter()
+    hits = index.search(args.query, args.field)
+    elapsed = time.perf_counter() - start
+    for hit in hits:
+        print(f"{hit.date}  {', '.join(hit.fields):<24} {(hit.title or '').replace(chr(10), ' ')[:70]}")
+    print(f"{len(hits)} matches in {elapsed * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
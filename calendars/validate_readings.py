@@ -0,0 +1,201 @@
+"""
+Cross-check of the extracted rows against the computed Sunday cycles.
+
+A column misassigned by resolve_block_days shifts a whole month of readings,
+which shows up on the Sundays: the Tone and Resurrection Gospel land on a
+weekday, or on a Sunday whose place in the 8-tone / 11-gospel cycle (see
+lectionary.py) is a different one. Rows are checked one at a time, weekdays
+come from calendar.monthrange, and the anomalies are grouped by month:
+
+    python validate_readings.py
+    python validate_readings.py --baseline validation_baseline.json
+    python validate_readings.py --update-baseline
+
+With a baseline, only anomalies not listed in it count as failures and the
+exit status is 1 when there are any, so CI can refuse to commit the data.
+"""
+import argparse
+import calendar
+import json
+import os
+import tempfile
+import time
+from collections import Counter, namedtuple
+from datetime import date
+from pathlib import Path
+
+from lectionary import PASCHA_FUNCTIONS, PaschaTable, sunday_matins_gospel, sunday_tone
+
+VALIDATION_BASELINE_FILENAME = "validation_baseline.json"
+
+SUNDAY = calendar.SUNDAY
+
+# Fixed Great Feasts of the Lord (month, day): on a Sunday they replace the Tone and Resurrection Gospel
+SUNDAY_CYCLE_FEASTS = {(1, 6), (2, 2), (8, 6), (9, 14), (12, 25)}
+
+Anomaly = namedtuple("Anomaly", ["date", "kind", "message"])
+
+def anomaly_key(anomaly):
+    """Baseline key of an anomaly: "YYYY-MM-DD kind"."""
+    return f"{anomaly.date.isoformat()} {anomaly.kind}"
+
+def _cycle_number(value):
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def _sunday_shift(weekday):
+    """Days between a weekday and the nearest Sunday (-3 ... 3, positive when the Sunday is earlier)."""
+    shift = (weekday - SUNDAY) % 7
+    return shift if shift <= 3 else shift - 7
+
+def check_row(row, pascha_table, month_ranges):
+    """
+    Anomalies of one output row. month_ranges caches calendar.monthrange()
+    by (year, month).
+    """
+    year, month, day = int(row["Year"]), int(row["Date"][:2]), int(row["Day"])
+    month_range = month_ranges.get((year, month))
+    if month_range is None:
+        month_range = month_ranges[(year, month)] = calendar.monthrange(year, month)
+    first_weekday, days_in_month = month_range
+
+    if not 1 <= day <= days_in_month:
+        return [Anomaly(date(year, month, 1), "day", f"day {day} is outside {calendar.month_name[month]} {year}")]
+
+    row_date = date(year, month, day)
+    weekday = (first_weekday + day - 1) % 7
+    tone = _cycle_number(row.get("Tone"))
+    matins_gospel = _cycle_number(row.get("Matins Gospel"))
+
+    if weekday != SUNDAY:
+        if tone is None and matins_gospel is None:
+            return []
+        shift = _sunday_shift(weekday)
+        return [Anomaly(row_date, "weekday",
+                        f"Sunday cycle on a {calendar.day_name[weekday]}: the column looks shifted by {shift:+d} day(s)")]
+
+    if (month, day) in SUNDAY_CYCLE_FEASTS and tone is None and matins_gospel is None:
+        return []
+
+    anomalies = []
+    weeks_after_pascha = (row_date - pascha_table.previous(row_date)).days // 7
+    expected_tone = sunday_tone(weeks_after_pascha)
+    expected_matins_gospel = sunday_matins_gospel(weeks_after_pascha)
+    if tone != expected_tone:
+        anomalies.append(Anomaly(row_date, "tone", f"Tone {tone} (expected {expected_tone})"))
+    if matins_gospel != expected_matins_gospel:
+        anomalies.append(Anomaly(row_date, "matins_gospel",
+                                 f"Matins Gospel {matins_gospel} (expected {expected_matins_gospel})"))
+    return anomalies
+
+class ReadingValidator:
+    """
+    Row writer (see write_output_files) collecting the anomalies of every
+    written row in anomalies_by_month, keyed by (year, month).
+    """
+
+    def __init__(self, reckoning="gregorian"):
+        self.count = 0
+        self.anomalies_by_month = {}
+        self._pascha_table = PaschaTable(reckoning)
+        self._month_ranges = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def write_row(self, row):
+        self.count += 1
+        for anomaly in check_row(row, self._pascha_table, self._month_ranges):
+            self.anomalies_by_month.setdefault((anomaly.date.year, anomaly.date.month), []).append(anomaly)
+
+    def anomalies(self):
+        return [anomaly for month in sorted(self.anomalies_by_month) for anomaly in self.anomalies_by_month[month]]
+
+    def new_anomalies(self, baseline_keys=()):
+        """Anomalies whose anomaly_key() is not in baseline_keys."""
+        return [anomaly for anomaly in self.anomalies() if anomaly_key(anomaly) not in baseline_keys]
+
+def validate_rows(rows, reckoning="gregorian"):
+    validator = ReadingValidator(reckoning)
+    for row in rows:
+        validator.write_row(row)
+    return validator
+
+def format_validation_report(validator, baseline_keys=()):
+    lines = []
+    for year, month in sorted(validator.anomalies_by_month):
+        anomalies = validator.anomalies_by_month[(year, month)]
+        lines.append(f"  {calendar.month_name[month]} {year}: {len(anomalies)} anomalies")
+        shifts = Counter(_sunday_shift(anomaly.date.weekday()) for anomaly in anomalies if anomaly.kind == "weekday")
+        for shift, count in shifts.items():
+            if count > 1:
+                lines.append(f"    {count} Sundays shifted by {shift:+d} day(s): check the day columns of this month")
+        for anomaly in anomalies:
+            known = " (known)" if anomaly_key(anomaly) in baseline_keys else ""
+            lines.append(f"    {anomaly.date.isoformat()} {anomaly.kind}: {anomaly.message}{known}")
+
+    new_count = len(validator.new_anomalies(baseline_keys))
+    total = sum(len(anomalies) for anomalies in validator.anomalies_by_month.values())
+    summary = f"Validated {validator.count} rows: {total} anomalies"
+    if baseline_keys:
+        summary += f", {new_count} not in the baseline"
+    return "\n".join([summary] + lines)
+
+def load_baseline(path):
+    """Anomaly keys accepted by a baseline file; empty when it does not exist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return frozenset(json.load(f))
+    except FileNotFoundError:
+        return frozenset()
+
+def save_baseline(path, validator):
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(sorted(anomaly_key(anomaly) for anomaly in validator.anomalies()), f, indent=2)
+            f.write("\n")
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+def main(argv=None):
+    calendars_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Check the extracted Sundays against the computed Tone and Matins Gospel cycles.")
+    parser.add_argument("--readings", type=Path, default=calendars_dir / "extracted_readings.json",
+                        help="Readings to check (default: calendars/extracted_readings.json).")
+    parser.add_argument("--baseline", type=Path, default=calendars_dir / VALIDATION_BASELINE_FILENAME,
+                        help=f"Known anomalies that do not fail the check (default: calendars/{VALIDATION_BASELINE_FILENAME}).")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Accept every current anomaly by rewriting the baseline.")
+    parser.add_argument("--reckoning", choices=tuple(PASCHA_FUNCTIONS), default="gregorian",
+                        help="Pascha computus (default: gregorian, as in the calendars).")
+    args = parser.parse_args(argv)
+
+    with open(args.readings, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    start = time.perf_counter()
+    validator = validate_rows(rows, args.reckoning)
+    elapsed = time.perf_counter() - start
+
+    if args.update_baseline:
+        save_baseline(args.baseline, validator)
+        print(f"Saved {len(validator.anomalies())} known anomalies to {args.baseline}")
+        return 0
+
+    baseline_keys = load_baseline(args.baseline)
+    print(format_validation_report(validator, baseline_keys))
+    print(f"Checked in {elapsed * 1000:.1f} ms")
+    return 1 if validator.new_anomalies(baseline_keys) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())